@@ -1,7 +1,11 @@
+from datetime import datetime
+from typing import Annotated, Literal
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
-from fastapi.responses import ORJSONResponse
+from fastapi import Depends, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from app.core.analytics import Category, Counter
 from app.core.auth import (
     AdminAuthDeps,
     GitHubOAuthDeps,
@@ -9,13 +13,26 @@ from app.core.auth import (
     PasswordOAuthDeps,
 )
 from app.core.container import Container
-from app.core.router import CoreAPIRouter
-from app.schemas.jmy import JmyCompanyOut, JmyCompanyRequest
+from app.core.router import CoreAPIRouter, use_pool
+from app.schemas.jmy import (
+    JmyAggregateOut,
+    JmyCompactionOut,
+    JmyCompanyOut,
+    JmyCompanyRequest,
+    JmyGrowthOut,
+    JmyImportOut,
+    JmySearchOut,
+    JmySeriesOut,
+    JmySnapshotOut,
+    JmySummaryOut,
+)
 from app.services.jmy import JmyService
+from app.utils.streaming import csv_rows, ndjson_rows
 
 router = CoreAPIRouter(
     prefix="/jmy",
     tags=["admin"],
+    pool="admin",
     dependencies=[AdminAuthDeps, PasswordOAuthDeps, GoogleOAuthDeps, GitHubOAuthDeps],
 )
 
@@ -36,18 +53,193 @@ async def create_jmy(
     return await service.create(schema)
 
 
-# TODO: 회사 명을 통해 데이터 조회
-# @router.get(
-#     "",
-#     response_model=JmyCompanyOut,
-#     response_class=ORJSONResponse,
-#     status_code=status.HTTP_200_OK,
-#     summary="",
-#     description="",
-# )
-# @inject
-# async def get_jmy(
-#     name: str,
-#     service: JmyService = Depends(Provide[Container.jmy_service]),
-# ):
-#     return await service.get_by_id(name)
+@router.get(
+    "/search",
+    response_model=list[JmySearchOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Fuzzy search companies by name, research field or address",
+    description="- Ranked by an in-process trigram + prefix index; no `LIKE '%...%'` scan.</br>\n"
+    "- Matches below the similarity threshold are dropped.",
+)
+@inject
+async def search_jmy(
+    q: Annotated[str, Query(min_length=1, max_length=255)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.search(query=q, limit=limit)
+
+
+@router.get(
+    "/series",
+    response_model=JmySeriesOut,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Query a company's time series aggregated by month, quarter or year",
+    description="- Select the company by `name` or `id`.</br>\n"
+    "- `from` (inclusive) / `to` (exclusive) bound the window; both are optional.</br>\n"
+    "- `*_assigned` / `*_new` are summed per bucket, `*_old` is the last value in the bucket.",
+)
+@inject
+async def get_jmy_series(
+    *,
+    name: str | None = None,
+    id: int | None = None,
+    start: Annotated[datetime | None, Query(alias="from")] = None,
+    end: Annotated[datetime | None, Query(alias="to")] = None,
+    bucket: Literal["month", "quarter", "year"] = "month",
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.get_series(
+        bucket=bucket, id=id, name=name, start=start, end=end
+    )
+
+
+@router.get(
+    "/summary",
+    response_model=list[JmySummaryOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Per-location / per-industry totals by date from the summary table",
+    description="- `dimension` is `location` (지방청) or `type` (업종); `key` narrows it to a single group.</br>\n"
+    "- Served from `jmy_summary`, which is maintained on every write; rebuild it with `make summary`.",
+)
+@inject
+async def get_jmy_summary(
+    *,
+    dimension: Literal["location", "type"] = "location",
+    key: str | None = None,
+    start: Annotated[datetime | None, Query(alias="from")] = None,
+    end: Annotated[datetime | None, Query(alias="to")] = None,
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.get_summary(dimension=dimension, key=key, start=start, end=end)
+
+
+@router.get(
+    "/snapshot",
+    response_model=list[JmySnapshotOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Latest time-series point of every company",
+    description="- Served from `jmy_snapshot`, which is maintained on every write.",
+)
+@inject
+async def get_jmy_snapshots(
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.get_snapshots()
+
+
+@router.get(
+    "/analytics/aggregate",
+    response_model=list[JmyAggregateOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Monthly totals across all companies, grouped by a company category",
+    description="- Computed on the in-memory columnar store (refreshed incrementally after writes).</br>\n"
+    "- `by` groups by `location`, `type_` or `size`; omit it for a single total.</br>\n"
+    "- `window` > 1 returns a trailing moving average over that many months.",
+)
+@inject
+async def get_jmy_aggregate(
+    counter: Counter = "a_assigned",
+    by: Category | None = None,
+    window: Annotated[int, Query(ge=1, le=120)] = 1,
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.get_aggregate(counter=counter, by=by, window=window)
+
+
+@router.get(
+    "/analytics/top",
+    response_model=list[JmyGrowthOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Top-N companies by growth of a counter",
+    description="- Growth is the last minus the first point of each company within `[from, to)` (monthly resolution).",
+)
+@inject
+async def get_jmy_top_growth(
+    *,
+    counter: Counter = "a_old",
+    n: Annotated[int, Query(ge=1, le=1000)] = 10,
+    start: Annotated[datetime | None, Query(alias="from")] = None,
+    end: Annotated[datetime | None, Query(alias="to")] = None,
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.get_top_growth(counter=counter, n=n, start=start, end=end)
+
+
+@router.post(
+    "/compact",
+    dependencies=[use_pool("batch")],
+    response_model=JmyCompactionOut,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Roll up time-series points older than the horizon into monthly or yearly rows",
+    description="- Defaults to `JMY_COMPACTION_BUCKET` / `JMY_COMPACTION_HORIZON_DAYS`; also available as `make compact`.</br>\n"
+    "- Commits every `JMY_COMPACTION_BATCH_SIZE` companies and resumes from the recorded watermark.",
+)
+@inject
+async def compact_jmy(
+    bucket: Literal["month", "year"] | None = None,
+    horizon_days: Annotated[int | None, Query(ge=1)] = None,
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    return await service.compact(bucket=bucket, horizon_days=horizon_days)
+
+
+@router.get(
+    "/export",
+    dependencies=[use_pool("batch")],
+    response_model=None,
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream the flat company x time-series dataset as CSV or Arrow IPC",
+    description="- One row per time-series point (companies without points appear once with empty point columns).</br>\n"
+    "- `csv`: header + rows, importable through `/import`.</br>\n"
+    "- `arrow`: Arrow IPC stream (requires the `arrow` extra).",
+)
+@inject
+async def export_jmy(
+    format: Literal["csv", "arrow"] = "csv",
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    if format == "csv":
+        return StreamingResponse(
+            service.export(format),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="jmy.csv"'},
+        )
+    return StreamingResponse(
+        service.export(format),
+        media_type="application/vnd.apache.arrow.stream",
+        headers={"Content-Disposition": 'attachment; filename="jmy.arrows"'},
+    )
+
+
+@router.post(
+    "/import",
+    dependencies=[use_pool("batch")],
+    response_model=list[JmyImportOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk import Jmy data from a CSV or NDJSON upload",
+    description="- Send the raw file as the request body; it is parsed while streaming.</br>\n"
+    "- CSV header / NDJSON keys must match the `JmyCompanyRequest` fields.</br>\n"
+    "- Each chunk is committed separately and reported in the response.</br>\n"
+    "- On an invalid row the 400 response `data` holds its `row` number and the chunks already `committed`.",
+)
+@inject
+async def import_jmy(
+    request: Request,
+    format: Literal["csv", "ndjson"] = "csv",
+    service: JmyService = Depends(Provide[Container.jmy_service]),
+):
+    if format == "csv":
+        rows = csv_rows(request.stream())
+    else:
+        rows = ndjson_rows(request.stream())
+    return await service.import_rows(rows)
@@ -0,0 +1,65 @@
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Pool, QueuePool
+
+from app.core.auth import (
+    AdminAuthDeps,
+    GitHubOAuthDeps,
+    GoogleOAuthDeps,
+    PasswordOAuthDeps,
+)
+from app.core.cache import principal_cache
+from app.core.database import database
+from app.core.router import CoreAPIRouter
+from app.schemas.metrics import (
+    CacheMetrics,
+    CompiledCacheMetrics,
+    Metrics,
+    PoolMetrics,
+)
+
+router = CoreAPIRouter(
+    prefix="/metrics",
+    tags=["admin"],
+    pool="admin",
+    dependencies=[AdminAuthDeps, PasswordOAuthDeps, GoogleOAuthDeps, GitHubOAuthDeps],
+)
+
+
+@router.get(
+    "",
+    response_model=Metrics,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="In-process runtime metrics",
+    description="- Returns cache counters of the current worker process.</br>\n"
+    "- `compiled_cache`: SQLAlchemy compiled statement cache lookups per execution.</br>\n"
+    "- `pools`: connection occupancy per workload pool (`auth`, `user`, `admin`, `batch`) and replica.",
+)
+async def get_metrics():
+    return Metrics(
+        principal_cache=CacheMetrics(
+            size=len(principal_cache),
+            maxsize=principal_cache.maxsize,
+            hits=principal_cache.hits,
+            misses=principal_cache.misses,
+        ),
+        compiled_cache=CompiledCacheMetrics(
+            hits=database.compiled_cache.hits,
+            misses=database.compiled_cache.misses,
+            uncached=database.compiled_cache.uncached,
+        ),
+        pools={name: _pool(pool) for name, pool in database.pools().items()},
+    )
+
+
+def _pool(pool: Pool) -> PoolMetrics:
+    if isinstance(pool, QueuePool):
+        return PoolMetrics(
+            type=type(pool).__name__,
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            # NOTE: QueuePool.overflow()는 pool_size 미만이면 음수
+            overflow=max(pool.overflow(), 0),
+        )
+    return PoolMetrics(type=type(pool).__name__)
@@ -1,6 +1,8 @@
+from typing import Annotated, Literal
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
-from fastapi.responses import ORJSONResponse
+from fastapi import Body, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.core.auth import (
     AdminAuthDeps,
@@ -8,15 +10,23 @@ from app.core.auth import (
     GoogleOAuthDeps,
     PasswordOAuthDeps,
 )
+from app.core.configs import configs
 from app.core.container import Container
 from app.core.router import CoreAPIRouter
-from app.schemas.users import UserOut, UserPasswordAdminRequest, UserRequest
+from app.schemas.users import (
+    UserBulkRequest,
+    UserOut,
+    UserPasswordAdminRequest,
+    UserRequest,
+)
 from app.services.auth import AuthService
 from app.services.users import UserService
+from app.utils.streaming import json_array, ndjson
 
 router = CoreAPIRouter(
     prefix="/user",
     tags=["admin"],
+    pool="admin",
     dependencies=[AdminAuthDeps, PasswordOAuthDeps, GoogleOAuthDeps, GitHubOAuthDeps],
 )
 
@@ -27,13 +37,66 @@ router = CoreAPIRouter(
     response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="",
-    description="",
+    description="- Keyset pagination on `id`.</br>\n"
+    "- Pass the `X-Next-Cursor` response header as `after` to fetch the next page.",
 )
 @inject
 async def get_users(
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    after: int | None = None,
+    service: UserService = Depends(Provide[Container.user_service]),
+):
+    users, cursor = await service.get_page(limit=limit, after=after)
+    headers = {}
+    if cursor is not None:
+        headers["X-Next-Cursor"] = str(cursor)
+    return users, headers
+
+
+@router.post(
+    "/bulk",
+    response_model=list[UserOut],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="",
+    description="- Register password users (`USER` role) in bulk; up to `USER_BULK_MAX_SIZE` per request.</br>\n"
+    "- Rows whose email or name already exists are skipped.</br>\n"
+    "- Indices of skipped rows are returned in the `X-Conflicts` response header.",
+)
+@inject
+async def create_users(
+    schemas: Annotated[
+        list[UserBulkRequest], Body(max_length=configs.USER_BULK_MAX_SIZE)
+    ],
+    service: AuthService = Depends(Provide[Container.auth_service]),
+):
+    users, conflicts = await service.register_many(schemas)
+    headers = {}
+    if conflicts:
+        headers["X-Conflicts"] = ",".join(map(str, conflicts))
+    return users, headers
+
+
+@router.get(
+    "/stream",
+    response_model=None,
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="",
+    description="- Stream every user as NDJSON (`ndjson`) or a chunked JSON array (`json`).",
+)
+@inject
+async def stream_users(
+    format: Literal["ndjson", "json"] = "ndjson",
     service: UserService = Depends(Provide[Container.user_service]),
 ):
-    return await service.get_all()
+    if format == "ndjson":
+        return StreamingResponse(
+            ndjson(service.stream_all()), media_type="application/x-ndjson"
+        )
+    return StreamingResponse(
+        json_array(service.stream_all()), media_type="application/json"
+    )
 
 
 @router.get(
@@ -49,7 +112,7 @@ async def get_user(
     id: int,
     service: UserService = Depends(Provide[Container.user_service]),
 ):
-    return await service.get_by_id(id=id)
+    return await service.get_by_id(id=id, core=True)
 
 
 @router.put(
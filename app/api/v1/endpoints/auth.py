@@ -26,7 +26,7 @@ from app.schemas.auth import (
 from app.schemas.users import UserOut, UserResponse
 from app.services.auth import AuthService
 
-router = CoreAPIRouter(prefix="/auth", tags=["auth"])
+router = CoreAPIRouter(prefix="/auth", tags=["auth"], pool="auth")
 
 
 @router.post(
@@ -16,7 +16,7 @@ from app.schemas.users import UserOut, UserPasswordRequest, UserRequest, UserRes
 from app.services.auth import AuthService
 from app.services.users import UserService
 
-router = CoreAPIRouter(prefix="/user", tags=["user"])
+router = CoreAPIRouter(prefix="/user", tags=["user"], pool="user")
 
 
 @router.put(
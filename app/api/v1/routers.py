@@ -2,12 +2,14 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import auth, shields, users
 from app.api.v1.endpoints.admin import jmy as admin_jmy
+from app.api.v1.endpoints.admin import metrics as admin_metrics
 from app.api.v1.endpoints.admin import users as admin_users
 
 routers = APIRouter(prefix="/v1", tags=["v1"])
 _routers = [auth.router, users.router, shields.router] + [
     admin_users.router,
     admin_jmy.router,
+    admin_metrics.router,
 ]
 
 for _router in _routers:
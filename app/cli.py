@@ -0,0 +1,49 @@
+"""
+Management commands.
+
+    python -m app.cli rebuild-jmy-summary
+    python -m app.cli compact-jmy
+"""
+
+import argparse
+import asyncio
+
+from loguru import logger
+
+from app.core.container import Container
+from app.core.database import database
+
+
+async def rebuild_jmy_summary() -> None:
+    context = database.context.set("batch")
+    try:
+        summaries, snapshots = await Container().jmy_service().rebuild_summary()
+        logger.info(f"Rebuilt jmy_summary ({summaries}) / jmy_snapshot ({snapshots})")
+    finally:
+        await database.remove()
+        database.context.reset(context)
+        await database.dispose()
+
+
+async def compact_jmy() -> None:
+    context = database.context.set("batch")
+    try:
+        await Container().jmy_service().compact()
+    finally:
+        await database.remove()
+        database.context.reset(context)
+        await database.dispose()
+
+
+COMMANDS = {"rebuild-jmy-summary": rebuild_jmy_summary, "compact-jmy": compact_jmy}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    parser.add_argument("command", choices=COMMANDS)
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Literal, Sequence
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.configs import configs
+from app.core.database import database
+from app.models.jmy import COUNTERS, JmyCompany, JmyTimeSeries
+
+CATEGORIES = ("location", "type_", "size")
+# NOTE: DB 시각 해상도 / 늦게 commit된 transaction / read replica lag을 고려하여 watermark 이전 구간도 다시 읽는다. (key 기준 덮어쓰기라 중복 반영되지 않음)
+OVERLAP = timedelta(seconds=60)
+
+Counter = Literal["b_assigned", "b_new", "b_old", "a_assigned", "a_new", "a_old"]
+Category = Literal["location", "type_", "size"]
+
+
+class JmyFrame:  # pylint: disable=too-many-instance-attributes
+    """
+    ``jmy_time_series``의 ``(company_id, date)``마다 company index, date (``configs.TZ`` 기준 wall time), 6개 counter를 NumPy array로 유지하고,
+    company의 ``location`` / ``type_`` / ``size``는 categorical code로 저장한다.
+    """
+
+    def __init__(self) -> None:
+        self.company_ids: dict[int, int] = {}
+        self.names: list[str] = []
+        self.labels: dict[str, list[str]] = {category: [] for category in CATEGORIES}
+        self.label_codes: dict[str, dict[str, int]] = {
+            category: {} for category in CATEGORIES
+        }
+        self.codes: dict[str, np.ndarray] = {
+            category: np.empty(0, dtype=np.int32) for category in CATEGORIES
+        }
+        self.rows: dict[tuple[int, datetime], int] = {}
+        self.company = np.empty(0, dtype=np.int32)
+        self.dates = np.empty(0, dtype="datetime64[us]")
+        self.values = np.empty((0, len(COUNTERS)), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _code(self, category: str, label: str) -> int:
+        label_codes = self.label_codes[category]
+        code = label_codes.get(label)
+        if code is None:
+            code = label_codes[label] = len(self.labels[category])
+            self.labels[category].append(label)
+        return code
+
+    def _months(self) -> np.ndarray:
+        """Point마다 월 index (``year * 12 + month - 1``)"""
+        return self.dates.astype("datetime64[M]").astype(np.int64) + 1970 * 12
+
+    def extend_companies(self, companies: Sequence[tuple]) -> None:
+        codes: dict[str, list[int]] = {category: [] for category in CATEGORIES}
+        for id, name, *categories, _ in companies:
+            index = self.company_ids.get(id)
+            if index is None:
+                index = self.company_ids[id] = len(self.names)
+                self.names.append(name)
+                for category, label in zip(CATEGORIES, categories):
+                    codes[category].append(self._code(category, label))
+                continue
+            self.names[index] = name
+            for category, label in zip(CATEGORIES, categories):
+                self.codes[category][index] = self._code(category, label)
+        for category in CATEGORIES:
+            self.codes[category] = np.concatenate(
+                [self.codes[category], np.array(codes[category], dtype=np.int32)]
+            )
+
+    def extend_points(self, points: Sequence[tuple]) -> list[tuple]:
+        """
+        ``(company_id, date)``가 같은 point는 덮어쓴다.
+
+        Returns:
+            ``extend_companies``로 아직 적재되지 않은 company의 point (적재하지 않음)
+        """
+        tz = configs.TZINFO
+        skipped: list[tuple] = []
+        company: list[int] = []
+        dates: list[datetime] = []
+        values: list[tuple[int, ...]] = []
+        for point in points:
+            company_id, date, *counters, _ = point
+            index = self.company_ids.get(company_id)
+            if index is None:
+                skipped.append(point)
+                continue
+            # NOTE: Timezone을 저장하지 않는 backend (SQLite 등)는 configs.TZ 기준 wall time
+            if date.tzinfo is not None:
+                date = date.astimezone(tz).replace(tzinfo=None)
+            key = (index, date)
+            row = self.rows.get(key)
+            if row is not None:
+                if row < len(self.dates):
+                    self.values[row] = counters
+                else:
+                    values[row - len(self.dates)] = tuple(counters)
+                continue
+            self.rows[key] = len(self.dates) + len(dates)
+            company.append(index)
+            dates.append(date)
+            values.append(tuple(counters))
+        if not dates:
+            return skipped
+        self.company = np.concatenate([self.company, np.array(company, dtype=np.int32)])
+        self.dates = np.concatenate(
+            [self.dates, np.array(dates, dtype="datetime64[us]")]
+        )
+        self.values = np.concatenate(
+            [self.values, np.array(values, dtype=np.int64).reshape(-1, len(COUNTERS))]
+        )
+        return skipped
+
+    def aggregate(
+        self, counter: Counter, by: Category | None = None, window: int = 1
+    ) -> tuple[list[datetime], list[str], np.ndarray]:
+        """
+        월별 (해당 월 모든 point의) ``counter`` 합계를 ``by`` category별로 집계한다. (``by``가 ``None``이면 전체)
+
+        Returns:
+            (월 목록, category labels, ``(len(labels), len(months))`` 합계 행렬; ``window`` > 1이면 trailing 이동 평균)
+        """
+        labels = self.labels[by] if by is not None else ["all"]
+        if len(self) == 0:
+            return [], labels, np.zeros((len(labels), 0))
+        month = self._months()
+        first = int(month.min())
+        span = int(month.max()) - first + 1
+        group = (
+            self.codes[by][self.company]
+            if by is not None
+            else np.zeros(len(self), dtype=np.int32)
+        )
+        totals = np.bincount(
+            group.astype(np.int64) * span + (month - first),
+            weights=self.values[:, COUNTERS.index(counter)],
+            minlength=len(labels) * span,
+        ).reshape(len(labels), span)
+        if 1 < window:
+            cumsum = np.cumsum(totals, axis=1)
+            cumsum[:, window:] = cumsum[:, window:] - cumsum[:, :-window]
+            totals = cumsum / np.minimum(np.arange(1, span + 1), window)
+        tz = configs.TZINFO
+        months = [
+            datetime(month // 12, month % 12 + 1, 1, tzinfo=tz)
+            for month in range(first, first + span)
+        ]
+        return months, labels, totals
+
+    def top(
+        self,
+        counter: Counter,
+        n: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[tuple[str, int, int]]:
+        """
+        ``[start, end)`` 구간 (월 단위)에서 ``counter``가 가장 많이 증가한 (date 기준 마지막 - 첫 point) company ``n``개
+
+        Returns:
+            (company name, 첫 point의 값, 마지막 point의 값)
+        """
+        month = self._months()
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= _month(start) <= month
+        if end is not None:
+            mask &= month < _month(end)
+        company = self.company[mask]
+        if len(company) == 0:
+            return []
+        dates = self.dates[mask].view(np.int64)
+        values = self.values[mask, COUNTERS.index(counter)]
+        order = np.lexsort((dates, company))
+        company, values = company[order], values[order]
+        firsts = np.flatnonzero(np.r_[True, company[1:] != company[:-1]])
+        lasts = np.r_[firsts[1:], len(company)] - 1
+        growth = values[lasts] - values[firsts]
+        n = min(n, len(growth))
+        indices = np.argpartition(-growth, n - 1)[:n]
+        indices = indices[np.argsort(-growth[indices], kind="stable")]
+        return [
+            (
+                self.names[company[firsts[index]]],
+                int(values[firsts[index]]),
+                int(values[lasts[index]]),
+            )
+            for index in indices
+        ]
+
+
+class JmyStore:
+    """
+    ``jmy_company`` / ``jmy_time_series``의 read-side columnar store.
+
+    Write 후 ``mark_stale``이 호출되거나 ``configs.JMY_STORE_REFRESH_INTERVAL``이 지나면 ``updated_at`` watermark 이후의 row만 다시 읽는다.
+    Worker process마다 독립적으로 유지되며, 삭제는 ``load``로 다시 적재해야 반영된다.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.frame = JmyFrame()
+        self.watermark: datetime | None = None
+        self.refreshed_at = 0.0
+        self.stale = True
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def mark_stale(self) -> None:
+        self.stale = True
+
+    async def load(self) -> None:
+        async with self.lock:
+            self.frame = JmyFrame()
+            self.watermark = None
+            await self._refresh()
+
+    async def refresh(self) -> None:
+        if (
+            not self.stale
+            and time.monotonic() - self.refreshed_at
+            < configs.JMY_STORE_REFRESH_INTERVAL
+        ):
+            return
+        async with self.lock:
+            await self._refresh()
+
+    async def _refresh(self) -> None:
+        start_time = time.perf_counter()
+        self.stale = False
+        self.refreshed_at = time.monotonic()
+        async with database.sessionmaker(info={"pool": "batch"}) as session:
+            stmt = select(
+                JmyCompany.id,
+                JmyCompany.name,
+                *(getattr(JmyCompany, category) for category in CATEGORIES),
+                JmyCompany.updated_at,
+            )
+            if self.watermark is not None:
+                stmt = stmt.where(JmyCompany.updated_at >= self.watermark - OVERLAP)
+            companies = (await session.execute(stmt)).tuples().all()
+            stmt = select(
+                JmyTimeSeries.company_id,
+                JmyTimeSeries.date,
+                *(getattr(JmyTimeSeries, counter) for counter in COUNTERS),
+                JmyTimeSeries.updated_at,
+            )
+            if self.watermark is not None:
+                stmt = stmt.where(JmyTimeSeries.updated_at >= self.watermark - OVERLAP)
+            points = (await session.execute(stmt)).tuples().all()
+        self.frame.extend_companies(companies)
+        # NOTE: 두 SELECT 사이에 commit된 company의 point는 다음 refresh에서 다시 읽는다.
+        skipped = self.frame.extend_points(points)
+        watermarks = [row[-1] for row in companies] + [row[-1] for row in points]
+        if self.watermark is not None:
+            watermarks.append(self.watermark)
+        self.watermark = max(watermarks, default=None)
+        if skipped:
+            self.watermark = min(row[-1] for row in skipped)
+            self.stale = True
+        logger.info(
+            f"[JmyStore] companies={len(companies)}, points={len(points)}, skipped={len(skipped)}, total={len(self)}, elapsed_time={time.perf_counter() - start_time:.3f}s"
+        )
+
+
+def _month(value: datetime) -> int:
+    tz = configs.TZINFO
+    value = value.replace(tzinfo=tz) if value.tzinfo is None else value.astimezone(tz)
+    return value.year * 12 + value.month - 1
+
+
+jmy_store = JmyStore()
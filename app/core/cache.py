@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from app.core.configs import configs
+from app.schemas.users import UserOut
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Worker process마다 독립적으로 유지되므로 다른 worker에서 발생한 변경은 TTL 만료 전까지 반영되지 않는다.
+
+    ``version``은 ``pop`` / ``clear``마다 증가하므로, 조회 전의 ``version``을 ``set``에 전달하면
+    조회와 ``set`` 사이에 무효화된 (이미 오래된) 값은 저장하지 않는다.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, key: K) -> V | None:
+        item = self.data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self.data[key]
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, version: int | None = None) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        if version is not None and version != self.version:
+            return
+        self.data[key] = (time.monotonic() + self.ttl, value)
+        self.data.move_to_end(key)
+        while self.maxsize < len(self.data):
+            self.data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self.version += 1
+        self.data.pop(key, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self.data.clear()
+
+
+# NOTE: user id -> 인증된 UserOut
+principal_cache = TTLCache[int, UserOut](
+    maxsize=configs.PRINCIPAL_CACHE_SIZE, ttl=configs.PRINCIPAL_CACHE_TTL
+)
@@ -2,7 +2,13 @@ from dependency_injector.containers import DeclarativeContainer, WiringConfigura
 from dependency_injector.providers import Factory
 
 from app.repositories.auth import AuthRepository
-from app.repositories.jmy import JmyRepository
+from app.repositories.jmy import (
+    JmyCompactionRepository,
+    JmyRepository,
+    JmySnapshotRepository,
+    JmySummaryRepository,
+    JmyTimeSeriesRepository,
+)
 from app.repositories.users import UserRepository
 from app.services.auth import AuthService, JwtService
 from app.services.jmy import JmyService
@@ -24,6 +30,10 @@ class Container(DeclarativeContainer):
     user_repository = Factory(UserRepository)
     auth_repository = Factory(AuthRepository)
     jmy_repository = Factory(JmyRepository)
+    jmy_time_series_repository = Factory(JmyTimeSeriesRepository)
+    jmy_summary_repository = Factory(JmySummaryRepository)
+    jmy_snapshot_repository = Factory(JmySnapshotRepository)
+    jmy_compaction_repository = Factory(JmyCompactionRepository)
 
     jwt_service = Factory(JwtService)
     crypt_service = Factory(CryptService)
@@ -35,4 +45,11 @@ class Container(DeclarativeContainer):
         jwt_service=jwt_service,
         crypt_service=crypt_service,
     )
-    jmy_service = Factory(JmyService, jmy_repository=jmy_repository)
+    jmy_service = Factory(
+        JmyService,
+        jmy_repository=jmy_repository,
+        jmy_time_series_repository=jmy_time_series_repository,
+        jmy_summary_repository=jmy_summary_repository,
+        jmy_snapshot_repository=jmy_snapshot_repository,
+        jmy_compaction_repository=jmy_compaction_repository,
+    )
@@ -1,15 +1,29 @@
+import random
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from functools import wraps
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterator, Literal, get_args
 
 from loguru import logger
-from sqlalchemy import AsyncAdaptedQueuePool, StaticPool, select
+from sqlalchemy import (
+    AsyncAdaptedQueuePool,
+    Connection,
+    Engine,
+    StaticPool,
+    UpdateBase,
+    event,
+    make_url,
+    select,
+)
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
-    async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool as ConnectionPool
 
 from app.core.configs import ENVIRONMENT, configs
 from app.models.auth import OAuth
@@ -18,61 +32,221 @@ from app.models.enums import OAuthProvider, Role
 from app.models.users import User
 from app.services.security import CryptService
 
+Pool = Literal["auth", "user", "admin", "batch"]
+POOLS: tuple[Pool, ...] = get_args(Pool)
+# NOTE: Pool을 선언하지 않은 router, lifespan 외부의 session
+DEFAULT_POOL: Pool = "user"
+
+
+class SessionScope:
+    """
+    Request 단위 session holder.
+
+    ``AsyncSession``은 repository가 최초로 ``database.scoped_session()``을 호출할 때 생성되므로,
+    DB를 사용하지 않는 요청 (e.g. ``/shields/jmy``, ``/docs``, static files)은 session을 만들지 않는다.
+    """
+
+    def __init__(
+        self, sessionmaker: async_sessionmaker[AsyncSession], pool: Pool
+    ) -> None:
+        self.sessionmaker = sessionmaker
+        self.pool = pool
+        self.session: AsyncSession | None = None
+
+    def get(self) -> AsyncSession:
+        if self.session is None:
+            self.session = self.sessionmaker(info={"pool": self.pool})
+            logger.trace(f"[Session Start]\tID: {id(self.session)}")
+        return self.session
+
+    def use(self, pool: Pool) -> None:
+        """이미 생성된 session은 이후 statement부터 ``pool``을 사용한다."""
+        self.pool = pool
+        if self.session is not None:
+            self.session.info["pool"] = pool
+
+    async def close(self) -> None:
+        if self.session is None:
+            return
+        session, self.session = self.session, None
+        await session.close()
+        logger.trace(f"[Session End]\tID: {id(session)}")
+
 
 class Context:
-    def __init__(self) -> None:
-        self.context: ContextVar[int | None] = ContextVar(
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self.sessionmaker = sessionmaker
+        self.context: ContextVar[SessionScope | None] = ContextVar(
             "session_context", default=None
         )
 
-    def get(self) -> int:
-        session_id = self.context.get()
-        if not session_id:
+    def get(self) -> SessionScope:
+        scope = self.context.get()
+        if scope is None:
             raise ValueError("Currently no session is available.")
-        return session_id
+        return scope
 
-    def set(self, session_id: int) -> Token:
-        return self.context.set(session_id)
+    def set(self, pool: Pool = DEFAULT_POOL) -> Token:
+        return self.context.set(SessionScope(self.sessionmaker, pool))
 
     def reset(self, context: Token) -> None:
         self.context.reset(context)
 
 
-class Database:
+class CompiledCacheStats:
+    """
+    Engine의 compiled statement cache (``query_cache_size``) 조회 결과 counter.
+
+    ``uncached``: cache key를 만들 수 없는 statement (e.g. ``text``, DDL)
+    """
+
     def __init__(self) -> None:
-        self.context = Context()
-        if configs.DB_TYPE == "sqlite":
-            self.engine = create_async_engine(
-                url=configs.DATABASE_URI,
-                echo=configs.DB_ECHO,
-                echo_pool=configs.DB_ECHO,
-                poolclass=StaticPool,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def record(self, **kwargs: Any) -> None:
+        cache_hit = kwargs["result"].context.cache_hit
+        if cache_hit is CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CACHE_MISS:
+            self.misses += 1
         else:
-            self.engine = create_async_engine(
-                url=configs.DATABASE_URI,
-                echo=configs.DB_ECHO,
-                echo_pool=configs.DB_ECHO,
-                max_overflow=10,
-                poolclass=AsyncAdaptedQueuePool,
-                pool_pre_ping=True,
-                pool_size=5,
-                pool_recycle=3600,
-                pool_timeout=30.0,
-            )
+            self.uncached += 1
+
+
+class RoutingSession(Session):
+    """
+    ``info["pool"]`` (workload)의 engine으로 routing하고, ``configs.DB_REPLICA_URIS``가 설정되면 read는 replica, write는 primary로 routing하는 session.
+
+    - ``@database.transactional`` 내부, flush, ``INSERT`` / ``UPDATE`` / ``DELETE``는 primary
+    - Primary에 write한 session (= request)은 이후 read도 primary에 고정한다. (read-your-writes)
+    - Replica는 session마다 하나를 선택하여 같은 request의 read는 같은 replica를 조회한다.
+    """
+
+    def get_bind(  # type: ignore[override]
+        self, mapper=None, clause=None, **kwargs
+    ) -> Engine | Connection:
+        engines: dict[Pool, AsyncEngine] | None = self.info.get("engines")
+        if engines is None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        pool: Pool = self.info.get("pool", DEFAULT_POOL)
+        replicas: list[AsyncEngine] = self.info["replicas"][pool]
+        if not replicas or self.info.get("transactional") or self.info.get("primary"):
+            return engines[pool].sync_engine
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["primary"] = True
+            return engines[pool].sync_engine
+        if "replica" not in self.info:
+            self.info["replica"] = random.randrange(len(replicas))
+        return replicas[self.info["replica"]].sync_engine
+
+
+def _create_engines(url: str) -> dict[Pool, AsyncEngine]:
+    """Pool 이름별 engine; SQLite는 하나의 connection (``StaticPool``)을 모든 pool이 공유한다."""
+    if make_url(url).get_backend_name() == "sqlite":
+        engine = create_async_engine(
+            url=url,
+            echo=configs.DB_ECHO,
+            echo_pool=configs.DB_ECHO,
+            poolclass=StaticPool,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+        return dict.fromkeys(POOLS, engine)
+    engines: dict[Pool, AsyncEngine] = {}
+    for pool in POOLS:
+        pool_size, max_overflow = configs.DB_POOLS[pool]
+        engines[pool] = create_async_engine(
+            url=url,
+            echo=configs.DB_ECHO,
+            echo_pool=configs.DB_ECHO,
+            max_overflow=max_overflow,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_pre_ping=True,
+            pool_size=pool_size,
+            pool_recycle=3600,
+            pool_timeout=configs.DB_POOL_TIMEOUT,
+        )
+    return engines
+
+
+class Database:
+    def __init__(self) -> None:
+        self.engines = _create_engines(configs.DATABASE_URI)
+        self.engine = self.engines[DEFAULT_POOL]
+        # NOTE: Replica마다 독립적인 engine (pool)
+        replicas = [_create_engines(uri) for uri in configs.DB_REPLICA_URIS]
+        self.replicas: dict[Pool, list[AsyncEngine]] = {
+            pool: [engines[pool] for engines in replicas] for pool in POOLS
+        }
         self.sessionmaker = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
+            info={"engines": self.engines, "replicas": self.replicas},
         )
-        self.scoped_session = async_scoped_session(
-            session_factory=self.sessionmaker,
-            scopefunc=self.context.get,
-        )
+        self.context = Context(self.sessionmaker)
+        self.compiled_cache = CompiledCacheStats()
+        for engine in self._engines():
+            event.listen(
+                engine.sync_engine,
+                "after_execute",
+                self.compiled_cache.record,
+                named=True,
+            )
+
+    def _engines(self) -> list[AsyncEngine]:
+        engines = [*self.engines.values()]
+        for replicas in self.replicas.values():
+            engines.extend(replicas)
+        return list(dict.fromkeys(engines))
+
+    def scoped_session(self) -> AsyncSession:
+        return self.context.get().get()
+
+    def use(self, pool: Pool) -> None:
+        """현재 request의 connection pool (bulkhead)"""
+        self.context.get().use(pool)
+
+    @contextmanager
+    def primary(self) -> Iterator[AsyncSession]:
+        """Block 내부의 read는 replica lag이 없는 primary에서 조회한다. (e.g. cache를 채우는 read)"""
+        session = self.scoped_session()
+        primary = session.info.get("primary", False)
+        session.info["primary"] = True
+        try:
+            yield session
+        finally:
+            session.info["primary"] = primary
+
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """``@transactional`` 내부라면 최외곽 transaction의 commit 후 (rollback 시 실행하지 않음), 아니면 즉시 ``callback``을 실행한다."""
+        session = self.scoped_session()
+        if not session.info.get("transactional"):
+            callback()
+            return
+        session.info.setdefault("after_commit", []).append(callback)
+
+    def pools(self) -> dict[str, ConnectionPool]:
+        """Pool 이름별 connection pool (replica는 ``{pool}@replica{index}``)"""
+        pools: dict[str, ConnectionPool] = {
+            pool: engine.pool for pool, engine in self.engines.items()
+        }
+        for pool, replicas in self.replicas.items():
+            for index, engine in enumerate(replicas):
+                pools[f"{pool}@replica{index}"] = engine.pool
+        return pools
+
+    async def remove(self) -> None:
+        await self.context.get().close()
+
+    async def dispose(self) -> None:
+        for engine in self._engines():
+            await engine.dispose()
 
     async def create_all(self) -> None:
         logger.warning("Create database")
@@ -81,6 +255,7 @@ class Database:
                 await conn.run_sync(BaseModel.metadata.drop_all)
             await conn.run_sync(BaseModel.metadata.create_all)
         async with self.sessionmaker() as session:
+            session.info["primary"] = True
             stmt = select(User).where(User.role == Role.ADMIN)
             result = await session.execute(stmt)
             user = result.scalar_one_or_none()
@@ -96,7 +271,7 @@ class Database:
                 oauth=[
                     OAuth(
                         provider=OAuthProvider.PASSWORD,
-                        password=crypt_service.hash(configs.ADMIN_PASSWORD),
+                        password=await crypt_service.hash_async(configs.ADMIN_PASSWORD),
                     )
                 ],
             )
@@ -108,11 +283,24 @@ class Database:
         async def wrapper(*args, **kwargs):
             try:
                 session = self.scoped_session()
-                if session.in_transaction():
-                    logger.trace(f"[Session in transaction]\tID: {self.context.get()}")
+                if session.info.get("transactional"):
+                    logger.trace(f"[Session in transaction]\tID: {id(session)}")
                     return await func(*args, **kwargs)
-                async with session.begin():
-                    response = await func(*args, **kwargs)
+                if session.in_transaction():
+                    # NOTE: transactional 외부의 read (e.g. AuthService.verify)로
+                    # autobegin된 transaction은 write 전에 (pending 변경과 함께) commit하여 종료
+                    await session.commit()
+                session.info["transactional"] = True
+                try:
+                    async with session.begin():
+                        response = await func(*args, **kwargs)
+                finally:
+                    session.info["transactional"] = False
+                    # NOTE: 이후 read는 replica lag과 무관하게 write 결과를 조회하도록 primary에 고정
+                    session.info["primary"] = True
+                    callbacks = session.info.pop("after_commit", [])
+                for callback in callbacks:
+                    callback()
                 return response
             except Exception as error:
                 raise error
@@ -0,0 +1,45 @@
+import httpx
+
+from app.core.configs import configs
+
+
+class HttpClient:
+    """
+    Provider마다 하나씩 유지하는 pooled ``httpx.AsyncClient``.
+
+    ``app.core.lifespan.lifespan``에서 생성 및 종료되며, lifespan 밖 (e.g. service test)에서는 최초 사용 시 생성된다.
+    Test에서는 ``startup(transport=httpx.MockTransport(...))``로 local stand-in provider를 주입할 수 있다.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.client: httpx.AsyncClient | None = None
+
+    def startup(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                configs.HTTP_TIMEOUT, connect=configs.HTTP_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=configs.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=configs.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=configs.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=configs.HTTP2,
+            transport=transport,
+        )
+
+    async def shutdown(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def __call__(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.startup()
+        assert self.client is not None
+        return self.client
+
+
+google_client = HttpClient("google")
+github_client = HttpClient("github")
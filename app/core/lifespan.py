@@ -7,9 +7,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from loguru import logger
 
-from app.core.configs import ENVIRONMENT, configs
+from app.core.analytics import jmy_store
+from app.core.configs import configs
 from app.core.container import Container
 from app.core.database import database
+from app.core.http import github_client, google_client
+from app.services.security import crypt_executor
 from app.utils.logging import remove_handler
 
 
@@ -18,12 +21,9 @@ async def lifespan(app: FastAPI):  # pylint: disable=unused-argument
     remove_handler(logging.getLogger("uvicorn.access"))
     logging.getLogger("uvicorn.error").setLevel(level=logging.CRITICAL)
     logger.remove()
-    level = 0
-    if configs.ENV == ENVIRONMENT.PROD:
-        level = 20
     logger.add(
         sys.stderr,
-        level=level,
+        level=configs.LOG_LEVEL,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> <bg #800a0a>"
         + time.tzname[0]
         + "</bg #800a0a> | <level>{level: <8}</level> | <fg #800a0a>{name}</fg #800a0a>:<fg #800a0a>{function}</fg #800a0a>:<fg #800a0a>{line}</fg #800a0a> - <level>{message}</level>",
@@ -36,8 +36,20 @@ async def lifespan(app: FastAPI):  # pylint: disable=unused-argument
     logger.info(f"Event loop: {asyncio.get_event_loop().__class__}")
     if configs.DB_TABLE_CREATE:
         await database.create_all()
+    await jmy_store.load()
     app.container = Container()  # type: ignore[attr-defined]
+    context = database.context.set("batch")
+    try:
+        await app.container.jmy_service().load_search_index()  # type: ignore[attr-defined]
+    finally:
+        await database.remove()
+        database.context.reset(context)
+    google_client.startup()
+    github_client.startup()
 
     yield
 
-    await database.engine.dispose()
+    await google_client.shutdown()
+    await github_client.shutdown()
+    await database.dispose()
+    crypt_executor.shutdown()
@@ -1,9 +1,10 @@
 import time
 
-from fastapi import Request, Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import URL, Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.configs import configs
 from app.core.database import database
 from app.utils.logging import (
     ANSI_BG_COLOR,
@@ -13,96 +14,168 @@ from app.utils.logging import (
     osc_format,
 )
 
+TRACE_LEVEL = 5
+PROCESSING = ansi_format("[Status: Processing...]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    def info(
-        self,
-        *,
-        ip: str,
-        url: str,
-        method: str,
-        status: int | None = None,
-        elapsed_time: str | None = None,
-    ) -> None:
-        ip = osc_format(ip, href=f"https://db-ip.com/{ip}")
-        ip = ansi_format(
-            ip,
-            bg_color=ANSI_BG_COLOR.LIGHT_BLACK,
-            style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
-        )
-        ip = f"[IP: {ip}]"
-        url = ansi_format(f"[URL: {url}]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK)
-        method = ansi_format(f"[Method: {method}]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK)
-        if status and elapsed_time:
-            if status < 400:
-                _status = ansi_format(
-                    status,
-                    bg_color=ANSI_BG_COLOR.LIGHT_BLACK,
-                    style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
-                )
-            elif status < 500:
-                _status = ansi_format(
-                    status,
-                    fg_color=ANSI_FG_COLOR.BLACK,
-                    bg_color=ANSI_BG_COLOR.LIGHT_YELLOW,
-                    style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
-                )
-            else:
-                _status = ansi_format(
-                    status,
-                    bg_color=ANSI_BG_COLOR.RED,
-                    style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
-                )
-            elapsed_time = ansi_format(
-                elapsed_time,
+
+class AccessLog:
+    """Access log line builder; ``prefix`` (IP, URL, method) is formatted at most once per request."""
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self._prefix: str | None = None
+
+    def _ip(self) -> str:
+        headers = Headers(scope=self.scope)
+        if headers.get("x-real-ip"):
+            return headers["x-real-ip"]
+        if headers.get("x-forwarded-for"):
+            return headers["x-forwarded-for"]
+        if self.scope.get("client"):
+            return self.scope["client"][0]
+        return "None"
+
+    @property
+    def prefix(self) -> str:
+        if self._prefix is None:
+            ip = self._ip()
+            ip = osc_format(ip, href=f"https://db-ip.com/{ip}")
+            ip = ansi_format(
+                ip,
                 bg_color=ANSI_BG_COLOR.LIGHT_BLACK,
                 style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
             )
-            _status = f"[Status: {_status} (Elapsed Time: {elapsed_time})]"
-        else:
+            url = ansi_format(
+                f"[URL: {URL(scope=self.scope)}]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK
+            )
+            method = ansi_format(
+                f"[Method: {self.scope['method']}]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK
+            )
+            self._prefix = f"[IP: {ip}] {url} {method}"
+        return self._prefix
+
+    def start(self) -> str:
+        return f"{self.prefix} {PROCESSING}"
+
+    def end(self, status: int, elapsed_ns: int) -> str:
+        if status < 400:
+            _status = ansi_format(
+                status,
+                bg_color=ANSI_BG_COLOR.LIGHT_BLACK,
+                style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
+            )
+        elif status < 500:
             _status = ansi_format(
-                "[Status: Processing...]", fg_color=ANSI_FG_COLOR.LIGHT_BLACK
+                status,
+                fg_color=ANSI_FG_COLOR.BLACK,
+                bg_color=ANSI_BG_COLOR.LIGHT_YELLOW,
+                style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
             )
-        logger.info(f"{ip} {url} {method} {_status}")
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if request.headers.get("x-real-ip"):
-            ip = request.headers.get("x-real-ip")
-        elif request.headers.get("x-forwarded-for"):
-            ip = request.headers.get("x-forwarded-for")
-        elif request.client:
-            ip = request.client.host
         else:
-            ip = "None"
-        self.info(ip=str(ip), url=str(request.url), method=request.method)
-        body = await request.body()
-        if body:
-            logger.trace(f"{body=}")
-        start_time = time.time()
-        response = await call_next(request)
-        end_time = time.time()
-        self.info(
-            ip=str(ip),
-            url=str(request.url),
-            method=request.method,
-            status=response.status_code,
-            elapsed_time=f"{end_time - start_time:.3f}s",
+            _status = ansi_format(
+                status,
+                bg_color=ANSI_BG_COLOR.RED,
+                style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
+            )
+        elapsed_time = ansi_format(
+            f"{elapsed_ns / 1e9:.3f}s",
+            bg_color=ANSI_BG_COLOR.LIGHT_BLACK,
+            style=[ANSI_STYLE.UNDERLINE, ANSI_STYLE.BOLD],
         )
-        return response
+        return f"{self.prefix} [Status: {_status} (Elapsed Time: {elapsed_time})]"
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI access log middleware.
+
+    Request body는 그대로 흘려보내며, ``log_level`` (sink level)이 TRACE 이하인 경우에만 최대 ``body_limit`` bytes를 복사해 기록한다.
+    Log message는 loguru의 ``lazy`` option으로 sink가 존재할 때만 생성된다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        body_limit: int = configs.LOG_BODY_LIMIT,
+        log_level: int = configs.LOG_LEVEL,
+    ) -> None:
+        self.app = app
+        self.body_limit = body_limit
+        # NOTE: lifespan에서 등록하는 sink와 같은 configs.LOG_LEVEL 기준으로 middleware 생성 시 1회 결정
+        self.trace = log_level <= TRACE_LEVEL
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        access_log = AccessLog(scope)
+        logger.opt(lazy=True).info("{}", access_log.start)
+        if self.trace:
+            receive = self._capture(receive)
+        status: int | None = None
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start_time = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, _send)
+        except Exception:
+            # NOTE: Response 시작 전 발생한 예외는 ServerErrorMiddleware가 500으로 응답
+            if status is None:
+                status = 500
+            raise
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_time
+            if status is not None:
+                logger.opt(lazy=True).info(
+                    "{}", lambda: access_log.end(status=status, elapsed_ns=elapsed_ns)
+                )
+
+    def _capture(self, receive: Receive) -> Receive:
+        body = bytearray()
+
+        async def _receive() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            if len(body) < self.body_limit:
+                body.extend(message.get("body", b"")[: self.body_limit - len(body)])
+            if not message.get("more_body", False) and body:
+                logger.trace(f"body={bytes(body)!r}")
+            return message
+
+        return _receive
+
+
+class SessionMiddleware:
+    """
+    Pure ASGI session scope middleware.
+
+    요청마다 ``SessionScope``를 context var에 bind하고, response가 시작되는 즉시 session을 반환한다.
+    Response 시작 이후 (e.g. streaming body, background task) DB를 사용하면 새로운 session이 생성되며 요청 종료 시 반환된다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        context = database.context.set()
+        session_scope = database.context.get()
 
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await session_scope.close()
+            await send(message)
 
-class SessionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        context = database.context.set(session_id=hash(request))
-        logger.trace(f"[Session Start]\tID: {database.context.get()}")
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, _send)
         finally:
-            await database.scoped_session.remove()
-            logger.trace(f"[Session End]\tID: {database.context.get()}")
+            await session_scope.close()
             database.context.reset(context=context)
-        return response
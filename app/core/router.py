@@ -1,11 +1,13 @@
 from functools import wraps
-from typing import Any, Callable, Coroutine, Type, TypeVar
+from typing import Any, Callable, Coroutine, Mapping, Sequence, Type, TypeVar
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response, params
+from fastapi.responses import JSONResponse
 from fastapi.types import DecoratedCallable
 from loguru import logger
 from pydantic import BaseModel
 
+from app.core.database import Pool, database
 from app.exceptions.router import RouterTypeError
 from app.schemas.base import BaseResponse
 from app.schemas.responses import APIResponse
@@ -13,7 +15,28 @@ from app.schemas.responses import APIResponse
 T = TypeVar("T", bound=BaseModel)
 
 
+def use_pool(pool: Pool) -> params.Depends:
+    """Request가 사용할 DB connection pool (bulkhead) 선언"""
+
+    async def dependency() -> None:
+        database.use(pool)
+
+    return Depends(dependency)
+
+
 class CoreAPIRouter(APIRouter):
+    def __init__(
+        self,
+        *args,
+        pool: Pool | None = None,
+        dependencies: Sequence[params.Depends] | None = None,
+        **kwargs,
+    ) -> None:
+        # NOTE: 인증 (e.g. AdminAuthDeps)의 조회도 router의 pool을 사용하도록 가장 먼저 실행
+        if pool is not None:
+            dependencies = [use_pool(pool), *(dependencies or [])]
+        super().__init__(*args, dependencies=dependencies, **kwargs)
+
     def api_route(  # type: ignore[override]
         self,
         path: str,
@@ -29,6 +52,14 @@ class CoreAPIRouter(APIRouter):
         def decorator(
             func: DecoratedCallable,
         ) -> Callable[..., Coroutine[Any, Any, Response]]:
+            # NOTE: 요청마다 generic class를 parametrize하지 않도록 route 등록 시 1회 생성
+            envelope: Type[APIResponse] = (
+                APIResponse[response_model]  # type: ignore[valid-type]
+                if response_model is not None
+                else APIResponse
+            )
+            rendered = _prerendered(response_class)
+
             @wraps(func)
             async def endpoint(*_args: tuple, **_kwargs: dict) -> Response:
                 response: Any = await func(*_args, **_kwargs)
@@ -39,29 +70,22 @@ class CoreAPIRouter(APIRouter):
                     # media_type: str | None = None,
                     # background: BackgroundTask | None = None,
                     content, headers = response
-                    return response_class(
-                        content=APIResponse[response_model]  # type: ignore[valid-type]
-                        .success(
-                            status=status_code,
-                            data=content,
-                        )
-                        .model_dump(mode="json"),
+                    return _render(
+                        envelope.success(status=status_code, data=content),
+                        response_class=rendered,
                         status_code=status_code,
                         headers=headers,
                     )
                 if isinstance(response, (BaseResponse, list)):
-                    return response_class(
-                        content=APIResponse[response_model]  # type: ignore[valid-type]
-                        .success(
-                            status=status_code,
-                            data=response,
-                        )
-                        .model_dump(mode="json"),
+                    return _render(
+                        envelope.success(status=status_code, data=response),
+                        response_class=rendered,
                         status_code=status_code,
                     )
                 if isinstance(response, BaseModel):
-                    return response_class(
-                        content=response.model_dump(mode="json"),
+                    return _render(
+                        response,
+                        response_class=rendered,
                         status_code=status_code,
                     )
                 logger.error(f"{type(response)=}, {response=}")
@@ -75,7 +99,7 @@ class CoreAPIRouter(APIRouter):
                 )
                 or issubclass(response_model, BaseResponse)
             ):
-                _response_model = APIResponse[response_model]  # type: ignore[valid-type]
+                _response_model = envelope
             elif response_model is None or issubclass(response_model, BaseModel):
                 _response_model = response_model
             else:
@@ -91,3 +115,30 @@ class CoreAPIRouter(APIRouter):
             return endpoint
 
         return decorator
+
+
+def _prerendered(response_class: Type[Response]) -> Type[Response]:
+    """``render``가 ``__pydantic_serializer__.to_json``의 bytes를 그대로 body로 사용하는 ``response_class``"""
+    if not issubclass(response_class, JSONResponse):
+        return response_class
+
+    class PreRendered(response_class):  # type: ignore[valid-type,misc]
+        def render(self, content: Any) -> bytes:
+            return content
+
+    PreRendered.__name__ = PreRendered.__qualname__ = response_class.__name__
+    return PreRendered
+
+
+def _render(
+    content: BaseModel,
+    response_class: Type[Response],
+    status_code: int,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """``model_dump(mode="json")`` → ``ORJSONResponse``의 2회 순회 대신 pydantic serializer로 bytes까지 한 번에 직렬화"""
+    return response_class(
+        content=content.__pydantic_serializer__.to_json(content),
+        status_code=status_code,
+        headers=headers,
+    )
@@ -36,6 +36,11 @@ class GitHubOAuthFailed(AuthException):
     message: str = "GitHub OAuth authentication failed."
 
 
+class CryptServiceBusy(AuthException):
+    status: int = status.HTTP_503_SERVICE_UNAVAILABLE
+    message: str = "Too many authentication requests. Please try again later."
+
+
 class NotAuthenticated(CoreException):
     status: int = status.HTTP_403_FORBIDDEN
     message: str = "Authentication required. Please log in."
@@ -46,6 +51,11 @@ class TokenDecodeError(AuthException):
     message: str = "Token decode error."
 
 
+class RefreshTokenRevoked(AuthException):
+    status: int = status.HTTP_401_UNAUTHORIZED
+    message: str = "Refresh token has been revoked. Please log in again."
+
+
 class TokenExpired(AuthException):
     status: int = status.HTTP_401_UNAUTHORIZED
     message: str = "Expired token."
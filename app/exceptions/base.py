@@ -1,10 +1,17 @@
 import abc
 
+from pydantic import BaseModel
+
 
 class CoreException(abc.ABC, Exception):
     status: int
     message: str
 
+    def __init__(self, data: BaseModel | None = None) -> None:
+        super().__init__()
+        # NOTE: 오류 응답의 data (e.g. 실패 전까지 반영된 결과)
+        self.data = data
+
     def __str__(self) -> str:
         return (
             f"[{self.__class__.__name__}] status={self.status}, message={self.message}"
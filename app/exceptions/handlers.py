@@ -23,8 +23,8 @@ async def core_exception_handler(
 ) -> ORJSONResponse:
     logger.exception(exc)
     return ORJSONResponse(
-        content=APIResponse.error(status=exc.status, message=repr(exc)).model_dump(
-            mode="json"
-        ),
+        content=APIResponse.error(
+            status=exc.status, message=repr(exc), data=exc.data
+        ).model_dump(mode="json"),
         status_code=exc.status,
     )
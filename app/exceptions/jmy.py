@@ -0,0 +1,21 @@
+from fastapi import status
+
+from app.exceptions.base import CoreException
+
+
+class JmyException(CoreException): ...
+
+
+class JmyImportInvalid(JmyException):
+    status: int = status.HTTP_400_BAD_REQUEST
+    message: str = "Invalid row in Jmy import data."
+
+
+class JmySeriesInvalid(JmyException):
+    status: int = status.HTTP_400_BAD_REQUEST
+    message: str = "Either company name or id is required."
+
+
+class JmyExportUnavailable(JmyException):
+    status: int = status.HTTP_501_NOT_IMPLEMENTED
+    message: str = "Arrow export requires the 'arrow' extra (pyarrow)."
@@ -1,7 +1,13 @@
 from app.models.auth import OAuth
 from app.models.base import BaseModel
 from app.models.enums import OAuthProvider, Role
-from app.models.jmy import JmyCompany, JmyTimeSeries
+from app.models.jmy import (
+    JmyCompaction,
+    JmyCompany,
+    JmySnapshot,
+    JmySummary,
+    JmyTimeSeries,
+)
 from app.models.users import User
 
 __all__ = [
@@ -12,4 +18,7 @@ __all__ = [
     "OAuthProvider",
     "JmyCompany",
     "JmyTimeSeries",
+    "JmySummary",
+    "JmySnapshot",
+    "JmyCompaction",
 ]
@@ -14,9 +14,7 @@ class OAuth(BaseModel):
     oauth_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     oauth_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
-    user = relationship("User", back_populates="oauth", lazy="noload")
-
-    eagers = ["user"]
+    user = relationship("User", back_populates="oauth", lazy="raise")
 
     __table_args__ = (
         UniqueConstraint("user_id", "provider", name="uq_oauth_user_provider"),
@@ -5,11 +5,15 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     String,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 
+# NOTE: jmy_time_series의 인원 counter columns
+COUNTERS = ("b_assigned", "b_new", "b_old", "a_assigned", "a_new", "a_old")
+
 
 class JmyCompany(BaseModel):
     __tablename__ = "jmy_company"
@@ -19,11 +23,11 @@ class JmyCompany(BaseModel):
     # 선정년도
     year: Mapped[int] = mapped_column(Integer, nullable=False)
     # 지방청
-    location: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     # 주소
     address: Mapped[str] = mapped_column(String(255), nullable=False)
     # 업종
-    type_: Mapped[str] = mapped_column("type", String(255), nullable=False)
+    type_: Mapped[str] = mapped_column("type", String(255), nullable=False, index=True)
     # 기업규모
     size: Mapped[str] = mapped_column(String(255), nullable=False)
     # 연구분야
@@ -33,11 +37,9 @@ class JmyCompany(BaseModel):
         "JmyTimeSeries",
         back_populates="company",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
-    eagers = ["time_series"]
-
 
 class JmyTimeSeries(BaseModel):
     __tablename__ = "jmy_time_series"
@@ -46,7 +48,9 @@ class JmyTimeSeries(BaseModel):
         ForeignKey("jmy_company.id"), nullable=False
     )
 
-    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
     # 보충역 배정인원
     b_assigned: Mapped[int] = mapped_column(Integer, nullable=False)
     # 보충역 편입인원
@@ -60,6 +64,63 @@ class JmyTimeSeries(BaseModel):
     # 현역 복무인원
     a_old: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    company = relationship("JmyCompany", back_populates="time_series", lazy="noload")
+    company = relationship("JmyCompany", back_populates="time_series", lazy="raise")
+
+    __table_args__ = (
+        UniqueConstraint("company_id", "date", name="uq_jmy_time_series_company_date"),
+    )
+
+
+class JmySummary(BaseModel):
+    """``(dimension, key, date)``별 ``jmy_time_series`` 합계 (``JmyService`` write와 같은 transaction에서 갱신)"""
+
+    __tablename__ = "jmy_summary"
+
+    # 집계 기준 (location: 지방청, type: 업종)
+    dimension: Mapped[str] = mapped_column(String(32), nullable=False)
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # 업체 수
+    companies: Mapped[int] = mapped_column(Integer, nullable=False)
+    b_assigned: Mapped[int] = mapped_column(Integer, nullable=False)
+    b_new: Mapped[int] = mapped_column(Integer, nullable=False)
+    b_old: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_assigned: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_new: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_old: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "dimension", "key", "date", name="uq_jmy_summary_dimension_key_date"
+        ),
+    )
+
+
+class JmySnapshot(BaseModel):
+    """업체별 가장 최근 ``jmy_time_series`` point"""
+
+    __tablename__ = "jmy_snapshot"
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("jmy_company.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    b_assigned: Mapped[int] = mapped_column(Integer, nullable=False)
+    b_new: Mapped[int] = mapped_column(Integer, nullable=False)
+    b_old: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_assigned: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_new: Mapped[int] = mapped_column(Integer, nullable=False)
+    a_old: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    company = relationship("JmyCompany", lazy="raise")
+
+
+class JmyCompaction(BaseModel):
+    """Bucket별 ``jmy_time_series`` compaction watermark (``watermark`` 이전 point는 roll-up 완료)"""
+
+    __tablename__ = "jmy_compaction"
 
-    eagers = ["company"]
+    # Roll-up 단위 (month / year)
+    bucket: Mapped[str] = mapped_column(String(16), nullable=False, unique=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -17,9 +17,7 @@ class User(BaseModel):
 
     # NOTE: one-to-many
     # WARN: Async DB session에서 명시적이지 않은 IO는 권장되지 않는다.
-    # lazy="noload"는 삭제될거 같은... (related: #38)
+    # 기본값은 lazy="raise"이며 repository 호출마다 loader plan (``loads``)으로 load 방식을 지정 (related: #38)
     oauth = relationship(
-        "OAuth", back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+        "OAuth", back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
-
-    eagers = ["oauth"]
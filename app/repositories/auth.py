@@ -1,9 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.core.database import database
 from app.models.auth import OAuth
 from app.models.enums import OAuthProvider
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Loads
 
 
 class AuthRepository(BaseRepository[OAuth]):
@@ -11,29 +11,35 @@ class AuthRepository(BaseRepository[OAuth]):
         super().__init__(model=OAuth)
 
     async def read_by_user_id_and_password(
-        self, user_id: int, eager: bool = False
+        self, user_id: int, loads: Loads | None = None
     ) -> OAuth | None:
-        stmt = select(self.model)
-        stmt = stmt.where(
-            self.model.user_id == user_id, self.model.provider == OAuthProvider.PASSWORD
+        stmt = self._template(
+            "by_user_id_and_password",
+            lambda: select(self.model).where(
+                self.model.user_id == bindparam("user_id"),
+                self.model.provider == OAuthProvider.PASSWORD,
+            ),
+            loads,
         )
-        if eager:
-            stmt = self._eager(stmt=stmt)
         session = database.scoped_session()
-        result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        result = await session.execute(stmt, {"user_id": user_id})
+        entity = result.unique().scalar_one_or_none()
         return entity
 
     async def read_by_oauth_id_and_provider(
-        self, oauth_id: str, provider: OAuthProvider, eager: bool = False
+        self, oauth_id: str, provider: OAuthProvider, loads: Loads | None = None
     ) -> OAuth | None:
-        stmt = select(self.model)
-        stmt = stmt.where(
-            self.model.oauth_id == oauth_id, self.model.provider == provider
+        stmt = self._template(
+            "by_oauth_id_and_provider",
+            lambda: select(self.model).where(
+                self.model.oauth_id == bindparam("oauth_id"),
+                self.model.provider == bindparam("provider"),
+            ),
+            loads,
         )
-        if eager:
-            stmt = self._eager(stmt=stmt)
         session = database.scoped_session()
-        result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        result = await session.execute(
+            stmt, {"oauth_id": oauth_id, "provider": provider}
+        )
+        entity = result.unique().scalar_one_or_none()
         return entity
@@ -1,9 +1,32 @@
-from typing import Any, Generic, Type, TypeVar
+from collections import defaultdict
+from typing import Any, Callable, Generic, Literal, Mapping, Sequence, Type, TypeVar
 
-from sqlalchemy import Select, select
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    Select,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    ONETOMANY,
+    Mapper,
+    RelationshipProperty,
+    joinedload,
+    noload,
+    raiseload,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.configs import configs
 from app.core.database import database
 from app.exceptions.database import (
     DatabaseException,
@@ -13,18 +36,73 @@ from app.exceptions.database import (
 from app.models.base import BaseModel
 
 Model = TypeVar("Model", bound=BaseModel)
+# NOTE: 호출별 relationship loader plan (model의 relationship 기본값은 ``lazy="raise"``)
+# e.g. ``{"oauth": "selectin"}``: collection은 ``selectin``, many-to-one은 ``joined`` 권장
+Loader = Literal["noload", "selectin", "joined", "raise"]
+Loads = Mapping[str, Loader]
+LOADERS: dict[Loader, Callable[..., Any]] = {
+    "noload": noload,
+    "selectin": selectinload,
+    "joined": joinedload,
+    "raise": raiseload,
+}
+# NOTE: Core read path에서 조회할 (column attributes, {relationship: 하위 Columns})
+Columns = tuple[tuple[str, ...], dict[str, "Columns"]]
+# NOTE: (model, statement 이름, loads)별 1회만 생성한 ``bindparam`` statement templates
+# Repository는 요청마다 생성 (``Factory``)되므로 module 수준에서 공유하며,
+# 같은 statement 객체를 재사용하면 cache key가 memoize되어 요청마다 statement 생성 / cache key 계산 없이 compiled cache만 조회한다.
+STATEMENTS: dict[tuple[type, str, tuple[tuple[str, Loader], ...]], Select] = {}
 
 
 class BaseRepository(Generic[Model]):
+    # NOTE: upsert_many의 충돌 기준 (unique constraint) columns
+    upsert_keys: tuple[str, ...] = ()
+
     def __init__(self, model: Type[Model]) -> None:
         self.model = model
 
-    def _eager(self, *, stmt: Select) -> Select:
-        for _eager in getattr(self.model, "eagers"):
-            stmt = stmt.options(joinedload(getattr(self.model, _eager)))
+    def _options(self, loads: Loads | None) -> list[Any]:
+        return [
+            LOADERS[loader](getattr(self.model, relationship))
+            for relationship, loader in (loads or {}).items()
+        ]
+
+    def _load(self, stmt: Select, loads: Loads | None) -> Select:
+        return stmt.options(*self._options(loads))
+
+    def _template(
+        self, name: str, build: Callable[[], Select], loads: Loads | None = None
+    ) -> Select:
+        """``build``는 값 대신 ``bindparam``을 사용해야 한다. (최초 1회만 호출)"""
+        key = (self.model, name, tuple(sorted((loads or {}).items())))
+        stmt = STATEMENTS.get(key)
+        if stmt is None:
+            stmt = STATEMENTS[key] = self._load(build(), loads)
         return stmt
 
-    async def create(self, entity: Model) -> Model:
+    def _by_id(self, loads: Loads | None = None) -> Select:
+        return self._template(
+            "by_id",
+            lambda: select(self.model).where(self.model.id == bindparam("id")),
+            loads,
+        )
+
+    async def _reload(
+        self, session: AsyncSession, ids: Sequence[int], loads: Loads | None
+    ) -> list[Model]:
+        """``session.refresh``는 ``lazy="raise"`` relationship을 expire하므로 ``populate_existing`` ``SELECT``로 ``loads``와 함께 다시 읽는다."""
+        stmt = self._template(
+            "reload",
+            lambda: select(self.model)
+            .where(self.model.id.in_(bindparam("ids", expanding=True)))
+            .execution_options(populate_existing=True),
+            loads,
+        )
+        result = await session.scalars(stmt, {"ids": list(ids)})
+        entities = {entity.id: entity for entity in result.unique().all()}
+        return [entities[id] for id in ids]
+
+    async def create(self, entity: Model, loads: Loads | None = None) -> Model:
         session = database.scoped_session()
         session.add(entity)
         try:
@@ -33,26 +111,228 @@ class BaseRepository(Generic[Model]):
             # TODO: DB engine에 따라서 오류가 천차만별
             # message 기반으로 하기는 어려울 것으로 보임
             raise DatabaseException from error
-        await session.refresh(instance=entity)
+        (entity,) = await self._reload(session, [entity.id], loads)
         return entity
 
-    async def read_by_id(self, id: int, eager: bool = False) -> Model:
-        stmt = select(self.model)
-        if eager:
-            stmt = self._eager(stmt=stmt)
-        stmt = stmt.where(self.model.id == id)
+    async def create_many(
+        self,
+        data: Sequence[dict],
+        chunk_size: int = configs.BULK_CHUNK_SIZE,
+        loads: Loads | None = None,
+    ) -> tuple[list[Model], list[int]]:
+        """
+        ``chunk_size``개씩 ``INSERT ... RETURNING`` (executemany)으로 생성한다.
+
+        Chunk 단위 SAVEPOINT에서 제약 조건 위반이 발생하면 해당 chunk만 row 단위로 다시 시도하여,
+        batch 전체를 중단하지 않고 충돌한 row의 index를 반환한다.
+
+        Returns:
+            (생성된 entities, 충돌한 row의 index)
+        """
         session = database.scoped_session()
-        result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        entities: list[Model] = []
+        conflicts: list[int] = []
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            try:
+                async with session.begin_nested():
+                    entities.extend(await self._insert(session, chunk, loads))
+                continue
+            except IntegrityError:
+                pass
+            for index, row in enumerate(chunk, start=offset):
+                try:
+                    async with session.begin_nested():
+                        entities.extend(await self._insert(session, [row], loads))
+                except IntegrityError:
+                    conflicts.append(index)
+        return entities, conflicts
+
+    async def insert_many(
+        self, data: Sequence[dict], chunk_size: int = configs.BULK_CHUNK_SIZE
+    ) -> int:
+        """Entity를 생성하지 않는 executemany ``INSERT`` (충돌 시 ``DatabaseException``)"""
+        session = database.scoped_session()
+        for offset in range(0, len(data), chunk_size):
+            try:
+                await session.execute(
+                    insert(self.model), data[offset : offset + chunk_size]
+                )
+            except IntegrityError as error:
+                raise DatabaseException from error
+        return len(data)
+
+    async def upsert_many(
+        self, data: Sequence[dict], chunk_size: int = configs.BULK_CHUNK_SIZE
+    ) -> int:
+        """
+        ``upsert_keys`` (unique constraint) 기준 upsert: 이미 존재하는 row는 값을 갱신한다.
+
+        PostgreSQL / SQLite는 ``ON CONFLICT DO UPDATE``, MySQL은 ``ON DUPLICATE KEY UPDATE``를 chunk당 1회 실행하고,
+        그 외 backend는 row 단위로 조회한 뒤 update / insert로 나누어 처리한다.
+
+        Returns:
+            Upsert된 (중복 제거된) row 수
+        """
+        # NOTE: 동일 statement 내 같은 key가 두 번 갱신되면 PostgreSQL에서 오류가 발생하므로 마지막 row만 유지
+        keys = self.upsert_keys
+        rows = list({tuple(row[key] for key in keys): row for row in data}.values())
+        session = database.scoped_session()
+        stmt = self._upsert(session, keys)
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset : offset + chunk_size]
+            if stmt is None:
+                await self._merge(session, chunk, keys)
+            else:
+                await session.execute(stmt, chunk)
+        return len(rows)
+
+    def _upsert(self, session: AsyncSession, keys: Sequence[str]) -> Insert | None:
+        dialect = session.get_bind().dialect.name
+        columns = [
+            attribute.columns[0].name
+            for attribute in self.model.__mapper__.column_attrs
+            if attribute.key not in (*keys, "id", "created_at", "updated_at")
+        ]
+        if dialect in ("postgresql", "sqlite"):
+            module = postgresql if dialect == "postgresql" else sqlite
+            stmt = module.insert(self.model)
+            return stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={
+                    **{column: stmt.excluded[column] for column in columns},
+                    "updated_at": func.now(),
+                },
+            )
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql.insert(self.model)
+            return stmt.on_duplicate_key_update(
+                {
+                    **{column: stmt.inserted[column] for column in columns},
+                    "updated_at": func.now(),
+                }
+            )
+        return None
+
+    async def _merge(
+        self, session: AsyncSession, chunk: list[dict], keys: Sequence[str]
+    ) -> None:
+        # NOTE: Backend에 따라 조회된 datetime의 timezone이 달라질 수 있어 key 비교는 DB에서 수행
+        updates, inserts = [], []
+        for row in chunk:
+            stmt = select(self.model.id).where(
+                *(getattr(self.model, key) == row[key] for key in keys)
+            )
+            id = await session.scalar(stmt)
+            if id is None:
+                inserts.append(row)
+            else:
+                updates.append({"id": id, **row})
+        if updates:
+            await session.execute(update(self.model), updates)
+        if inserts:
+            await session.execute(insert(self.model), inserts)
+
+    async def _insert(
+        self, session: AsyncSession, data: Sequence[dict], loads: Loads | None
+    ) -> list[Model]:
+        if self._returning(session, "insert_executemany_returning"):
+            stmt = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            result = await session.scalars(stmt.options(*self._options(loads)), data)
+            return list(result.all())
+        entities = [self.model(**row) for row in data]
+        session.add_all(entities)
+        await session.flush()
+        if not loads:
+            return entities
+        return await self._reload(session, [entity.id for entity in entities], loads)
+
+    async def read_by_id(self, id: int, loads: Loads | None = None) -> Model:
+        session = database.scoped_session()
+        result = await session.execute(self._by_id(loads), {"id": id})
+        entity = result.unique().scalar_one_or_none()
         if not entity:
             raise EntityNotFound
         return entity
 
-    async def update_by_id(self, id: int, data: dict) -> Model:
-        stmt = select(self.model).where(self.model.id == id)
+    async def read_rows(
+        self, columns: Columns, *where: ColumnElement[bool]
+    ) -> list[dict[str, Any]]:
+        """
+        ORM entity 대신 ``columns``만 Core ``SELECT``하여 dict로 반환한다. (identity map / attribute instrumentation 미사용, read-only 응답 전용)
+
+        Relationship은 parent key 기준 ``IN``으로 relationship당 1회 조회한다. (``selectin``과 동일)
+        """
         session = database.scoped_session()
-        result = await session.execute(stmt)
+        return await _read_rows(session, self.model.__mapper__, columns, *where)
+
+    async def read_row_by_id(self, id: int, columns: Columns) -> dict[str, Any]:
+        rows = await self.read_rows(columns, self.model.id == id)
+        if not rows:
+            raise EntityNotFound
+        return rows[0]
+
+    def _returning(self, session: AsyncSession, feature: str) -> bool:
+        """``feature``: ``insert_executemany_returning`` | ``update_returning`` | ``delete_returning`` (MySQL 등 RETURNING 미지원 backend는 ``False``)"""
+        return bool(getattr(session.get_bind().dialect, feature, False))
+
+    def _columns(self, data: dict) -> bool:
+        return set(data) <= set(self.model.__mapper__.column_attrs.keys())
+
+    def _cascades(self) -> list[RelationshipProperty] | None:
+        """
+        Delete cascade relationships (e.g. ``User.oauth``, ``JmyCompany.time_series``)
+
+        Core ``DELETE``로 대신할 수 없는 cascade (many-to-many, 자식의 cascade 등)가 있다면 ``None``
+        """
+        cascades = [
+            relationship
+            for relationship in self.model.__mapper__.relationships
+            if relationship.cascade.delete
+        ]
+        for relationship in cascades:
+            if (
+                relationship.direction is not ONETOMANY
+                or relationship.secondary is not None
+                or len(relationship.local_remote_pairs or ()) != 1
+                or any(
+                    child.cascade.delete for child in relationship.mapper.relationships
+                )
+            ):
+                return None
+        return cascades
+
+    async def update_by_id(
+        self, id: int, data: dict, loads: Loads | None = None
+    ) -> Model:
+        session = database.scoped_session()
+        if not (self._returning(session, "update_returning") and self._columns(data)):
+            return await self._update_by_id(id=id, data=data, loads=loads)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**data)
+            .returning(self.model)
+            .options(*self._options(loads))
+            .execution_options(populate_existing=True)
+        )
+        try:
+            result = await session.execute(stmt)
+        except IntegrityError as error:
+            raise EntityAlreadyExists from error
         entity = result.scalar_one_or_none()
+        if not entity:
+            raise EntityNotFound
+        return entity
+
+    async def _update_by_id(
+        self, id: int, data: dict, loads: Loads | None = None
+    ) -> Model:
+        session = database.scoped_session()
+        result = await session.execute(self._by_id(), {"id": id})
+        entity = result.unique().scalar_one_or_none()
         if not entity:
             raise EntityNotFound
         for key, value in data.items():
@@ -61,32 +341,124 @@ class BaseRepository(Generic[Model]):
             await session.flush()
         except IntegrityError as error:
             raise EntityAlreadyExists from error
-        await session.refresh(entity)
+        (entity,) = await self._reload(session, [id], loads)
         return entity
 
-    async def update_attr_by_id(self, id: int, column: str, value: Any) -> Model:
-        stmt = select(self.model).where(self.model.id == id)
+    async def update_attr_by_id(
+        self, id: int, column: str, value: Any, loads: Loads | None = None
+    ) -> Model:
+        return await self.update_by_id(id=id, data={column: value}, loads=loads)
+
+    async def delete_by_id(self, id: int, loads: Loads | None = None) -> Model:
+        """
+        ``DELETE ... RETURNING``: ORM delete cascade의 자식 row는 부모보다 먼저 Core ``DELETE``로 삭제하고,
+        ``loads``에 포함된 cascade relationship은 자식의 ``DELETE ... RETURNING`` 결과로 채운다.
+        (호출하는 transaction에서 부모가 없으면 ``EntityNotFound``로 rollback되어야 한다.)
+        """
         session = database.scoped_session()
+        cascades = self._cascades()
+        if cascades is None or not self._returning(session, "delete_returning"):
+            return await self._delete_by_id(id=id, loads=loads)
+        loads = dict(loads or {})
+        children = await self._delete_children(session, id, cascades, loads)
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model)
+            .options(*self._options(loads))
+            .execution_options(populate_existing=True)
+        )
         result = await session.execute(stmt)
         entity = result.scalar_one_or_none()
         if not entity:
             raise EntityNotFound
-        setattr(entity, column, value)
-        try:
-            await session.flush()
-        except IntegrityError as error:
-            raise EntityAlreadyExists from error
-        await session.refresh(entity)
+        for key, values in children.items():
+            set_committed_value(entity, key, values)
         return entity
 
-    async def delete_by_id(self, id: int, eager: bool = False) -> Model:
-        stmt = select(self.model).where(self.model.id == id)
-        if eager:
-            stmt = self._eager(stmt=stmt)
+    async def _delete_children(
+        self,
+        session: AsyncSession,
+        id: int,
+        cascades: list[RelationshipProperty],
+        loads: dict[str, Loader],
+    ) -> dict[str, list[Any]]:
+        """``loads``에서 cascade relationship을 제거하고, load할 relationship만 삭제된 자식 entities를 반환한다."""
+        children: dict[str, list[Any]] = {}
+        for relationship in cascades:
+            _, remote = _pair(self.model.__mapper__, relationship.key)
+            child = relationship.mapper.class_
+            stmt = delete(child).where(remote == id)
+            if loads.pop(relationship.key, "noload") in ("noload", "raise"):
+                await session.execute(stmt)
+                continue
+            result = await session.scalars(
+                stmt.returning(child).execution_options(populate_existing=True)
+            )
+            children[relationship.key] = list(result.all())
+        return children
+
+    async def _delete_by_id(self, id: int, loads: Loads | None = None) -> Model:
         session = database.scoped_session()
-        result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        result = await session.execute(self._by_id(loads), {"id": id})
+        entity = result.unique().scalar_one_or_none()
         if not entity:
             raise EntityNotFound
         await session.delete(entity)
         return entity
+
+
+async def _read_rows(
+    session: AsyncSession,
+    mapper: Mapper[Any],
+    columns: Columns,
+    *where: ColumnElement[bool],
+) -> list[dict[str, Any]]:
+    fields, relations = columns
+    keys: dict[str, ColumnElement[Any]] = {
+        field: mapper.columns[field] for field in fields
+    }
+    for name in relations:
+        local, _ = _pair(mapper, name)
+        keys.setdefault(mapper.get_property_by_column(local).key, local)
+    stmt = (
+        select(*(column.label(key) for key, column in keys.items()))
+        .where(*where)
+        .order_by(*mapper.primary_key)
+    )
+    rows = [dict(row) for row in (await session.execute(stmt)).mappings()]
+    for name, related in relations.items():
+        await _attach(session, mapper, name, rows, related)
+    return rows
+
+
+def _pair(mapper: Mapper[Any], name: str) -> tuple[Any, Any]:
+    """Relationship ``name``의 (parent column, child column)"""
+    ((local, remote),) = list(mapper.relationships[name].local_remote_pairs or ())
+    return local, remote
+
+
+async def _attach(
+    session: AsyncSession,
+    mapper: Mapper[Any],
+    name: str,
+    rows: list[dict[str, Any]],
+    columns: Columns,
+) -> None:
+    relationship = mapper.relationships[name]
+    local, remote = _pair(mapper, name)
+    key = mapper.get_property_by_column(local).key
+    remote_key = relationship.mapper.get_property_by_column(remote).key
+    children: defaultdict[Any, list[dict[str, Any]]] = defaultdict(list)
+    ids = {row[key] for row in rows}
+    if ids:
+        for child in await _read_rows(
+            session,
+            relationship.mapper,
+            ((*columns[0], remote_key), columns[1]),
+            remote.in_(ids),
+        ):
+            children[child[remote_key]].append(child)
+    for row in rows:
+        group = children.get(row[key], [])
+        row[name] = group if relationship.uselist else (group[0] if group else None)
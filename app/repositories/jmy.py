@@ -1,20 +1,485 @@
-from sqlalchemy import select
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Iterable, Literal, Sequence
 
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    Integer,
+    Row,
+    RowMapping,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs import configs
 from app.core.database import database
-from app.models.jmy import JmyCompany
-from app.repositories.base import BaseRepository
+from app.models.jmy import (
+    COUNTERS,
+    JmyCompaction,
+    JmyCompany,
+    JmySnapshot,
+    JmySummary,
+    JmyTimeSeries,
+)
+from app.repositories.base import BaseRepository, Loads
 
 
 class JmyRepository(BaseRepository[JmyCompany]):
     def __init__(self):
         super().__init__(model=JmyCompany)
 
-    async def read_by_name(self, name: str, eager: bool = False) -> JmyCompany | None:
-        stmt = select(self.model)
-        if eager:
-            stmt = self._eager(stmt=stmt)
-        stmt = stmt.where(self.model.name == name)
+    async def read_by_name(
+        self, name: str, loads: Loads | None = None
+    ) -> JmyCompany | None:
+        """``loads``에 없으면 ``time_series`` (history)를 load하지 않는다."""
+        stmt = self._template(
+            "by_name",
+            lambda: select(self.model).where(self.model.name == bindparam("name")),
+            loads,
+        )
         session = database.scoped_session()
-        result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        result = await session.execute(stmt, {"name": name})
+        entity = result.unique().scalar_one_or_none()
         return entity
+
+    async def read_by_ids(self, ids: Collection[int]) -> Sequence[JmyCompany]:
+        """``time_series``를 load하지 않는 batched 조회"""
+        stmt = select(self.model).where(self.model.id.in_(ids))
+        session = database.scoped_session()
+        result = await session.scalars(stmt)
+        return result.all()
+
+    async def read_search_fields(self) -> Sequence[tuple[int, str, str, str | None]]:
+        stmt = select(
+            self.model.id, self.model.name, self.model.address, self.model.research
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return result.tuples().all()
+
+    async def stream_with_time_series(
+        self,
+        *,
+        fields: Sequence[str],
+        time_series_fields: Sequence[str],
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """``jmy_company`` LEFT JOIN ``jmy_time_series``의 flat rows를 server-side cursor로 ``batch_size``개씩 읽는다."""
+        stmt = (
+            select(
+                *(getattr(self.model, field) for field in fields),
+                *(getattr(JmyTimeSeries, field) for field in time_series_fields),
+            )
+            .outerjoin(JmyTimeSeries, JmyTimeSeries.company_id == self.model.id)
+            .order_by(self.model.id, JmyTimeSeries.date)
+            .execution_options(yield_per=batch_size)
+        )
+        session = database.scoped_session()
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def read_ids_by_names(self, names: Iterable[str]) -> dict[str, int]:
+        """``time_series``를 load하지 않는 batched lookup (name -> id)"""
+        stmt = select(self.model.name, self.model.id).where(self.model.name.in_(names))
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def create_ids(self, data: Sequence[dict]) -> dict[str, int]:
+        """ORM entity 없이 생성 후 name -> id 반환"""
+        if not data:
+            return {}
+        session = database.scoped_session()
+        if self._returning(session, "insert_executemany_returning"):
+            stmt = insert(self.model).returning(self.model.name, self.model.id)
+            result = await session.execute(stmt, data)
+            return dict(result.tuples().all())
+        await self.insert_many(data)
+        return await self.read_ids_by_names(row["name"] for row in data)
+
+
+class JmyTimeSeriesRepository(BaseRepository[JmyTimeSeries]):
+    upsert_keys = ("company_id", "date")
+
+    def __init__(self):
+        super().__init__(model=JmyTimeSeries)
+
+    async def read_by_key(self, company_id: int, date: datetime) -> JmyTimeSeries:
+        stmt = (
+            select(self.model)
+            .where(self.model.company_id == company_id, self.model.date == date)
+            .execution_options(populate_existing=True)
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    async def read_series(
+        self,
+        company_id: int,
+        bucket: Literal["month", "quarter", "year"],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Sequence[RowMapping]:
+        """
+        ``[start, end)`` 구간을 ``bucket`` 단위로 집계한다.
+
+        ``*_assigned`` / ``*_new``는 합계, ``*_old`` (복무인원)는 bucket 내 마지막 시점의 값을 사용한다.
+
+        Returns:
+            ``year``, ``month`` (bucket 시작 월), ``b_*``, ``a_*``를 가진 rows
+        """
+        session = database.scoped_session()
+        date: ColumnElement[datetime] = self.model.date.expression
+        if session.get_bind().dialect.name == "postgresql":
+            # NOTE: timestamptz는 UTC 기준이므로 configs.TZ 기준 날짜로 변환 후 bucketing
+            #       (SQLite / MySQL은 configs.TZ wall time 그대로 저장되므로 변환하지 않는다.)
+            date = func.timezone(configs.TZ, date)
+        year = cast(extract("year", date), Integer)
+        month: ColumnElement[int] = cast(extract("month", date), Integer)
+        if bucket == "quarter":
+            month = case((month <= 3, 1), (month <= 6, 4), (month <= 9, 7), else_=10)
+        elif bucket == "year":
+            month = cast(1, Integer)
+        conditions = [self.model.company_id == company_id]
+        if start is not None:
+            conditions.append(self.model.date >= start)
+        if end is not None:
+            conditions.append(self.model.date < end)
+        buckets = (
+            select(
+                year.label("year"),
+                month.label("month"),
+                func.sum(self.model.b_assigned).label("b_assigned"),
+                func.sum(self.model.b_new).label("b_new"),
+                func.sum(self.model.a_assigned).label("a_assigned"),
+                func.sum(self.model.a_new).label("a_new"),
+                func.max(self.model.date).label("last"),
+            )
+            .where(*conditions)
+            .group_by(year, month)
+            .subquery()
+        )
+        stmt = (
+            select(
+                buckets.c.year,
+                buckets.c.month,
+                buckets.c.b_assigned,
+                buckets.c.b_new,
+                self.model.b_old,
+                buckets.c.a_assigned,
+                buckets.c.a_new,
+                self.model.a_old,
+            )
+            .join(
+                self.model,
+                and_(
+                    self.model.company_id == company_id,
+                    self.model.date == buckets.c.last,
+                ),
+            )
+            .order_by(buckets.c.year, buckets.c.month)
+        )
+        result = await session.execute(stmt)
+        return result.mappings().all()
+
+    async def upsert(self, data: dict) -> JmyTimeSeries:
+        await self.upsert_many([data])
+        return await self.read_by_key(company_id=data["company_id"], date=data["date"])
+
+    async def read_company_ids(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime,
+        after: int | None = None,
+        limit: int,
+    ) -> Sequence[int]:
+        """``[start, end)`` 구간에 point가 있는 company id (``after`` 기준 keyset pagination)"""
+        stmt = select(self.model.company_id).where(self.model.date < end)
+        if start is not None:
+            stmt = stmt.where(self.model.date >= start)
+        if after is not None:
+            stmt = stmt.where(self.model.company_id > after)
+        stmt = stmt.distinct().order_by(self.model.company_id).limit(limit)
+        session = database.scoped_session()
+        result = await session.scalars(stmt)
+        return result.all()
+
+    async def read_points(
+        self, company_ids: Collection[int], start: datetime | None, end: datetime
+    ) -> Sequence[Row[Any]]:
+        """``id``, ``company_id``, ``date``, counters를 가진 rows (``company_id``, ``date`` 순)"""
+        stmt = select(
+            self.model.id,
+            self.model.company_id,
+            self.model.date,
+            *(getattr(self.model, counter) for counter in COUNTERS),
+        ).where(self.model.company_id.in_(company_ids), self.model.date < end)
+        if start is not None:
+            stmt = stmt.where(self.model.date >= start)
+        stmt = stmt.order_by(self.model.company_id, self.model.date)
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return result.all()
+
+    async def read_by_keys(
+        self, company_ids: Collection[int], dates: Collection[datetime]
+    ) -> Sequence[Row[Any]]:
+        """``company_id``, ``date``, counters를 가진 rows (``company_ids`` x ``dates`` 중 존재하는 point만)"""
+        stmt = select(
+            self.model.company_id,
+            self.model.date,
+            *(getattr(self.model, counter) for counter in COUNTERS),
+        ).where(self.model.company_id.in_(company_ids), self.model.date.in_(dates))
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return result.all()
+
+    async def delete_by_ids(self, ids: Collection[int]) -> int:
+        if len(ids) == 0:
+            return 0
+        session = database.scoped_session()
+        await session.execute(delete(self.model).where(self.model.id.in_(ids)))
+        return len(ids)
+
+
+class JmySummaryRepository(BaseRepository[JmySummary]):
+    upsert_keys = ("dimension", "key", "date")
+    dimensions = {"location": JmyCompany.location, "type": JmyCompany.type_}
+
+    def __init__(self):
+        super().__init__(model=JmySummary)
+
+    async def read_by_dimension(
+        self,
+        dimension: str,
+        key: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Sequence[JmySummary]:
+        stmt = select(self.model).where(self.model.dimension == dimension)
+        if key is not None:
+            stmt = stmt.where(self.model.key == key)
+        if start is not None:
+            stmt = stmt.where(self.model.date >= start)
+        if end is not None:
+            stmt = stmt.where(self.model.date < end)
+        stmt = stmt.order_by(self.model.key, self.model.date)
+        session = database.scoped_session()
+        result = await session.scalars(stmt)
+        return result.all()
+
+    async def read_keys(
+        self, company_ids: Collection[int]
+    ) -> dict[int, dict[str, str]]:
+        """Company id -> ``{dimension: key}``"""
+        stmt = select(JmyCompany.id, *self.dimensions.values()).where(
+            JmyCompany.id.in_(company_ids)
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return {id: dict(zip(self.dimensions, keys)) for id, *keys in result.tuples()}
+
+    async def increment(
+        self, data: Sequence[dict], chunk_size: int = configs.BULK_CHUNK_SIZE
+    ) -> int:
+        """
+        ``upsert_keys`` 기준으로 ``companies`` / counters에 delta를 더한다. (없는 row는 delta로 생성)
+
+        Returns:
+            갱신된 row 수
+        """
+        session = database.scoped_session()
+        stmt = self._increment(session)
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset : offset + chunk_size]
+            if stmt is None:
+                await self._merge_increment(session, chunk)
+            else:
+                await session.execute(stmt, chunk)
+        return len(data)
+
+    def _increment(self, session: AsyncSession) -> Insert | None:
+        dialect = session.get_bind().dialect.name
+        fields = ("companies", *COUNTERS)
+        if dialect in ("postgresql", "sqlite"):
+            module = postgresql if dialect == "postgresql" else sqlite
+            stmt = module.insert(self.model)
+            return stmt.on_conflict_do_update(
+                index_elements=list(self.upsert_keys),
+                set_={
+                    **{
+                        field: getattr(self.model, field) + stmt.excluded[field]
+                        for field in fields
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql.insert(self.model)
+            return stmt.on_duplicate_key_update(
+                {
+                    **{
+                        field: getattr(self.model, field) + stmt.inserted[field]
+                        for field in fields
+                    },
+                    "updated_at": func.now(),
+                }
+            )
+        return None
+
+    async def _merge_increment(
+        self, session: AsyncSession, chunk: Sequence[dict]
+    ) -> None:
+        for row in chunk:
+            stmt = select(self.model.id).where(
+                *(getattr(self.model, key) == row[key] for key in self.upsert_keys)
+            )
+            id = await session.scalar(stmt)
+            if id is None:
+                await session.execute(insert(self.model), [row])
+                continue
+            await session.execute(
+                update(self.model)
+                .where(self.model.id == id)
+                .values(
+                    {
+                        field: getattr(self.model, field) + row[field]
+                        for field in ("companies", *COUNTERS)
+                    }
+                )
+            )
+
+    async def refresh(
+        self,
+        company_ids: Collection[int] | None = None,
+        dates: Collection[datetime] | None = None,
+    ) -> int:
+        """
+        ``company_ids``가 속한 group과 ``dates``에 해당하는 summary만 ``jmy_time_series``에서 다시 집계한다. (``None``이면 전체, rebuild / compaction용)
+
+        단건 / bulk write는 group 전체를 다시 집계하지 않도록 ``increment``로 delta만 반영한다.
+
+        Returns:
+            갱신된 group 수
+        """
+        session = database.scoped_session()
+        rows: list[dict] = []
+        for dimension, column in self.dimensions.items():
+            stmt = select(
+                column,
+                JmyTimeSeries.date,
+                func.count(),
+                *(func.sum(getattr(JmyTimeSeries, counter)) for counter in COUNTERS),
+            ).join(JmyCompany, JmyTimeSeries.company_id == JmyCompany.id)
+            if company_ids is not None:
+                stmt = stmt.where(
+                    column.in_(select(column).where(JmyCompany.id.in_(company_ids)))
+                )
+            if dates is not None:
+                stmt = stmt.where(JmyTimeSeries.date.in_(dates))
+            result = await session.execute(stmt.group_by(column, JmyTimeSeries.date))
+            for key, date, companies, *counters in result.tuples():
+                rows.append(
+                    {
+                        "dimension": dimension,
+                        "key": key,
+                        "date": date,
+                        "companies": companies,
+                        **dict(zip(COUNTERS, counters)),
+                    }
+                )
+        return await self.upsert_many(rows)
+
+    async def delete_groups(
+        self, company_ids: Collection[int], dates: Collection[datetime]
+    ) -> None:
+        """``company_ids``가 속한 group의 ``dates`` summary 삭제 (point가 사라진 date는 ``refresh``로 지워지지 않으므로 먼저 삭제)"""
+        session = database.scoped_session()
+        for dimension, column in self.dimensions.items():
+            await session.execute(
+                delete(self.model).where(
+                    self.model.dimension == dimension,
+                    self.model.key.in_(
+                        select(column).where(JmyCompany.id.in_(company_ids))
+                    ),
+                    self.model.date.in_(dates),
+                )
+            )
+
+    async def delete_all(self) -> None:
+        session = database.scoped_session()
+        await session.execute(delete(self.model))
+
+
+class JmySnapshotRepository(BaseRepository[JmySnapshot]):
+    upsert_keys = ("company_id",)
+
+    def __init__(self):
+        super().__init__(model=JmySnapshot)
+
+    async def read_all_with_names(self) -> Sequence[RowMapping]:
+        stmt = (
+            select(
+                self.model.company_id,
+                JmyCompany.name,
+                self.model.date,
+                *(getattr(self.model, counter) for counter in COUNTERS),
+            )
+            .join(JmyCompany, self.model.company_id == JmyCompany.id)
+            .order_by(JmyCompany.name)
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return result.mappings().all()
+
+    async def refresh(self, company_ids: Collection[int] | None = None) -> int:
+        """``company_ids``의 가장 최근 point로 snapshot을 갱신한다. (``None``이면 전체)"""
+        latest = select(
+            JmyTimeSeries.company_id, func.max(JmyTimeSeries.date).label("date")
+        ).group_by(JmyTimeSeries.company_id)
+        if company_ids is not None:
+            latest = latest.where(JmyTimeSeries.company_id.in_(company_ids))
+        subquery = latest.subquery()
+        stmt = select(
+            JmyTimeSeries.company_id,
+            JmyTimeSeries.date,
+            *(getattr(JmyTimeSeries, counter) for counter in COUNTERS),
+        ).join(
+            subquery,
+            and_(
+                JmyTimeSeries.company_id == subquery.c.company_id,
+                JmyTimeSeries.date == subquery.c.date,
+            ),
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt)
+        return await self.upsert_many([dict(row) for row in result.mappings()])
+
+    async def delete_all(self) -> None:
+        session = database.scoped_session()
+        await session.execute(delete(self.model))
+
+
+class JmyCompactionRepository(BaseRepository[JmyCompaction]):
+    upsert_keys = ("bucket",)
+
+    def __init__(self):
+        super().__init__(model=JmyCompaction)
+
+    async def read_watermark(self, bucket: str) -> datetime | None:
+        stmt = select(self.model.watermark).where(self.model.bucket == bucket)
+        session = database.scoped_session()
+        return await session.scalar(stmt)
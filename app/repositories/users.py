@@ -1,30 +1,68 @@
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.core.database import database
 from app.exceptions.database import EntityNotFound
 from app.models.users import User
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Loads
 
 
 class UserRepository(BaseRepository[User]):
     def __init__(self):
         super().__init__(model=User)
 
-    async def read_all(self) -> Sequence[User]:
-        stmt = select(self.model)
+    async def read_all(self, loads: Loads | None = None) -> Sequence[User]:
+        stmt = self._load(select(self.model), loads)
         session = database.scoped_session()
         result = await session.execute(stmt)
-        entity = result.scalars().all()
+        entity = result.scalars().unique().all()
         if not entity:
             raise EntityNotFound
         return entity
 
-    async def read_by_email(self, email: str) -> User | None:
-        stmt = select(self.model)
-        stmt = stmt.where(self.model.email == email)
+    async def read_page(
+        self, limit: int, after: int | None = None, loads: Loads | None = None
+    ) -> Sequence[User]:
+        """Keyset pagination on ``id``: ``after``보다 큰 ``id``를 가진 최대 ``limit``개의 사용자"""
+        stmt = self._load(select(self.model), loads)
+        stmt = stmt.order_by(self.model.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(self.model.id > after)
         session = database.scoped_session()
         result = await session.execute(stmt)
-        entity = result.scalar_one_or_none()
+        return result.scalars().unique().all()
+
+    async def read_by_ids(
+        self, ids: Sequence[int], loads: Loads | None = None
+    ) -> list[User]:
+        """``ids`` 순서대로 조회 (session에 이미 있는 entity도 ``loads``와 함께 다시 읽는다)"""
+        session = database.scoped_session()
+        return await self._reload(session, ids, loads)
+
+    async def stream_all(
+        self, batch_size: int, loads: Loads | None = None
+    ) -> AsyncIterator[User]:
+        """``yield_per``와 함께 사용할 수 없는 collection ``joined`` 대신 ``selectin``을 사용해야 한다."""
+        stmt = (
+            self._load(select(self.model), loads)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        session = database.scoped_session()
+        result = await session.stream_scalars(stmt)
+        async for entity in result:
+            yield entity
+
+    async def read_by_email(
+        self, email: str, loads: Loads | None = None
+    ) -> User | None:
+        stmt = self._template(
+            "by_email",
+            lambda: select(self.model).where(self.model.email == bindparam("email")),
+            loads,
+        )
+        session = database.scoped_session()
+        result = await session.execute(stmt, {"email": email})
+        entity = result.unique().scalar_one_or_none()
         return entity
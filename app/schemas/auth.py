@@ -115,6 +115,7 @@ class JwtPayload(BaseModel):
     sub: str
     iat: datetime
     exp: datetime
+    jti: str | None = None
 
 
 class JwtAccessToken(BaseModel):
@@ -1,9 +1,7 @@
 import abc
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, ConfigDict, model_validator
-from typing_extensions import Self
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from app.core.configs import configs
 
@@ -18,8 +16,8 @@ class BaseResponse(BaseModel, abc.ABC):
     created_at: datetime
     updated_at: datetime
 
-    @model_validator(mode="after")
-    def set_timezone(self) -> Self:
-        self.created_at = self.created_at.astimezone(ZoneInfo(configs.TZ))
-        self.updated_at = self.updated_at.astimezone(ZoneInfo(configs.TZ))
-        return self
+    # NOTE: model_validator (after)는 이미 생성된 instance를 APIResponse 등에 담을 때도 다시 실행되므로 field 단위로 변환
+    @field_validator("created_at", "updated_at")
+    @classmethod
+    def set_timezone(cls, value: datetime) -> datetime:
+        return value.astimezone(configs.TZINFO)
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from pydantic import BaseModel
+
 from app.schemas.base import BaseRequest, BaseResponse
 
 
@@ -30,6 +32,10 @@ class JmyCompanyResponse(BaseResponse):
     research: str
 
 
+class JmySearchOut(JmyCompanyResponse):
+    score: float
+
+
 class JmyTimeSeriesOut(BaseResponse):
     date: datetime
     b_assigned: int
@@ -42,3 +48,81 @@ class JmyTimeSeriesOut(BaseResponse):
 
 class JmyCompanyOut(JmyCompanyResponse):
     time_series: list[JmyTimeSeriesOut]
+
+
+class JmySeriesPoint(BaseModel):
+    date: datetime
+    b_assigned: int
+    b_new: int
+    b_old: int
+    a_assigned: int
+    a_new: int
+    a_old: int
+
+
+class JmySeriesOut(JmyCompanyResponse):
+    bucket: str
+    series: list[JmySeriesPoint]
+
+
+class JmySummaryOut(BaseResponse):
+    dimension: str
+    key: str
+    date: datetime
+    companies: int
+    b_assigned: int
+    b_new: int
+    b_old: int
+    a_assigned: int
+    a_new: int
+    a_old: int
+
+
+class JmySnapshotOut(BaseModel):
+    company_id: int
+    name: str
+    date: datetime
+    b_assigned: int
+    b_new: int
+    b_old: int
+    a_assigned: int
+    a_new: int
+    a_old: int
+
+
+class JmyAggregateOut(BaseModel):
+    key: str
+    dates: list[datetime]
+    values: list[float]
+
+
+class JmyGrowthOut(BaseModel):
+    name: str
+    first: int
+    last: int
+    growth: int
+
+
+class JmyImportOut(BaseModel):
+    chunk: int
+    rows: int
+    companies: int
+    time_series: int
+    elapsed_time: float
+
+
+class JmyImportErrorOut(BaseModel):
+    """``row``: 실패한 row 번호 (1부터, CSV header 제외), ``committed``: 이미 commit된 chunks"""
+
+    row: int
+    committed: list[JmyImportOut]
+
+
+class JmyCompactionOut(BaseModel):
+    bucket: str
+    start: datetime | None
+    end: datetime
+    companies: int
+    points: int
+    deleted: int
+    elapsed_time: float
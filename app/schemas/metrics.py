@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+
+class CacheMetrics(BaseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+
+
+class CompiledCacheMetrics(BaseModel):
+    hits: int
+    misses: int
+    uncached: int
+
+
+class PoolMetrics(BaseModel):
+    """``QueuePool``이 아니면 (e.g. SQLite의 ``StaticPool``) occupancy는 ``None``"""
+
+    type: str
+    size: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+
+
+class Metrics(BaseModel):
+    principal_cache: CacheMetrics
+    compiled_cache: CompiledCacheMetrics
+    pools: dict[str, PoolMetrics]
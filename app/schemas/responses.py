@@ -1,6 +1,5 @@
 from datetime import datetime
 from typing import Generic, TypeVar
-from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
 
@@ -40,14 +39,16 @@ class APIResponse(BaseModel, Generic[T]):
             status=status,
             message="The request has been successfully processed.",
             data=data,
-            timestamp=datetime.now().astimezone(ZoneInfo(configs.TZ)),
+            timestamp=datetime.now().astimezone(configs.TZINFO),
         )
 
     @classmethod
-    def error(cls, *, status: int, message: str) -> "APIResponse[T]":
+    def error(
+        cls, *, status: int, message: str, data: T | None = None
+    ) -> "APIResponse[T]":
         return cls(
             status=status,
             message=message,
-            data=None,
-            timestamp=datetime.now().astimezone(ZoneInfo(configs.TZ)),
+            data=data,
+            timestamp=datetime.now().astimezone(configs.TZINFO),
         )
@@ -20,6 +20,11 @@ class UserPasswordAdminRequest(BaseRequest):
     password: Annotated[str, StringConstraints(min_length=8, max_length=30)]
 
 
+class UserBulkRequest(UserRequest):
+    email: EmailStr
+    password: Annotated[str, StringConstraints(min_length=8, max_length=30)]
+
+
 class UserResponse(BaseResponse):
     name: Annotated[str, StringConstraints(min_length=3, max_length=30)]
     email: EmailStr
@@ -1,6 +1,9 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import overload
-from zoneinfo import ZoneInfo
+from functools import partial
+from hmac import compare_digest
+from secrets import token_urlsafe
+from typing import Sequence, overload
 
 import httpx
 from jose import jwt
@@ -8,8 +11,10 @@ from jose.exceptions import ExpiredSignatureError, JWTError
 from loguru import logger
 from pydantic import ValidationError
 
+from app.core.cache import principal_cache
 from app.core.configs import configs
 from app.core.database import database
+from app.core.http import github_client, google_client
 from app.exceptions.auth import (
     GitHubOAuthFailed,
     GoogleOAuthFailed,
@@ -17,6 +22,7 @@ from app.exceptions.auth import (
     NotRegistered,
     OAuthFormDataInvalid,
     PasswordOAuthFailed,
+    RefreshTokenRevoked,
     TokenDecodeError,
     TokenExpired,
     UserAlreadyExists,
@@ -45,6 +51,7 @@ from app.schemas.auth import (
     RefreshOAuthRequest,
 )
 from app.schemas.users import (
+    UserBulkRequest,
     UserIn,
     UserOut,
     UserPasswordAdminRequest,
@@ -61,21 +68,27 @@ class JwtService:
         self.access_expire = timedelta(hours=2)
         self.refresh_expire = timedelta(days=1)
 
-    def _encode(self, *, sub: str, exp: timedelta) -> str:
+    def _encode(self, *, sub: str, exp: timedelta, jti: str | None = None) -> str:
         payload = JwtPayload(
             sub=sub,
-            iat=datetime.now().astimezone(ZoneInfo(configs.TZ)),
-            exp=datetime.now().astimezone(ZoneInfo(configs.TZ)) + exp,
+            iat=datetime.now().astimezone(configs.TZINFO),
+            exp=datetime.now().astimezone(configs.TZINFO) + exp,
+            jti=jti,
         )
         return jwt.encode(
-            claims=payload.model_dump(), key=self.secret, algorithm=self.algorithm
+            claims=payload.model_dump(exclude_none=True),
+            key=self.secret,
+            algorithm=self.algorithm,
         )
 
     def create_access_token(self, user: User) -> str:
         return self._encode(sub=str(user.id), exp=self.access_expire)
 
     def create_refresh_token(self, user: User) -> str:
-        return self._encode(sub=f"{user.id}.refresh", exp=self.refresh_expire)
+        # NOTE: 같은 초에 발급된 refresh token도 서로 다르도록 jti 추가 (rotation 시 이전 token과 구분)
+        return self._encode(
+            sub=f"{user.id}.refresh", exp=self.refresh_expire, jti=token_urlsafe(16)
+        )
 
     def create_token(self, user: User) -> JwtToken:
         return JwtToken(
@@ -105,23 +118,23 @@ class GoogleService:
     async def _get_token(self, schema: GoogleOAuthRequest) -> GoogleOAuthToken:
         if schema.grant_type != "authorization_code":
             raise OAuthFormDataInvalid
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://oauth2.googleapis.com/token",
-                    json={
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "grant_type": schema.grant_type,
-                        "code": schema.code,
-                        "redirect_uri": schema.redirect_uri,
-                    },
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as error:
-                logger.error(response.json())
-                raise GoogleOAuthFailed from error
+        client = google_client()
+        try:
+            response = await client.post(
+                "https://oauth2.googleapis.com/token",
+                json={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "grant_type": schema.grant_type,
+                    "code": schema.code,
+                    "redirect_uri": schema.redirect_uri,
+                },
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            logger.error(response.json())
+            raise GoogleOAuthFailed from error
         try:
             google_oauth_token = GoogleOAuthToken.model_validate(response.json())
         except ValidationError as error:
@@ -131,19 +144,19 @@ class GoogleService:
 
     async def _get_user(self, schema: GoogleOAuthToken) -> GoogleOAuthUser:
         # https://developers.google.com/identity/protocols/oauth2/scopes#oauth2
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://www.googleapis.com/oauth2/v2/userinfo",
-                    headers={
-                        "Accept": "application/json",
-                        "Authorization": f"Bearer {schema.access_token}",
-                    },
-                )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as error:
-                logger.error(response.json())
-                raise GoogleOAuthFailed from error
+        client = google_client()
+        try:
+            response = await client.get(
+                "https://www.googleapis.com/oauth2/v2/userinfo",
+                headers={
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {schema.access_token}",
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            logger.error(response.json())
+            raise GoogleOAuthFailed from error
         try:
             google_oauth_user = GoogleOAuthUser.model_validate(response.json())
         except ValidationError as error:
@@ -170,22 +183,22 @@ class GitHubService:
     async def _get_token(self, schema: GitHubOAuthRequest) -> GitHubOAuthToken:
         if schema.grant_type != "authorization_code":
             raise OAuthFormDataInvalid
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://github.com/login/oauth/access_token",
-                    json={
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "code": schema.code,
-                        "redirect_uri": schema.redirect_uri,
-                    },
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as error:
-                logger.error(response.json())
-                raise GitHubOAuthFailed from error
+        client = github_client()
+        try:
+            response = await client.post(
+                "https://github.com/login/oauth/access_token",
+                json={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "code": schema.code,
+                    "redirect_uri": schema.redirect_uri,
+                },
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            logger.error(response.json())
+            raise GitHubOAuthFailed from error
         try:
             github_oauth_token = GitHubOAuthToken.model_validate(response.json())
         except ValidationError as error:
@@ -194,19 +207,19 @@ class GitHubService:
         return github_oauth_token
 
     async def _get_user(self, schema: GitHubOAuthToken) -> GitHubOAuthUser:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://api.github.com/user",
-                    headers={
-                        "Accept": "application/json",
-                        "Authorization": f"Bearer {schema.access_token}",
-                    },
-                )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as error:
-                logger.error(response.json())
-                raise GitHubOAuthFailed from error
+        client = github_client()
+        try:
+            response = await client.get(
+                "https://api.github.com/user",
+                headers={
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {schema.access_token}",
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            logger.error(response.json())
+            raise GitHubOAuthFailed from error
         github_oauth_user = response.json()
         github_oauth_user["id"] = str(github_oauth_user["id"])
         try:
@@ -247,6 +260,7 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
     def _create_token(self, user: User) -> JwtToken:
         jwt_token = self.jwt_service.create_token(user)
         user.refresh_token = jwt_token.refresh_token
+        database.after_commit(partial(principal_cache.pop, user.id))
         return jwt_token
 
     @overload
@@ -264,20 +278,23 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
         self, user_id: int, schema: UserPasswordRequest | UserPasswordAdminRequest
     ) -> UserOut:
         oauth = await self.repository.read_by_user_id_and_password(
-            user_id=user_id, eager=True
+            user_id=user_id, loads={"user": "joined"}
         )
         if oauth is None or oauth.password is None:
             raise NotRegistered
         password_new: str
         if isinstance(schema, UserPasswordRequest):
             # TODO: 비밀번호 변경 전, 후 같으면 예외 발생
-            if not self.crypt_service.verify(schema.password_old, oauth.password):
+            if not await self.crypt_service.verify_async(
+                schema.password_old, oauth.password
+            ):
                 raise PasswordOAuthFailed
             password_new = schema.password_new
         elif isinstance(schema, UserPasswordAdminRequest):
             password_new = schema.password
-        oauth.password = self.crypt_service.hash(password_new)
+        oauth.password = await self.crypt_service.hash_async(password_new)
         user = oauth.user
+        database.after_commit(partial(principal_cache.pop, user.id))
         return self.user_mapper.schema(
             id=user.id,
             created_at=user.created_at,
@@ -294,11 +311,13 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
         self, schema: OAuthResponse, provider: OAuthProvider
     ) -> JwtToken:
         oauth = await self.repository.read_by_oauth_id_and_provider(
-            oauth_id=schema.id, provider=provider, eager=True
+            oauth_id=schema.id, provider=provider, loads={"user": "joined"}
         )
         if oauth:
             return self._create_token(user=oauth.user)
-        user = await self.user_repository.read_by_email(schema.email)
+        user = await self.user_repository.read_by_email(
+            schema.email, loads={"oauth": "selectin"}
+        )
         oauth = OAuth(
             provider=provider,
             oauth_id=schema.id,
@@ -316,7 +335,9 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
     async def register(self, schema: PasswordOAuthReigsterRequest) -> UserOut:
         if schema.grant_type != OAuthProvider.PASSWORD.value:
             raise OAuthFormDataInvalid
-        user = await self.user_repository.read_by_email(email=schema.username)
+        user = await self.user_repository.read_by_email(
+            email=schema.username, loads={"oauth": "selectin"}
+        )
         oauth = None
         if user:
             for _oauth in user.oauth:
@@ -328,7 +349,7 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
                 raise UserAlreadyExists
         oauth = OAuth(
             provider=OAuthProvider.PASSWORD,
-            password=self.crypt_service.hash(schema.password),
+            password=await self.crypt_service.hash_async(schema.password),
         )
         if not user:
             user = User(
@@ -338,14 +359,63 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
                 refresh_token=None,
             )
         user.oauth.append(oauth)
-        user = await self.user_repository.create(entity=user)
+        user = await self.user_repository.create(
+            entity=user, loads={"oauth": "selectin"}
+        )
+        database.after_commit(partial(principal_cache.pop, user.id))
         return self.user_mapper(user)
 
+    @database.transactional
+    async def register_many(
+        self, schemas: Sequence[UserBulkRequest]
+    ) -> tuple[list[UserOut], list[int]]:
+        """
+        Password OAuth 사용자 bulk 생성 (``Role.USER`` 고정)
+
+        Returns:
+            (생성된 users, email / name 충돌로 생성되지 않은 ``schemas``의 index)
+        """
+        # NOTE: CryptExecutor의 대기열을 넘지 않도록 worker 수만큼씩 hashing
+        passwords: list[str] = []
+        for offset in range(0, len(schemas), configs.CRYPT_WORKERS):
+            passwords.extend(
+                await asyncio.gather(
+                    *(
+                        self.crypt_service.hash_async(schema.password)
+                        for schema in schemas[offset : offset + configs.CRYPT_WORKERS]
+                    )
+                )
+            )
+        users, conflicts = await self.user_repository.create_many(
+            data=[
+                {"name": schema.name, "email": schema.email, "role": Role.USER}
+                for schema in schemas
+            ]
+        )
+        skipped = set(conflicts)
+        created = [index for index in range(len(schemas)) if index not in skipped]
+        await self.repository.insert_many(
+            data=[
+                {
+                    "user_id": user.id,
+                    "provider": OAuthProvider.PASSWORD,
+                    "password": passwords[index],
+                }
+                for user, index in zip(users, created)
+            ]
+        )
+        users = await self.user_repository.read_by_ids(
+            ids=[user.id for user in users], loads={"oauth": "selectin"}
+        )
+        return self.user_mapper.many(users), conflicts
+
     @database.transactional
     async def token_password(self, schema: PasswordOAuthRequest) -> JwtToken:
         if schema.grant_type != OAuthProvider.PASSWORD.value:
             raise OAuthFormDataInvalid
-        user = await self.user_repository.read_by_email(schema.username)
+        user = await self.user_repository.read_by_email(
+            schema.username, loads={"oauth": "selectin"}
+        )
         if not user:
             raise NotRegistered
         oauth = None
@@ -357,11 +427,9 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
         if not oauth:
             # TODO: 다른 OAuth로 등록 되어 있음을 밝혀야함
             raise NotRegistered
-        if not self.crypt_service.verify(schema.password, oauth.password):
+        if not await self.crypt_service.verify_async(schema.password, oauth.password):
             raise PasswordOAuthFailed
-        jwt_token = self.jwt_service.create_token(user)
-        user.refresh_token = jwt_token.refresh_token
-        return jwt_token
+        return self._create_token(user=user)
 
     @database.transactional
     async def token_google(self, schema: GoogleOAuthRequest) -> JwtToken:
@@ -373,16 +441,28 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
         oauth_response = await self.github_service.get_token_and_user(schema=schema)
         return await self._token_oauth(oauth_response, OAuthProvider.GITHUB)
 
-    @database.transactional
     async def verify(self, schema: JwtAccessToken) -> UserOut:
+        # NOTE: 인증은 매 요청마다 호출되므로 최대 read 1회만 수행 (write, transaction 없음)
+        # principal_cache hit 시 DB 접근 없이 인증
+        # refresh token 발급은 token 발급 및 /auth/refresh에서만 수행
         user_id = int(self.jwt_service.decode(token=schema.access_token))
+        user_out = principal_cache.get(user_id)
+        if user_out is not None:
+            return user_out
+        # NOTE: 조회 중 무효화된 row는 cache하지 않으며, replica lag으로 오래된 row를 cache하지 않도록 primary에서 조회
+        version = principal_cache.version
         try:
-            user = await self.user_repository.read_by_id(id=user_id)
+            with database.primary():
+                row = await self.user_repository.read_row_by_id(
+                    id=user_id, columns=self.user_mapper.columns
+                )
         except EntityNotFound as error:
             raise NotAuthenticated from error
-        user.refresh_token = self.jwt_service.create_refresh_token(user)
-        return self.user_mapper(user)
+        user_out = self.user_mapper.construct(row)
+        principal_cache.set(user_id, user_out, version=version)
+        return user_out
 
+    @database.transactional
     async def refresh(self, schema: RefreshOAuthRequest) -> JwtToken:
         if schema.grant_type != "refresh_token":
             raise OAuthFormDataInvalid
@@ -391,9 +471,9 @@ class AuthService(BaseService[OAuth, AuthIn, AuthOut]):
             raise TokenDecodeError
         user_id = int(sub.split(".")[0])
         user = await self.user_repository.read_by_id(user_id)
-        return JwtToken(
-            access_token=self.jwt_service.create_access_token(user),
-            refresh_token=schema.refresh_token,
-            token_type="bearer",
-            expires_in=self.jwt_service.access_expire.seconds,
-        )
+        # NOTE: Rotation: 마지막으로 발급된 refresh token만 유효 (이전 token 재사용 거부)
+        if user.refresh_token is None or not compare_digest(
+            user.refresh_token, schema.refresh_token
+        ):
+            raise RefreshTokenRevoked
+        return self._create_token(user=user)
@@ -1,13 +1,31 @@
-from typing import Any, Generic, TypeVar, overload
+from collections.abc import Mapping
+from collections.abc import Sequence as SequenceABC
+from functools import cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Generic,
+    Sequence,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
 
+from pydantic import BaseModel as Schema
+from pydantic import TypeAdapter
+
+from app.core.configs import configs
 from app.core.database import database
 from app.models.base import BaseModel
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, Columns, Loads
 from app.schemas.base import BaseRequest, BaseResponse
 
 Model = TypeVar("Model", bound=BaseModel)
 Request = TypeVar("Request", bound=BaseRequest)
 Response = TypeVar("Response", bound=BaseResponse)
+S = TypeVar("S", bound=Schema)
 
 
 class BaseMapper(Generic[Model, Request, Response]):
@@ -26,8 +44,98 @@ class BaseMapper(Generic[Model, Request, Response]):
             return self.model(**data.model_dump())
         return self.schema.model_validate(data)
 
+    @property
+    def columns(self) -> Columns:
+        """``schema``를 채우는 데 필요한 ``model``의 columns (``BaseRepository.read_rows``)"""
+        return _columns(self.schema, self.model)
+
+    def construct(self, data: Model | Mapping[str, Any]) -> Response:
+        """DB에서 바로 읽은 entity / row (``BaseRepository.read_rows``)를 검증 없이 ``model_construct``로 변환한다."""
+        return _construct(self.schema, data)
+
+    def many(
+        self,
+        entities: Sequence[Model] | Sequence[Mapping[str, Any]],
+        trusted: bool = False,
+    ) -> list[Response]:
+        """
+        ``entities`` 전체를 cache된 ``TypeAdapter(list[schema])``로 한 번에 검증한다.
+
+        ``trusted``이면 DB에서 바로 읽은 entity로 간주하여 검증 없이 ``model_construct``로 생성한다.
+        (``created_at`` / ``updated_at``의 timezone 변환만 수행)
+        """
+        if trusted:
+            return [_construct(self.schema, entity) for entity in entities]
+        return _adapter(self.schema).validate_python(entities, from_attributes=True)
+
+
+@cache
+def _adapter(schema: type[Schema]) -> TypeAdapter:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+@cache
+def _fields(schema: type[Schema]) -> tuple[tuple[str, type[Schema] | None, bool], ...]:
+    """
+    Returns:
+        (field, nested schema, sequence 여부)
+    """
+    fields = []
+    for name, field in schema.model_fields.items():
+        annotation, many = field.annotation, False
+        if get_origin(annotation) in (Union, UnionType):
+            # NOTE: ``X | None``
+            args = [arg for arg in get_args(annotation) if arg is not NoneType]
+            annotation = args[0] if len(args) == 1 else annotation
+        if get_origin(annotation) in (list, SequenceABC):
+            annotation, many = get_args(annotation)[0], True
+        nested = (
+            annotation
+            if isinstance(annotation, type) and issubclass(annotation, Schema)
+            else None
+        )
+        fields.append((name, nested, many))
+    return tuple(fields)
+
+
+@cache
+def _columns(schema: type[Schema], model: type[BaseModel]) -> Columns:
+    mapper = model.__mapper__
+    fields, relations = [], {}
+    for name, nested, _ in _fields(schema):
+        if name in mapper.column_attrs:
+            fields.append(name)
+        elif nested is not None and name in mapper.relationships:
+            related: type[BaseModel] = mapper.relationships[name].mapper.class_
+            relations[name] = _columns(nested, related)
+    return tuple(fields), relations
+
+
+def _construct(schema: type[S], entity: Any) -> S:
+    values: dict[str, Any] = {}
+    row = isinstance(entity, Mapping)
+    for name, nested, many in _fields(schema):
+        # NOTE: Entity에 없는 attribute (e.g. ``refresh_token``)는 default 사용
+        if not (name in entity if row else hasattr(entity, name)):
+            continue
+        value = entity[name] if row else getattr(entity, name)
+        if nested is not None and value is not None:
+            value = (
+                [_construct(nested, item) for item in value]
+                if many
+                else _construct(nested, value)
+            )
+        values[name] = value
+    if issubclass(schema, BaseResponse):
+        values["created_at"] = values["created_at"].astimezone(configs.TZINFO)
+        values["updated_at"] = values["updated_at"].astimezone(configs.TZINFO)
+    return schema.model_construct(**values)
+
 
 class BaseService(Generic[Model, Request, Response]):
+    # NOTE: ``Response`` schema를 채우는 데 필요한 relationship loader plan (``BaseRepository._load``)
+    loads: Loads = {}
+
     def __init__(
         self, repository: BaseRepository[Model], schema: type[Response]
     ) -> None:
@@ -39,33 +147,63 @@ class BaseService(Generic[Model, Request, Response]):
     @database.transactional
     async def create(self, schema: Request) -> Response:
         entity = self.mapper(schema)
-        entity = await self.repository.create(entity=entity)
+        entity = await self.repository.create(entity=entity, loads=self.loads)
         return self.mapper(entity)
 
-    async def get_by_id(self, id: int, eager: bool = False) -> Response:
-        entity = await self.repository.read_by_id(id=id, eager=eager)
+    @database.transactional
+    async def create_many(
+        self, schemas: Sequence[Request]
+    ) -> tuple[list[Response], list[int]]:
+        """
+        Returns:
+            (생성된 schemas, 충돌로 생성되지 않은 ``schemas``의 index)
+        """
+        entities, conflicts = await self.repository.create_many(
+            data=[schema.model_dump() for schema in schemas], loads=self.loads
+        )
+        return [self.mapper(entity) for entity in entities], conflicts
+
+    async def get_by_id(
+        self, id: int, loads: Loads | None = None, core: bool = False
+    ) -> Response:
+        """
+        ``loads``: 기본값은 ``self.loads``
+        ``core``: ORM entity 없이 ``schema``에 필요한 columns만 조회한다. (read-only 응답 전용, ``loads`` 무시)
+        """
+        if core:
+            row = await self.repository.read_row_by_id(
+                id=id, columns=self.mapper.columns
+            )
+            return self.mapper.construct(row)
+        entity = await self.repository.read_by_id(
+            id=id, loads=self.loads if loads is None else loads
+        )
         return self.mapper(entity)
 
     @database.transactional
     async def put_by_id(self, id: int, schema: Request) -> Response:
-        entity = await self.repository.update_by_id(id=id, data=schema.model_dump())
+        entity = await self.repository.update_by_id(
+            id=id, data=schema.model_dump(), loads=self.loads
+        )
         return self.mapper(entity)
 
     @database.transactional
     async def patch_by_id(self, id: int, schema: Request) -> Response:
         entity = await self.repository.update_by_id(
-            id=id, data=schema.model_dump(exclude_none=True)
+            id=id, data=schema.model_dump(exclude_none=True), loads=self.loads
         )
         return self.mapper(entity)
 
     @database.transactional
     async def patch_attr_by_id(self, id: int, attr: str, value: Any) -> Response:
         entity = await self.repository.update_attr_by_id(
-            id=id, column=attr, value=value
+            id=id, column=attr, value=value, loads=self.loads
         )
         return self.mapper(entity)
 
     @database.transactional
-    async def delete_by_id(self, id: int, eager: bool = False) -> Response:
-        entity = await self.repository.delete_by_id(id=id, eager=eager)
+    async def delete_by_id(self, id: int, loads: Loads | None = None) -> Response:
+        entity = await self.repository.delete_by_id(
+            id=id, loads=self.loads if loads is None else loads
+        )
         return self.mapper(entity)
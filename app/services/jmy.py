@@ -1,38 +1,542 @@
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, AsyncIterator, Collection, Literal, Sequence
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import Row
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.analytics import Category, Counter, jmy_store
+from app.core.configs import configs
 from app.core.database import database
-from app.models.jmy import JmyCompany, JmyTimeSeries
-from app.repositories.jmy import JmyRepository
-from app.schemas.jmy import JmyCompanyOut, JmyCompanyRequest
+from app.exceptions.database import EntityNotFound
+from app.exceptions.jmy import (
+    JmyExportUnavailable,
+    JmyImportInvalid,
+    JmySeriesInvalid,
+)
+from app.models.jmy import COUNTERS, JmyCompany, JmyTimeSeries
+from app.repositories.base import Loads
+from app.repositories.jmy import (
+    JmyCompactionRepository,
+    JmyRepository,
+    JmySnapshotRepository,
+    JmySummaryRepository,
+    JmyTimeSeriesRepository,
+)
+from app.schemas.jmy import (
+    JmyAggregateOut,
+    JmyCompactionOut,
+    JmyCompanyOut,
+    JmyCompanyRequest,
+    JmyCompanyResponse,
+    JmyGrowthOut,
+    JmyImportErrorOut,
+    JmyImportOut,
+    JmySearchOut,
+    JmySeriesOut,
+    JmySeriesPoint,
+    JmySnapshotOut,
+    JmySummaryOut,
+)
 from app.services.base import BaseService
+from app.utils.search import SearchIndex
+from app.utils.streaming import arrow_ipc, csv_chunks
+
+COMPANY_FIELDS = ("name", "year", "location", "address", "type_", "size", "research")
+TIME_SERIES_FIELDS = ("date", *COUNTERS)
+# NOTE: Export column 순서 및 type (``jmy_company`` LEFT JOIN ``jmy_time_series``)
+EXPORT_COLUMNS: tuple[tuple[str, type], ...] = (
+    *(
+        (field, getattr(JmyCompany, field).type.python_type)
+        for field in ("id", *COMPANY_FIELDS)
+    ),
+    *(
+        (field, getattr(JmyTimeSeries, field).type.python_type)
+        for field in TIME_SERIES_FIELDS
+    ),
+)
+
+# NOTE: Worker process마다 startup 시 적재되며, 이후 JmyService가 생성한 company만 추가된다.
+jmy_search_index = SearchIndex(weights={"name": 1.0, "research": 0.8, "address": 0.6})
 
 
 class JmyService(BaseService[JmyCompany, JmyCompanyRequest, JmyCompanyOut]):
-    def __init__(self, jmy_repository: JmyRepository):
+    loads: Loads = {"time_series": "selectin"}
+
+    def __init__(
+        self,
+        *,
+        jmy_repository: JmyRepository,
+        jmy_time_series_repository: JmyTimeSeriesRepository,
+        jmy_summary_repository: JmySummaryRepository,
+        jmy_snapshot_repository: JmySnapshotRepository,
+        jmy_compaction_repository: JmyCompactionRepository,
+    ):
         super().__init__(repository=jmy_repository, schema=JmyCompanyOut)
         self.repository: JmyRepository
+        self.time_series_repository = jmy_time_series_repository
+        self.summary_repository = jmy_summary_repository
+        self.snapshot_repository = jmy_snapshot_repository
+        self.compaction_repository = jmy_compaction_repository
 
     @database.transactional
     async def create(self, schema: JmyCompanyRequest) -> JmyCompanyOut:
+        """
+        기존 ``time_series``를 load하지 않고 ``(company_id, date)`` 기준으로 point를 upsert한다.
+
+        Returns:
+            이번에 추가 / 갱신한 point만 ``time_series``에 포함한 ``JmyCompanyOut``
+        """
         jmy_company = await self.repository.read_by_name(name=schema.name)
         if jmy_company is None:
-            jmy_company = JmyCompany(
-                name=schema.name,
-                year=schema.year,
-                location=schema.location,
-                address=schema.address,
-                type_=schema.type_,
-                size=schema.size,
-                research=schema.research,
-            )
-        jmy_company.time_series.append(
-            JmyTimeSeries(
-                date=schema.date,
-                b_assigned=schema.b_assigned,
-                b_new=schema.b_new,
-                b_old=schema.b_old,
-                a_assigned=schema.a_assigned,
-                a_new=schema.a_new,
-                a_old=schema.a_old,
-            )
-        )
-        entity = await self.repository.create(entity=jmy_company)
-        return self.mapper(entity)
+            jmy_company = await self.repository.create(
+                entity=JmyCompany(**schema.model_dump(include=set(COMPANY_FIELDS)))
+            )
+            # NOTE: Rollback 시 index에 남지 않도록 commit 후 반영
+            database.after_commit(
+                partial(jmy_search_index.add, jmy_company.id, schema.model_dump())
+            )
+        data = {
+            "company_id": jmy_company.id,
+            **schema.model_dump(include=set(TIME_SERIES_FIELDS)),
+        }
+        deltas = await self._summary_deltas([data])
+        jmy_time_series = await self.time_series_repository.upsert(data=data)
+        await self.summary_repository.increment(deltas)
+        await self.snapshot_repository.refresh(company_ids=[jmy_company.id])
+        # NOTE: Flush 대상이 아닌 committed value로 설정하여 history를 load하지 않고 응답 구성
+        set_committed_value(jmy_company, "time_series", [jmy_time_series])
+        database.after_commit(jmy_store.mark_stale)
+        return self.mapper(jmy_company)
+
+    async def load_search_index(self) -> None:
+        start_time = time.perf_counter()
+        rows = await self.repository.read_search_fields()
+        jmy_search_index.clear()
+        jmy_search_index.extend(
+            (id, {"name": name, "address": address, "research": research})
+            for id, name, address, research in rows
+        )
+        logger.info(
+            f"[Jmy search] documents={len(jmy_search_index)}, elapsed_time={time.perf_counter() - start_time:.3f}s"
+        )
+
+    async def search(self, query: str, limit: int = 10) -> list[JmySearchOut]:
+        """``name`` / ``research`` / ``address``에 대한 trigram + prefix 검색 (score 내림차순)"""
+        matches = jmy_search_index.search(query, limit=limit)
+        jmy_companies = {
+            jmy_company.id: jmy_company
+            for jmy_company in await self.repository.read_by_ids(
+                [id for id, _ in matches]
+            )
+        }
+        return [
+            JmySearchOut(
+                **JmyCompanyResponse.model_validate(jmy_companies[id]).model_dump(),
+                score=score,
+            )
+            for id, score in matches
+        ]
+
+    async def get_series(
+        self,
+        *,
+        bucket: Literal["month", "quarter", "year"],
+        id: int | None = None,
+        name: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> JmySeriesOut:
+        """``[start, end)`` 구간의 ``time_series``를 DB에서 ``bucket`` 단위로 집계하여 조회"""
+        jmy_company: JmyCompany | None
+        if id is not None:
+            jmy_company = await self.repository.read_by_id(id)
+            if name is not None and jmy_company.name != name:
+                raise EntityNotFound
+        elif name is not None:
+            jmy_company = await self.repository.read_by_name(name)
+        else:
+            raise JmySeriesInvalid
+        if jmy_company is None:
+            raise EntityNotFound
+        tz = configs.TZINFO
+        rows = await self.time_series_repository.read_series(
+            company_id=jmy_company.id,
+            bucket=bucket,
+            start=_localize(start, tz),
+            end=_localize(end, tz),
+        )
+        company = JmyCompanyResponse.model_validate(jmy_company)
+        return JmySeriesOut(
+            **company.model_dump(),
+            bucket=bucket,
+            series=[
+                JmySeriesPoint(
+                    date=datetime(row["year"], row["month"], 1, tzinfo=tz),
+                    **{counter: row[counter] for counter in COUNTERS},
+                )
+                for row in rows
+            ],
+        )
+
+    async def get_aggregate(
+        self, *, counter: Counter, by: Category | None = None, window: int = 1
+    ) -> list[JmyAggregateOut]:
+        await jmy_store.refresh()
+        dates, labels, totals = jmy_store.frame.aggregate(
+            counter=counter, by=by, window=window
+        )
+        return [
+            JmyAggregateOut(key=label, dates=dates, values=values.tolist())
+            for label, values in zip(labels, totals)
+        ]
+
+    async def get_top_growth(
+        self,
+        *,
+        counter: Counter,
+        n: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[JmyGrowthOut]:
+        await jmy_store.refresh()
+        return [
+            JmyGrowthOut(name=name, first=first, last=last, growth=last - first)
+            for name, first, last in jmy_store.frame.top(
+                counter=counter, n=n, start=start, end=end
+            )
+        ]
+
+    async def import_rows(
+        self,
+        rows: AsyncIterator[dict[str, Any]],
+        chunk_size: int = configs.BULK_CHUNK_SIZE,
+    ) -> list[JmyImportOut]:
+        """
+        CSV / NDJSON row stream을 ``chunk_size``개씩 처리한다.
+
+        Chunk마다 독립적인 transaction으로 commit되므로, 중간에 실패하면 이전 chunk까지만 반영된다.
+        유효하지 않은 row는 ``JmyImportInvalid``의 data (``JmyImportErrorOut``)로 row 번호와 commit된 chunks를 반환한다.
+        """
+        progress: list[JmyImportOut] = []
+        chunk: list[JmyCompanyRequest] = []
+        line = 0
+        async for row in rows:
+            line += 1
+            try:
+                chunk.append(JmyCompanyRequest.model_validate(row))
+            except ValidationError as error:
+                logger.error(f"[Jmy import] line={line}, {error}")
+                raise JmyImportInvalid(
+                    JmyImportErrorOut(row=line, committed=progress)
+                ) from error
+            if chunk_size <= len(chunk):
+                progress.append(await self._import_chunk(len(progress), chunk))
+                chunk = []
+        if chunk:
+            progress.append(await self._import_chunk(len(progress), chunk))
+        return progress
+
+    async def _import_chunk(
+        self, index: int, chunk: list[JmyCompanyRequest]
+    ) -> JmyImportOut:
+        start_time = time.perf_counter()
+        companies, time_series = await self._import(chunk)
+        database.scoped_session().expunge_all()
+        progress = JmyImportOut(
+            chunk=index,
+            rows=len(chunk),
+            companies=companies,
+            time_series=time_series,
+            elapsed_time=time.perf_counter() - start_time,
+        )
+        logger.info(f"[Jmy import] {progress}")
+        return progress
+
+    @database.transactional
+    async def _import(self, chunk: list[JmyCompanyRequest]) -> tuple[int, int]:
+        ids = await self.repository.read_ids_by_names({schema.name for schema in chunk})
+        missing: dict[str, dict] = {}
+        for schema in chunk:
+            if schema.name not in ids and schema.name not in missing:
+                missing[schema.name] = schema.model_dump(include=set(COMPANY_FIELDS))
+        ids.update(await self.repository.create_ids(list(missing.values())))
+        database.after_commit(
+            partial(
+                jmy_search_index.extend,
+                [(ids[name], fields) for name, fields in missing.items()],
+            )
+        )
+        data = [
+            {
+                "company_id": ids[schema.name],
+                **schema.model_dump(include=set(TIME_SERIES_FIELDS)),
+            }
+            for schema in chunk
+        ]
+        deltas = await self._summary_deltas(data)
+        time_series = await self.time_series_repository.upsert_many(data)
+        await self.summary_repository.increment(deltas)
+        await self.snapshot_repository.refresh(
+            company_ids={row["company_id"] for row in data}
+        )
+        database.after_commit(jmy_store.mark_stale)
+        return len(missing), time_series
+
+    def export(
+        self, format: Literal["csv", "arrow"], batch_size: int = 5_000
+    ) -> AsyncIterator[bytes]:
+        """
+        전체 dataset을 ``batch_size`` row 단위의 CSV / Arrow IPC chunk로 streaming한다.
+
+        Pydantic schema 없이 row tuple을 그대로 encoding하므로 memory 사용량은 batch 크기에 비례한다.
+        """
+        batches = self._export_batches(batch_size)
+        if format == "csv":
+            return csv_chunks([field for field, _ in EXPORT_COLUMNS], batches)
+        try:
+            return arrow_ipc(EXPORT_COLUMNS, batches)
+        except ModuleNotFoundError as error:
+            raise JmyExportUnavailable from error
+
+    async def _export_batches(self, batch_size: int) -> AsyncIterator[list[tuple]]:
+        tz = configs.TZINFO
+        date = len(COMPANY_FIELDS) + 1
+        async for rows in self.repository.stream_with_time_series(
+            fields=("id", *COMPANY_FIELDS),
+            time_series_fields=TIME_SERIES_FIELDS,
+            batch_size=batch_size,
+        ):
+            yield [
+                (*row[:date], _localize(row[date], tz), *row[date + 1 :])
+                for row in rows
+            ]
+
+    async def _summary_deltas(self, data: Sequence[dict]) -> list[dict]:
+        """
+        Upsert할 point와 기존 point의 차이 (delta)를 summary row 단위로 합산한다. (upsert 전에 호출)
+
+        Returns:
+            ``JmySummaryRepository.increment``에 전달할 ``dimension``, ``key``, ``date``, ``companies``, counters rows
+        """
+        # NOTE: upsert_many와 동일하게 같은 key는 마지막 row만 반영
+        points = {(row["company_id"], row["date"]): row for row in data}
+        company_ids = {company_id for company_id, _ in points}
+        existing = {
+            (row.company_id, row.date): row
+            for row in await self.time_series_repository.read_by_keys(
+                company_ids, {date for _, date in points}
+            )
+        }
+        keys = await self.summary_repository.read_keys(company_ids)
+        deltas: dict[tuple[str, str, datetime], dict[str, int]] = {}
+        for (company_id, date), row in points.items():
+            # NOTE: Backend에 따라 조회된 datetime은 naive (저장된 wall time)일 수 있다.
+            old = existing.get((company_id, date)) or existing.get(
+                (company_id, date.replace(tzinfo=None))
+            )
+            delta = _delta(row, old)
+            if not any(delta.values()):
+                continue
+            for dimension, key in keys[company_id].items():
+                _accumulate(deltas.setdefault((dimension, key, date), {}), delta)
+        return [
+            {"dimension": dimension, "key": key, "date": date, **total}
+            for (dimension, key, date), total in deltas.items()
+        ]
+
+    async def _summarize(
+        self, company_ids: Collection[int], dates: Collection[datetime]
+    ) -> None:
+        """Write와 같은 transaction에서 영향을 받은 summary group / snapshot만 다시 집계 (compaction용)"""
+        await self.summary_repository.refresh(company_ids=company_ids, dates=dates)
+        await self.snapshot_repository.refresh(company_ids=company_ids)
+
+    async def get_summary(
+        self,
+        *,
+        dimension: Literal["location", "type"],
+        key: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[JmySummaryOut]:
+        tz = configs.TZINFO
+        summaries = await self.summary_repository.read_by_dimension(
+            dimension=dimension,
+            key=key,
+            start=_localize(start, tz),
+            end=_localize(end, tz),
+        )
+        return [JmySummaryOut.model_validate(summary) for summary in summaries]
+
+    async def get_snapshots(self) -> list[JmySnapshotOut]:
+        rows = await self.snapshot_repository.read_all_with_names()
+        return [JmySnapshotOut.model_validate(row) for row in rows]
+
+    @database.transactional
+    async def rebuild_summary(self) -> tuple[int, int]:
+        """
+        ``jmy_summary`` / ``jmy_snapshot``을 ``jmy_time_series`` 전체로부터 다시 생성한다. (backfill 용)
+
+        Returns:
+            (summary group 수, snapshot 수)
+        """
+        await self.summary_repository.delete_all()
+        await self.snapshot_repository.delete_all()
+        summaries = await self.summary_repository.refresh()
+        snapshots = await self.snapshot_repository.refresh()
+        logger.info(f"[Jmy summary] {summaries=}, {snapshots=}")
+        return summaries, snapshots
+
+    async def compact(
+        self,
+        bucket: Literal["month", "year"] | None = None,
+        horizon_days: int | None = None,
+    ) -> JmyCompactionOut:
+        """
+        Horizon 이전의 ``jmy_time_series``를 ``bucket`` 단위 row 하나로 roll-up한다.
+
+        Roll-up된 row는 bucket 시작 시각 (``configs.TZ`` 기준)에 저장되며, ``*_assigned`` / ``*_new``는 합계,
+        ``*_old`` (복무인원)는 bucket 내 마지막 point의 값을 사용한다. (``get_series``와 동일)
+        ``JMY_COMPACTION_BATCH_SIZE``개 company마다 commit하여 lock 시간을 제한하고,
+        완료 후 horizon을 watermark로 기록하여 재실행 시 watermark 이후 구간만 처리한다.
+        (Watermark 이전 날짜로 늦게 추가된 point는 roll-up되지 않는다.)
+        """
+        start_time = time.perf_counter()
+        tz = configs.TZINFO
+        bucket = bucket or configs.JMY_COMPACTION_BUCKET
+        end = _truncate(
+            datetime.now(tz)
+            - timedelta(days=horizon_days or configs.JMY_COMPACTION_HORIZON_DAYS),
+            bucket,
+        )
+        start = _localize(await self.compaction_repository.read_watermark(bucket), tz)
+        companies = points = deleted = 0
+        after = None
+        while start is None or start < end:
+            company_ids = await self.time_series_repository.read_company_ids(
+                start=start,
+                end=end,
+                after=after,
+                limit=configs.JMY_COMPACTION_BATCH_SIZE,
+            )
+            if len(company_ids) == 0:
+                await self._set_watermark(bucket, end)
+                break
+            rolled, removed = await self._compact(company_ids, bucket, start, end)
+            companies += len(company_ids)
+            points += rolled
+            deleted += removed
+            after = company_ids[-1]
+        if points:
+            await jmy_store.load()
+        progress = JmyCompactionOut(
+            bucket=bucket,
+            start=start,
+            end=end,
+            companies=companies,
+            points=points,
+            deleted=deleted,
+            elapsed_time=time.perf_counter() - start_time,
+        )
+        logger.info(f"[Jmy compaction] {progress}")
+        return progress
+
+    @database.transactional
+    async def _compact(
+        self,
+        company_ids: Sequence[int],
+        bucket: Literal["month", "year"],
+        start: datetime | None,
+        end: datetime,
+    ) -> tuple[int, int]:
+        """
+        Returns:
+            (roll-up된 row 수, 삭제된 point 수)
+        """
+        tz = configs.TZINFO
+        groups: defaultdict[tuple[int, datetime], list[Row[Any]]] = defaultdict(list)
+        for point in await self.time_series_repository.read_points(
+            company_ids, start, end
+        ):
+            date = _localize(point.date, tz)
+            assert date is not None
+            groups[(point.company_id, _truncate(date, bucket))].append(point)
+        rows: list[dict] = []
+        ids: list[int] = []
+        dates: set[datetime] = set()
+        for (company_id, date), group in groups.items():
+            # NOTE: 이미 bucket 시작 시각의 단일 row이면 생략 (재실행 시 no-op)
+            if len(group) == 1 and _localize(group[0].date, tz) == date:
+                continue
+            rows.append(_rollup(company_id, date, group))
+            # NOTE: Bucket 시작 시각의 기존 point는 upsert로 덮어쓴다.
+            ids.extend(point.id for point in group if _localize(point.date, tz) != date)
+            dates.add(date)
+            dates.update(point.date for point in group)
+        if len(rows) == 0:
+            return 0, 0
+        deleted = await self.time_series_repository.delete_by_ids(ids)
+        await self.time_series_repository.upsert_many(rows)
+        await self.summary_repository.delete_groups(
+            company_ids=company_ids, dates=dates
+        )
+        await self._summarize(company_ids=company_ids, dates=dates)
+        return len(rows), deleted
+
+    @database.transactional
+    async def _set_watermark(self, bucket: str, watermark: datetime) -> None:
+        await self.compaction_repository.upsert_many(
+            [{"bucket": bucket, "watermark": watermark}]
+        )
+
+
+def _rollup(company_id: int, date: datetime, points: Sequence[Row[Any]]) -> dict:
+    return {
+        "company_id": company_id,
+        "date": date,
+        **{
+            counter: (
+                getattr(points[-1], counter)
+                if counter.endswith("_old")
+                else sum(getattr(point, counter) for point in points)
+            )
+            for counter in COUNTERS
+        },
+    }
+
+
+def _truncate(value: datetime, bucket: Literal["month", "year"]) -> datetime:
+    value = value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if bucket == "year":
+        return value.replace(month=1)
+    return value
+
+
+def _delta(row: dict, old: Row[Any] | None) -> dict[str, int]:
+    """``old`` point (없으면 신규)를 ``row``로 upsert할 때의 ``companies`` / counters 변화량"""
+    if old is None:
+        return {"companies": 1, **{counter: row[counter] for counter in COUNTERS}}
+    return {
+        "companies": 0,
+        **{counter: row[counter] - getattr(old, counter) for counter in COUNTERS},
+    }
+
+
+def _accumulate(total: dict[str, int], delta: dict[str, int]) -> None:
+    for field, value in delta.items():
+        total[field] = total.get(field, 0) + value
+
+
+def _localize(value: datetime | None, tz: ZoneInfo) -> datetime | None:
+    # NOTE: Timezone 정보를 저장하지 않는 backend (SQLite 등)는 configs.TZ 기준 wall time으로 비교
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=tz)
+    return value.astimezone(tz)
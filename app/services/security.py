@@ -1,7 +1,66 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal, TypeVar
+
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
 
-from app.exceptions.auth import PasswordOAuthFailed
+from app.core.configs import configs
+from app.exceptions.auth import CryptServiceBusy, PasswordOAuthFailed
+
+T = TypeVar("T")
+
+
+class CryptExecutor:
+    """
+    bcrypt 연산을 event loop 밖의 bounded pool에서 실행한다.
+
+    실행 중 + 대기 중인 작업이 ``workers + queue_size``를 넘으면 대기하지 않고 즉시 ``CryptServiceBusy``를 발생시킨다.
+    """
+
+    def __init__(
+        self, *, pool: Literal["thread", "process"], workers: int, queue_size: int
+    ) -> None:
+        self.pool = pool
+        self.workers = workers
+        self.queue_size = queue_size
+        self.pending = 0
+        self.executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            if self.pool == "process":
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                # NOTE: bcrypt는 hashing 중 GIL을 해제하므로 thread pool로 충분
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="crypt"
+                )
+        return self.executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.workers + self.queue_size <= self.pending:
+            raise CryptServiceBusy
+        executor = self._get_executor()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, func, *args
+            )
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+crypt_executor = CryptExecutor(
+    pool=configs.CRYPT_POOL,
+    workers=configs.CRYPT_WORKERS,
+    queue_size=configs.CRYPT_QUEUE_SIZE,
+)
 
 
 class CryptService(CryptContext):
@@ -17,3 +76,21 @@ class CryptService(CryptContext):
         except UnknownHashError as error:
             # TODO: 언제 UnknownHashError가 발생하는지 확인
             raise PasswordOAuthFailed from error
+
+    async def hash_async(self, secret: str) -> str:
+        return await crypt_executor.run(_hash, secret)
+
+    async def verify_async(self, secret: str, hash: str) -> bool:
+        return await crypt_executor.run(_verify, secret, hash)
+
+
+# NOTE: ProcessPoolExecutor에서 pickle 가능하도록 module level에 정의
+_crypt_service = CryptService()
+
+
+def _hash(secret: str) -> str:
+    return _crypt_service.hash(secret)
+
+
+def _verify(secret: str, hash: str) -> bool:
+    return _crypt_service.verify(secret, hash)
@@ -1,17 +1,65 @@
+from functools import partial
+from typing import Any, AsyncIterator
+
+from app.core.cache import principal_cache
+from app.core.database import database
 from app.models.users import User
+from app.repositories.base import Loads
 from app.repositories.users import UserRepository
-from app.schemas.users import UserIn, UserOut
+from app.schemas.users import UserIn, UserOut, UserRequest
 from app.services.base import BaseService
 
 
 class UserService(BaseService[User, UserIn, UserOut]):
+    loads: Loads = {"oauth": "selectin"}
+
     def __init__(self, user_repository: UserRepository):
         super().__init__(repository=user_repository, schema=UserOut)
         self.repository: UserRepository
 
     async def get_all(self) -> list[UserOut]:
-        users = await self.repository.read_all()
-        schemas = []
-        for user in users:
-            schemas.append(self.mapper(user))
-        return schemas
+        users = await self.repository.read_all(loads=self.loads)
+        return self.mapper.many(users, trusted=True)
+
+    async def get_page(
+        self, limit: int, after: int | None = None
+    ) -> tuple[list[UserOut], int | None]:
+        """
+        Returns:
+            (users, next cursor): 다음 page가 없다면 cursor는 ``None``
+        """
+        users = await self.repository.read_page(
+            limit=limit + 1, after=after, loads=self.loads
+        )
+        schemas = self.mapper.many(users[:limit], trusted=True)
+        if limit < len(users):
+            return schemas, schemas[-1].id
+        return schemas, None
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[UserOut]:
+        async for user in self.repository.stream_all(
+            batch_size=batch_size, loads=self.loads
+        ):
+            yield self.mapper(user)
+
+    # NOTE: 사용자 변경 시 인증 cache (principal_cache)를 commit 후 무효화 (AuthService와 동일)
+
+    async def put_by_id(self, id: int, schema: UserRequest) -> UserOut:
+        user = await super().put_by_id(id=id, schema=schema)
+        database.after_commit(partial(principal_cache.pop, id))
+        return user
+
+    async def patch_by_id(self, id: int, schema: UserRequest) -> UserOut:
+        user = await super().patch_by_id(id=id, schema=schema)
+        database.after_commit(partial(principal_cache.pop, id))
+        return user
+
+    async def patch_attr_by_id(self, id: int, attr: str, value: Any) -> UserOut:
+        user = await super().patch_attr_by_id(id=id, attr=attr, value=value)
+        database.after_commit(partial(principal_cache.pop, id))
+        return user
+
+    async def delete_by_id(self, id: int, loads: Loads | None = None) -> UserOut:
+        user = await super().delete_by_id(id=id, loads=loads)
+        database.after_commit(partial(principal_cache.pop, id))
+        return user
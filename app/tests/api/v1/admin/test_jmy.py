@@ -0,0 +1,336 @@
+from csv import DictReader
+from datetime import datetime
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+import pytest
+from faker import Faker
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.core.configs import configs
+from app.schemas.jmy import JmyCompanyRequest
+from app.tests.api.v1.admin.test_users import log_in_admin
+
+fake = Faker()
+
+
+def get_mock_jmy(name: str, month: int) -> JmyCompanyRequest:
+    return JmyCompanyRequest(
+        name=name,
+        year=2020,
+        location="서울청",
+        address=fake.address().replace("\n", " "),
+        type_="정보처리",
+        size="중소기업",
+        research="AI",
+        date=datetime(2024, month, 1, tzinfo=ZoneInfo(configs.TZ)),
+        b_assigned=fake.random_int(0, 10),
+        b_new=fake.random_int(0, 10),
+        b_old=fake.random_int(0, 10),
+        a_assigned=fake.random_int(0, 10),
+        a_new=fake.random_int(0, 10),
+        a_old=fake.random_int(0, 10),
+    )
+
+
+def test_import_jmy(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    names = [fake.company() for _ in range(2)]
+    rows = [get_mock_jmy(name, month) for month in range(1, 4) for name in names]
+    fields = list(JmyCompanyRequest.model_fields)
+    csv = ",".join(fields) + "\n"
+    for row in rows:
+        values = row.model_dump(mode="json")
+        csv += ",".join(f'"{values[field]}"' for field in fields) + "\n"
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=csv",
+        headers={**headers, "Content-Type": "text/csv"},
+        content=csv.encode(),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()["data"]
+    assert sum(progress["rows"] for progress in data) == len(rows)
+    assert sum(progress["companies"] for progress in data) == len(names)
+    assert sum(progress["time_series"] for progress in data) == len(rows)
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+        content=b"\n".join(
+            get_mock_jmy(name, 4).model_dump_json().encode() for name in names
+        ),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()["data"]
+    assert sum(progress["companies"] for progress in data) == 0
+    assert sum(progress["time_series"] for progress in data) == len(names)
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy",
+        headers=headers,
+        json=get_mock_jmy(names[0], 5).model_dump(mode="json"),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["name"] == names[0]
+    assert len(data["time_series"]) == 1
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy",
+        headers=headers,
+        json=get_mock_jmy(fake.company(), 1).model_dump(mode="json"),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["data"]["time_series"]) == 1
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b'{"name": "invalid"}',
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["data"] == {"row": 1, "committed": []}
+
+
+def test_search_jmy(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    schema = get_mock_jmy(f"Searchable {fake.company()}", 1)
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy",
+        headers=headers,
+        json=schema.model_dump(mode="json"),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    id = response.json()["data"]["id"]
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/search",
+        headers=headers,
+        params={"q": schema.name.lower(), "limit": 100},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data[0]["id"] == id
+    assert data[0]["name"] == schema.name
+    assert [item["score"] for item in data] == sorted(
+        (item["score"] for item in data), reverse=True
+    )
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/search", headers=headers, params={"q": ""}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_export_jmy(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    name = fake.company()
+    schemas = [get_mock_jmy(name, month) for month in range(1, 4)]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b"\n".join(schema.model_dump_json().encode() for schema in schemas),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = sync_client.get(f"{configs.PREFIX}/v1/jmy/export", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = [row for row in DictReader(StringIO(response.text)) if row["name"] == name]
+    fields = {"date", "b_assigned", "b_new", "b_old", "a_assigned", "a_new", "a_old"}
+    assert [
+        JmyCompanyRequest.model_validate(row).model_dump(include=fields) for row in rows
+    ] == [schema.model_dump(include=fields) for schema in schemas]
+    pa = pytest.importorskip("pyarrow")
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/export", headers=headers, params={"format": "arrow"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    table = pa.ipc.open_stream(response.content).read_all()
+    values = [row for row in table.to_pylist() if row["name"] == name]
+    assert [row["date"] for row in values] == [schema.date for schema in schemas]
+    assert [row["a_old"] for row in values] == [schema.a_old for schema in schemas]
+
+
+def test_compact_jmy(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    name = fake.company()
+    tz = ZoneInfo(configs.TZ)
+    schemas = [
+        get_mock_jmy(name, 1).model_copy(
+            update={"date": datetime(2000, *date, tzinfo=tz)}
+        )
+        for date in ((1, 1), (1, 15), (2, 1), (2, 20))
+    ]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b"\n".join(schema.model_dump_json().encode() for schema in schemas),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    series = {}
+    for bucket in ("month", "year"):
+        response = sync_client.get(
+            f"{configs.PREFIX}/v1/jmy/series",
+            headers=headers,
+            params={"name": name, "bucket": bucket},
+        )
+        series[bucket] = response.json()["data"]["series"]
+    # NOTE: 2001-01-01 이전의 point만 compaction 대상
+    horizon_days = (datetime.now(tz) - datetime(2001, 1, 2, tzinfo=tz)).days
+    for bucket, points, deleted in (("month", 2, 2), ("month", 0, 0), ("year", 1, 1)):
+        response = sync_client.post(
+            f"{configs.PREFIX}/v1/jmy/compact",
+            headers=headers,
+            params={"bucket": bucket, "horizon_days": horizon_days},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["end"][:10] == "2001-01-01"
+        assert (data["points"], data["deleted"]) == (points, deleted)
+        response = sync_client.get(
+            f"{configs.PREFIX}/v1/jmy/series",
+            headers=headers,
+            params={"name": name, "bucket": bucket},
+        )
+        assert response.json()["data"]["series"] == series[bucket]
+    response = sync_client.get(f"{configs.PREFIX}/v1/jmy/export", headers=headers)
+    rows = [row for row in DictReader(StringIO(response.text)) if row["name"] == name]
+    assert len(rows) == 1
+
+
+def test_get_jmy_series(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    name = fake.company()
+    schemas = [get_mock_jmy(name, month) for month in range(1, 13)]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b"\n".join(schema.model_dump_json().encode() for schema in schemas),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/series",
+        headers=headers,
+        params={"name": name, "bucket": "quarter"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["name"] == name
+    assert [point["date"][:10] for point in data["series"]] == [
+        "2024-01-01",
+        "2024-04-01",
+        "2024-07-01",
+        "2024-10-01",
+    ]
+    for point, quarter in zip(data["series"], range(0, 12, 3)):
+        months = schemas[quarter : quarter + 3]
+        assert point["b_assigned"] == sum(schema.b_assigned for schema in months)
+        assert point["a_new"] == sum(schema.a_new for schema in months)
+        assert point["a_old"] == months[-1].a_old
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/series",
+        headers=headers,
+        params={
+            "id": data["id"],
+            "bucket": "year",
+            "from": "2024-03-01T00:00:00+09:00",
+            "to": "2024-06-01T00:00:00+09:00",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    series = response.json()["data"]["series"]
+    assert len(series) == 1
+    assert series[0]["b_new"] == sum(schema.b_new for schema in schemas[2:5])
+    assert series[0]["b_old"] == schemas[4].b_old
+    response = sync_client.get(f"{configs.PREFIX}/v1/jmy/series", headers=headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/series",
+        headers=headers,
+        params={"name": fake.company() + " (missing)"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_jmy_series_month_boundary(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    name = fake.company()
+    tz = ZoneInfo(configs.TZ)
+    schemas = [
+        get_mock_jmy(name, 3).model_copy(
+            update={"date": datetime(2024, 3, 31, 23, 59, tzinfo=tz)}
+        ),
+        get_mock_jmy(name, 4),
+    ]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b"\n".join(schema.model_dump_json().encode() for schema in schemas),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/series",
+        headers=headers,
+        params={
+            "name": name,
+            "bucket": "month",
+            "from": "2024-04-01T00:00:00+09:00",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    series = response.json()["data"]["series"]
+    assert [point["date"][:10] for point in series] == ["2024-04-01"]
+    assert series[0]["b_new"] == schemas[1].b_new
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/series",
+        headers=headers,
+        params={"name": name, "bucket": "month"},
+    )
+    series = response.json()["data"]["series"]
+    assert [point["date"][:10] for point in series] == ["2024-03-01", "2024-04-01"]
+    assert [point["b_old"] for point in series] == [
+        schemas[0].b_old,
+        schemas[1].b_old,
+    ]
+
+
+def test_get_jmy_analytics(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    location = f"{fake.city()}청"
+    schemas = [
+        get_mock_jmy(name, month).model_copy(update={"location": location})
+        for name in (fake.company(), fake.company())
+        for month in range(1, 4)
+    ]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/jmy/import?format=ndjson",
+        headers=headers,
+        content=b"\n".join(schema.model_dump_json().encode() for schema in schemas),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/analytics/aggregate",
+        headers=headers,
+        params={"counter": "a_assigned", "by": "location"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    (aggregate,) = [data for data in response.json()["data"] if data["key"] == location]
+    totals = dict(zip((date[:7] for date in aggregate["dates"]), aggregate["values"]))
+    for month in range(1, 4):
+        assert totals[f"2024-{month:02d}"] == sum(
+            schema.a_assigned for schema in schemas if schema.date.month == month
+        )
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/jmy/analytics/top",
+        headers=headers,
+        params={"counter": "a_old", "n": 1000},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    growth = {data["name"]: data["growth"] for data in response.json()["data"]}
+    for schema in schemas[::3]:
+        assert (
+            growth[schema.name]
+            == schemas[schemas.index(schema) + 2].a_old - schema.a_old
+        )
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from faker import Faker
 from fastapi import status
@@ -5,9 +7,9 @@ from fastapi.testclient import TestClient
 from loguru import logger
 
 from app.core.configs import configs
-from app.models.enums import OAuthProvider
+from app.models.enums import OAuthProvider, Role
 from app.schemas.auth import PasswordOAuthReigsterRequest
-from app.schemas.users import UserPasswordAdminRequest, UserRequest
+from app.schemas.users import UserBulkRequest, UserPasswordAdminRequest, UserRequest
 from app.tests.api.v1.test_auth import MockUser, register_and_log_in
 
 fake = Faker()
@@ -64,6 +66,90 @@ def test_get_user_name(sync_client: TestClient) -> None:
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+def test_metrics(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    for _ in range(2):
+        response = sync_client.get(f"{configs.PREFIX}/v1/user/1", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+    response = sync_client.get(f"{configs.PREFIX}/v1/metrics", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert 0 < response.json()["principal_cache"]["hits"]
+    assert 0 < response.json()["compiled_cache"]["hits"]
+    assert set(response.json()["pools"]) == {"auth", "user", "admin", "batch"}
+
+
+def test_get_users_page(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    for _ in range(3):
+        register_and_log_in(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    response = sync_client.get(f"{configs.PREFIX}/v1/user?limit=2", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    page = [user["id"] for user in response.json()["data"]]
+    assert len(page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == str(page[-1])
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/user?limit=2&after={cursor}", headers=headers
+    )
+    assert page[-1] < response.json()["data"][0]["id"]
+    response = sync_client.get(f"{configs.PREFIX}/v1/user?limit=1000", headers=headers)
+    users = response.json()["data"]
+    assert "X-Next-Cursor" not in response.headers
+    response = sync_client.get(f"{configs.PREFIX}/v1/user/stream", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [user["id"] for user in users]
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/user/stream?format=json", headers=headers
+    )
+    assert response.json() == users
+
+
+def test_create_users(sync_client: TestClient) -> None:
+    _, admin_access_token = log_in_admin(sync_client)
+    headers = {"Authorization": f"Bearer {admin_access_token}"}
+    users = [
+        UserBulkRequest(name=fake.name(), email=fake.email(), password=fake.password())
+        for _ in range(3)
+    ]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/user/bulk",
+        headers=headers,
+        json=[user.model_dump() for user in users + users[:1]]
+        + [
+            {
+                **users[1].model_dump(),
+                "name": fake.name(),
+                "email": fake.email(),
+                "role": Role.ADMIN.value,
+            }
+        ],
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()["data"]
+    assert [user["email"] for user in data[:3]] == [user.email for user in users]
+    assert {user["role"] for user in data} == {Role.USER.value}
+    assert all(user["oauth"][0]["provider"] == "password" for user in data)
+    assert response.headers["X-Conflicts"] == "3"
+    MockUser(
+        sync_client=sync_client,
+        request=PasswordOAuthReigsterRequest(
+            grant_type=OAuthProvider.PASSWORD.value,
+            username=users[0].email,
+            password=users[0].password,
+            name=users[0].name,
+        ),
+    ).log_in()
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/user/bulk",
+        headers=headers,
+        json=[users[0].model_dump()] * (configs.USER_BULK_MAX_SIZE + 1),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 def test_patch_user_password(sync_client: TestClient) -> None:
     _, admin_access_token = log_in_admin(sync_client)
     mock_user, user_access_token = register_and_log_in(sync_client)
@@ -98,3 +98,38 @@ def test_register_and_log_in(sync_client: TestClient):
         data=mock_user.request.model_dump(),
     )
     assert response.status_code == 409
+
+
+def test_refresh(sync_client: TestClient):
+    mock_user, access_token = register_and_log_in(sync_client)
+    user_id = mock_user.get_me(access_token)
+    request = PasswordOAuthRequest.model_validate(mock_user.request.model_dump())
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/auth/password/token",
+        headers=mock_user.headers,
+        data=request.model_dump(),
+    )
+    refresh_token = response.json()["refresh_token"]
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/auth/refresh",
+        headers=mock_user.headers,
+        data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    )
+    logger.warning(response)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["refresh_token"]
+    assert mock_user.get_me(data["access_token"]) == user_id
+    # NOTE: 교체된 refresh token은 재사용할 수 없다.
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/auth/refresh",
+        headers=mock_user.headers,
+        data={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = sync_client.post(
+        f"{configs.PREFIX}/v1/auth/refresh",
+        headers=mock_user.headers,
+        data={"grant_type": "refresh_token", "refresh_token": data["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
@@ -24,6 +24,11 @@ def test_put_user(sync_client: TestClient) -> None:
     data = response.json()["data"]
     assert data["name"] != mock_user.request.name
     assert data["name"] == request.name
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/auth/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.json()["data"]["name"] == request.name
 
 
 def test_patch_user(sync_client: TestClient) -> None:
@@ -55,3 +60,8 @@ def test_delete_user(sync_client: TestClient) -> None:
     data = response.json()["data"]
     assert data["name"] == mock_user.request.name
     assert data["email"] == mock_user.request.username
+    response = sync_client.get(
+        f"{configs.PREFIX}/v1/auth/me",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,7 +1,6 @@
 from collections.abc import Generator
 from contextvars import Token
 from typing import AsyncGenerator
-from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
@@ -21,10 +20,11 @@ def anyio_backend():
 
 @pytest.fixture(scope="function")
 async def context() -> AsyncGenerator[Token, None]:
-    _context = database.context.set(session_id=hash(uuid4()))
+    _context = database.context.set()
     yield _context
+    await database.remove()
     # NOTE: PyTest 시 event loop 충돌 발생 (related: #19)
-    await database.engine.dispose()
+    await database.dispose()
     database.context.reset(context=_context)
 
 
@@ -0,0 +1,81 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.core.analytics import JmyFrame
+from app.core.configs import configs
+
+tz = ZoneInfo(configs.TZ)
+now = datetime.now(tz)
+
+
+def get_frame() -> JmyFrame:
+    frame = JmyFrame()
+    frame.extend_companies(
+        [
+            (1, "A", "서울청", "정보처리", "중소기업", now),
+            (2, "B", "서울청", "제조", "중견기업", now),
+            (3, "C", "부산청", "정보처리", "중소기업", now),
+        ]
+    )
+    frame.extend_points(
+        [
+            (
+                id,
+                datetime(2024, month, 1, tzinfo=tz),
+                0,
+                0,
+                0,
+                id * month,
+                0,
+                id * 10 + month**id,
+                now,
+            )
+            for id in (1, 2, 3)
+            for month in range(1, 5)
+        ]
+    )
+    return frame
+
+
+def test_jmy_frame_aggregate() -> None:
+    frame = get_frame()
+    dates, labels, totals = frame.aggregate(counter="a_assigned", by="location")
+    assert [date.month for date in dates] == [1, 2, 3, 4]
+    assert labels == ["서울청", "부산청"]
+    assert totals.tolist() == [[3, 6, 9, 12], [3, 6, 9, 12]]
+    _, labels, totals = frame.aggregate(counter="a_assigned", window=2)
+    assert labels == ["all"]
+    assert totals.tolist() == [[6, 9, 15, 21]]
+
+
+def test_jmy_frame_top() -> None:
+    frame = get_frame()
+    assert frame.top(counter="a_old", n=2) == [("C", 31, 94), ("B", 21, 36)]
+    assert frame.top(
+        counter="a_old",
+        n=1,
+        start=datetime(2024, 2, 1, tzinfo=tz),
+        end=datetime(2024, 4, 1, tzinfo=tz),
+    ) == [("C", 38, 57)]
+    # NOTE: 동일 (company, date) point는 덮어쓴다.
+    frame.extend_points(
+        [(1, datetime(2024, 4, 1, tzinfo=tz), 0, 0, 0, 0, 0, 1000, now)]
+    )
+    assert len(frame) == 12
+    assert frame.top(counter="a_old", n=1) == [("A", 11, 1000)]
+
+
+def test_jmy_frame_dates() -> None:
+    frame = get_frame()
+    # NOTE: 같은 월의 다른 date는 별도 point로 유지하고, 월 bucket은 aggregate에서만 나눈다.
+    skipped = frame.extend_points(
+        [
+            (1, datetime(2024, 4, 15, tzinfo=tz), 0, 0, 0, 100, 0, 500, now),
+            (4, datetime(2024, 4, 15, tzinfo=tz), 0, 0, 0, 100, 0, 500, now),
+        ]
+    )
+    assert [point[0] for point in skipped] == [4]
+    assert len(frame) == 13
+    _, _, totals = frame.aggregate(counter="a_assigned")
+    assert totals.tolist() == [[6, 12, 18, 124]]
+    assert frame.top(counter="a_old", n=1) == [("A", 11, 500)]
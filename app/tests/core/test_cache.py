@@ -0,0 +1,36 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_lru() -> None:
+    cache = TTLCache[int, str](maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+    cache.pop(3)
+    assert cache.get(3) is None
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_ttl_cache_expire() -> None:
+    cache = TTLCache[int, str](maxsize=2, ttl=0.01)
+    cache.set(1, "a")
+    time.sleep(0.02)
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_version() -> None:
+    cache = TTLCache[int, str](maxsize=2, ttl=60)
+    version = cache.version
+    cache.pop(1)
+    # NOTE: 조회 이후 무효화되었다면 저장하지 않는다.
+    cache.set(1, "stale", version=version)
+    assert cache.get(1) is None
+    cache.set(1, "a", version=cache.version)
+    assert cache.get(1) == "a"
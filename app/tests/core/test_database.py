@@ -0,0 +1,140 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import StaticPool, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.configs import configs
+from app.core.database import Database
+from app.models.base import BaseModel
+from app.models.enums import Role
+from app.models.users import User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(name="replicated")
+async def fixture_replicated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[Database, None]:
+    """Primary / replica sqlite file: replica에는 write가 복제되지 않는다. (무한한 replica lag)"""
+    monkeypatch.setattr(configs, "DB_NAME", str(tmp_path / "primary.db"))
+    monkeypatch.setattr(
+        configs,
+        "DB_REPLICA_URIS",
+        [f"{configs.DB_SCHEME}:///{tmp_path / 'replica.db'}"],
+    )
+    database = Database()
+    for engine in (database.engine, *database.replicas["user"]):
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all)
+    context = database.context.set()
+    yield database
+    await database.remove()
+    database.context.reset(context)
+    await database.dispose()
+
+
+async def count_users(database: Database) -> int:
+    return (
+        await database.scoped_session().scalar(select(func.count()).select_from(User))
+        or 0
+    )
+
+
+async def test_replica_routing(replicated: Database) -> None:
+    @replicated.transactional
+    async def create_user() -> None:
+        replicated.scoped_session().add(
+            User(name="replica", email="replica@zerohertz.xyz", role=Role.USER)
+        )
+
+    primary = replicated.engine.sync_engine
+    replica = replicated.replicas["user"][0].sync_engine
+    session = replicated.scoped_session()
+    assert session.sync_session.get_bind(clause=select(User)) is replica
+    assert await count_users(replicated) == 0
+    await create_user()
+    # NOTE: 같은 request에서 write 이후의 read는 primary
+    assert session.sync_session.get_bind(clause=select(User)) is primary
+    assert await count_users(replicated) == 1
+    # NOTE: 새 request의 read는 (아직 복제되지 않은) replica
+    await replicated.remove()
+    session = replicated.scoped_session()
+    assert session.sync_session.get_bind(clause=select(User)) is replica
+    assert await count_users(replicated) == 0
+    session.add(User(name="flush", email="flush@zerohertz.xyz", role=Role.USER))
+    await session.flush()
+    assert await count_users(replicated) == 2
+    await session.commit()
+
+
+async def test_pool_routing(replicated: Database) -> None:
+    # NOTE: SQLite는 모든 pool이 하나의 engine을 공유하므로 admin pool만 별도 engine으로 교체
+    admin = create_async_engine(replicated.engine.url, poolclass=StaticPool)
+    replicated.engines["admin"] = admin
+    try:
+        session = replicated.scoped_session()
+        session.info["primary"] = True
+        assert session.sync_session.get_bind(clause=select(User)) is (
+            replicated.engine.sync_engine
+        )
+        assert await count_users(replicated) == 0
+        replicated.use("admin")
+        assert session.sync_session.get_bind(clause=select(User)) is admin.sync_engine
+        assert await count_users(replicated) == 0
+        # NOTE: 새 session도 request의 pool을 사용
+        await replicated.remove()
+        session = replicated.scoped_session()
+        assert session.info["pool"] == "admin"
+    finally:
+        await replicated.remove()
+        await admin.dispose()
+
+
+async def test_after_commit(replicated: Database) -> None:
+    calls: list[str] = []
+
+    @replicated.transactional
+    async def commit() -> None:
+        replicated.after_commit(lambda: calls.append("commit"))
+        assert not calls
+
+    @replicated.transactional
+    async def rollback() -> None:
+        replicated.after_commit(lambda: calls.append("rollback"))
+        raise ValueError
+
+    await commit()
+    assert calls == ["commit"]
+    with pytest.raises(ValueError):
+        await rollback()
+    assert calls == ["commit"]
+    await replicated.remove()
+    session = replicated.scoped_session()
+    with replicated.primary():
+        assert session.sync_session.get_bind(clause=select(User)) is (
+            replicated.engine.sync_engine
+        )
+    assert session.sync_session.get_bind(clause=select(User)) is (
+        replicated.replicas["user"][0].sync_engine
+    )
+
+
+async def test_transactional_commits_autobegun(replicated: Database) -> None:
+    @replicated.transactional
+    async def create(name: str) -> None:
+        replicated.scoped_session().add(
+            User(name=name, email=f"{name}@zerohertz.xyz", role=Role.USER)
+        )
+
+    session = replicated.scoped_session()
+    assert await count_users(replicated) == 0
+    assert session.in_transaction()
+    # NOTE: autobegin된 transaction은 pending 변경과 함께 commit된 뒤 새 transaction에서 실행된다.
+    session.add(User(name="outside", email="outside@zerohertz.xyz", role=Role.USER))
+    await create("inside")
+    await replicated.remove()
+    with replicated.primary():
+        assert await count_users(replicated) == 2
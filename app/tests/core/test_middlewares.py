@@ -0,0 +1,58 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.database import database
+from app.core.middlewares import LoggingMiddleware, SessionMiddleware
+
+
+def test_session_middleware() -> None:
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware)
+
+    @app.get("/lazy")
+    async def lazy() -> bool:
+        return database.context.get().session is None
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        await database.scoped_session().execute(text("SELECT 1"))
+        session_scope = database.context.get()
+
+        async def body():
+            yield str(session_scope.session is None).encode()
+
+        return StreamingResponse(body())
+
+    with TestClient(app) as client:
+        assert client.get("/lazy").json() is True
+        assert client.get("/stream").text == "True"
+
+
+@pytest.mark.parametrize("level", ["INFO", "TRACE"])
+def test_logging_middleware(level: str) -> None:
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, log_level=logger.level(level).no)
+
+    @app.post("/error")
+    async def error(request: Request) -> None:
+        await request.body()
+        raise RuntimeError
+
+    messages: list[str] = []
+    sink = logger.add(messages.append, level=level)
+    try:
+        with TestClient(app, raise_server_exceptions=False) as client:
+            response = client.post("/error", content=b"payload")
+    finally:
+        logger.remove(sink)
+    assert response.status_code == 500
+    # NOTE: 예외가 발생한 요청도 종료 log를 남긴다.
+    assert any("[Status: " in message and "500" in message for message in messages)
+    # NOTE: Request body는 log level이 TRACE 이하일 때만 기록
+    assert any("body=b'payload'" in message for message in messages) == (
+        level == "TRACE"
+    )
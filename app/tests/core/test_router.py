@@ -0,0 +1,27 @@
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.core.router import CoreAPIRouter
+
+
+class Item(BaseModel):
+    name: str
+
+
+async def test_response_class() -> None:
+    router = CoreAPIRouter()
+
+    @router.get(
+        "/items",
+        response_model=list[Item],
+        response_class=ORJSONResponse,
+        status_code=status.HTTP_200_OK,
+    )
+    async def items() -> list[Item]:
+        return [Item(name="jmy")]
+
+    response = await items()
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == status.HTTP_200_OK
+    assert b'"data":[{"name":"jmy"}]' in response.body
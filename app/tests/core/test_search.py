@@ -0,0 +1,42 @@
+from app.utils.search import SearchIndex, trigrams
+
+
+def get_index() -> SearchIndex:
+    index = SearchIndex(weights={"name": 1.0, "address": 0.5})
+    index.extend(
+        [
+            (1, {"name": "Zeroone AI", "address": "서울특별시 강남구"}),
+            (2, {"name": "Zerotwo Robotics", "address": "부산광역시 해운대구"}),
+            (3, {"name": "Samsung Electronics", "address": None}),
+        ]
+    )
+    return index
+
+
+def test_trigrams() -> None:
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("") == set()
+
+
+def test_search() -> None:
+    index = get_index()
+    assert {id for id, _ in index.search("zero")} == {1, 2}
+    assert index.search("zeroone")[0][0] == 1
+    assert index.search("Samsnug")[0][0] == 3
+    assert [id for id, _ in index.search("해운대")] == [2]
+    assert index.search("zero", limit=1)[0][0] in {1, 2}
+    assert not index.search("???")
+    scores = dict(index.search("강남"))
+    assert set(scores) == {1} and scores[1] <= 0.5
+
+
+def test_search_update() -> None:
+    index = get_index()
+    index.add(1, {"name": "Oneone Bio"})
+    assert 1 not in dict(index.search("zeroone"))
+    assert index.search("oneo")[0][0] == 1
+    index.remove(2)
+    assert not index.search("robotics")
+    assert len(index) == 2
+    index.clear()
+    assert not index.search("samsung")
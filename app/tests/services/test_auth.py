@@ -0,0 +1,100 @@
+from typing import AsyncGenerator
+
+import httpx
+import pytest
+
+from app.core.http import github_client, google_client
+from app.exceptions.auth import GitHubOAuthFailed
+from app.schemas.auth import GitHubOAuthRequest, GoogleOAuthRequest
+from app.services.auth import GitHubService, GoogleService
+
+pytestmark = pytest.mark.anyio
+
+
+def provider(request: httpx.Request) -> httpx.Response:
+    """Local stand-in for the Google and GitHub OAuth endpoints."""
+    if request.url.path in ("/token", "/login/oauth/access_token"):
+        if b"invalid" in request.content:
+            return httpx.Response(401, json={"error": "bad_verification_code"})
+        return httpx.Response(
+            200,
+            json={
+                "access_token": "token",
+                "expires_in": 3600,
+                "scope": "email profile",
+                "token_type": "bearer",
+                "id_token": "id_token",
+            },
+        )
+    if request.headers["Authorization"] != "Bearer token":
+        return httpx.Response(401, json={"error": "unauthorized"})
+    if request.url.path == "/oauth2/v2/userinfo":
+        return httpx.Response(
+            200,
+            json={
+                "id": "1",
+                "email": "google@zerohertz.xyz",
+                "verified_email": True,
+                "name": "Google",
+                "given_name": "Google",
+                "family_name": "User",
+                "picture": "",
+            },
+        )
+    return httpx.Response(
+        200,
+        json={
+            "id": 1,
+            "login": "github",
+            "avatar_url": "",
+            "gravatar_id": "",
+            "html_url": "",
+            "name": "GitHub",
+            "company": "",
+            "blog": "",
+            "location": "",
+            "email": "github@zerohertz.xyz",
+        },
+    )
+
+
+@pytest.fixture(scope="function")
+async def mock_provider() -> AsyncGenerator[None, None]:
+    transport = httpx.MockTransport(provider)
+    google_client.startup(transport=transport)
+    github_client.startup(transport=transport)
+    yield
+    await google_client.shutdown()
+    await github_client.shutdown()
+
+
+@pytest.mark.usefixtures("mock_provider")
+async def test_google_service() -> None:
+    oauth = await GoogleService().get_token_and_user(
+        GoogleOAuthRequest(
+            grant_type="authorization_code", code="code", redirect_uri=""
+        )
+    )
+    assert oauth.id == "1"
+    assert oauth.token == "token"
+    assert oauth.email == "google@zerohertz.xyz"
+
+
+@pytest.mark.usefixtures("mock_provider")
+async def test_github_service() -> None:
+    service = GitHubService()
+    client = github_client()
+    oauth = await service.get_token_and_user(
+        GitHubOAuthRequest(
+            grant_type="authorization_code", code="code", redirect_uri=""
+        )
+    )
+    assert oauth.id == "1"
+    assert oauth.email == "github@zerohertz.xyz"
+    assert github_client() is client
+    with pytest.raises(GitHubOAuthFailed):
+        await service.get_token_and_user(
+            GitHubOAuthRequest(
+                grant_type="authorization_code", code="invalid", redirect_uri=""
+            )
+        )
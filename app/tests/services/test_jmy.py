@@ -0,0 +1,162 @@
+from contextvars import Token
+from typing import Any, AsyncIterator
+
+import pytest
+from faker import Faker
+from loguru import logger
+from sqlalchemy import func, select
+
+from app.core.analytics import jmy_store
+from app.core.container import Container
+from app.core.database import database
+from app.exceptions.jmy import JmyImportInvalid
+from app.models.jmy import JmyCompany, JmyTimeSeries
+from app.repositories.base import BaseRepository
+from app.schemas.jmy import JmyCompanyRequest, JmyImportErrorOut
+from app.services.jmy import jmy_search_index
+from app.tests.api.v1.admin.test_jmy import get_mock_jmy
+
+pytestmark = pytest.mark.anyio
+fake = Faker()
+
+
+async def count_time_series(name: str) -> int:
+    stmt = (
+        select(func.count())
+        .select_from(JmyTimeSeries)
+        .join(JmyCompany)
+        .where(JmyCompany.name == name)
+    )
+    return await database.scoped_session().scalar(stmt) or 0
+
+
+async def to_rows(schemas: list[JmyCompanyRequest]) -> AsyncIterator[dict[str, Any]]:
+    for schema in schemas:
+        yield schema.model_dump()
+
+
+async def test_upsert_jmy(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    jmy_service = container.jmy_service()
+    name = fake.company()
+    schemas = [get_mock_jmy(name, month) for month in range(1, 7)]
+    for _ in range(2):
+        await jmy_service.import_rows(to_rows(schemas + schemas[:2]))
+        assert await count_time_series(name) == len(schemas)
+    schema = schemas[0].model_copy(update={"b_assigned": 999})
+    jmy = await jmy_service.create(schema=schema)
+    assert len(jmy.time_series) == 1
+    assert jmy.time_series[0].b_assigned == 999
+    assert await count_time_series(name) == len(schemas)
+    core = await jmy_service.get_by_id(id=jmy.id, core=True)
+    assert len(core.time_series) == len(schemas)
+    assert core.model_dump() == (await jmy_service.get_by_id(id=jmy.id)).model_dump()
+
+
+async def test_import_jmy_invalid(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    jmy_service = container.jmy_service()
+    name = fake.company()
+    schemas = [get_mock_jmy(name, month) for month in range(1, 4)]
+
+    async def rows() -> AsyncIterator[dict[str, Any]]:
+        async for row in to_rows(schemas):
+            yield row
+        yield {"name": name}
+
+    with pytest.raises(JmyImportInvalid) as error:
+        await jmy_service.import_rows(rows(), chunk_size=2)
+    # NOTE: 실패한 row 이전의 chunk만 commit되고 응답에 포함된다.
+    assert isinstance(error.value.data, JmyImportErrorOut)
+    assert error.value.data.row == 4
+    assert [chunk.rows for chunk in error.value.data.committed] == [2]
+    await database.remove()
+    assert await count_time_series(name) == 2
+
+
+async def test_search_index_after_commit(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    jmy_service = container.jmy_service()
+    schema = get_mock_jmy(fake.company(), 1)
+
+    def indexed() -> bool:
+        return any(
+            document["name"] == schema.name
+            for document in jmy_search_index.documents.values()
+        )
+
+    @database.transactional
+    async def create_and_fail() -> None:
+        await jmy_service.create(schema)
+        assert not indexed()
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await create_and_fail()
+    assert not indexed()
+    await jmy_service.create(schema)
+    assert indexed()
+
+
+async def test_store_stale_after_commit(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    jmy_service = container.jmy_service()
+    jmy_store.stale = False
+
+    @database.transactional
+    async def create() -> None:
+        await jmy_service.create(get_mock_jmy(fake.company(), 1))
+        assert not jmy_store.stale
+
+    await create()
+    assert jmy_store.stale
+
+
+async def test_upsert_jmy_merge(
+    container: Container, context: Token, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    logger.warning(f"{context=}")
+    monkeypatch.setattr(BaseRepository, "_upsert", lambda self, session, keys: None)
+    jmy_service = container.jmy_service()
+    name = fake.company()
+    schemas = [get_mock_jmy(name, month) for month in range(1, 7)]
+    for _ in range(2):
+        await jmy_service.import_rows(to_rows(schemas))
+        assert await count_time_series(name) == len(schemas)
+    schema = schemas[-1].model_copy(update={"a_old": 999})
+    jmy = await jmy_service.create(schema=schema)
+    assert jmy.time_series[0].a_old == 999
+    assert await count_time_series(name) == len(schemas)
+
+
+async def test_summary_jmy(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    jmy_service = container.jmy_service()
+    location = f"{fake.city()}청"
+    schemas = [
+        get_mock_jmy(name, month).model_copy(update={"location": location})
+        for name in (fake.company(), fake.company())
+        for month in range(1, 4)
+    ]
+    await jmy_service.import_rows(to_rows(schemas))
+    schema = schemas[0].model_copy(update={"a_new": 999})
+    await jmy_service.create(schema=schema)
+    schemas[0] = schema
+
+    async def assert_summary() -> None:
+        summaries = await jmy_service.get_summary(dimension="location", key=location)
+        assert len(summaries) == 3
+        for summary, month in zip(summaries, range(1, 4)):
+            points = [schema for schema in schemas if schema.date.month == month]
+            assert summary.companies == len(points)
+            assert summary.a_new == sum(schema.a_new for schema in points)
+        snapshots = {
+            snapshot.name: snapshot for snapshot in await jmy_service.get_snapshots()
+        }
+        for schema in schemas[2::3]:
+            assert snapshots[schema.name].date.month == 3
+            assert snapshots[schema.name].b_old == schema.b_old
+
+    await assert_summary()
+    await jmy_service.rebuild_summary()
+    await assert_summary()
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from app.exceptions.auth import CryptServiceBusy
+from app.services.security import CryptExecutor, CryptService, _hash
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_hash_async() -> None:
+    crypt_service = CryptService()
+    hashed = await crypt_service.hash_async("PyTest98!@")
+    assert await crypt_service.verify_async("PyTest98!@", hashed)
+    assert not await crypt_service.verify_async("PyTest99!@", hashed)
+
+
+async def test_crypt_executor_busy() -> None:
+    executor = CryptExecutor(pool="thread", workers=1, queue_size=1)
+    results = await asyncio.gather(
+        *(executor.run(_hash, "PyTest98!@") for _ in range(3)),
+        return_exceptions=True,
+    )
+    executor.shutdown()
+    assert sum(isinstance(result, str) for result in results) == 2
+    assert sum(isinstance(result, CryptServiceBusy) for result in results) == 1
@@ -3,10 +3,20 @@ from contextvars import Token
 import pytest
 from faker import Faker
 from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
 
+from app.core.cache import principal_cache
 from app.core.container import Container
-from app.exceptions.database import DatabaseException, EntityNotFound
-from app.models.enums import Role
+from app.core.database import database
+from app.exceptions.database import (
+    DatabaseException,
+    EntityAlreadyExists,
+    EntityNotFound,
+)
+from app.models.auth import OAuth
+from app.models.enums import OAuthProvider, Role
+from app.models.users import User
 from app.schemas.users import UserIn, UserRequest
 
 pytestmark = pytest.mark.anyio
@@ -43,8 +53,54 @@ async def test_get_user(container: Container, context: Token) -> None:
         user = await user_service.get_by_id(id=user.id)
         assert user.name == schema.name
         assert user.email == schema.email
+        core = await user_service.get_by_id(id=user.id, core=True)
+        assert core.model_dump() == user.model_dump()
     with pytest.raises(EntityNotFound):
         user = await user_service.get_by_id(id=99999)
+    with pytest.raises(EntityNotFound):
+        user = await user_service.get_by_id(id=99999, core=True)
+
+
+async def test_map_users(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    user_service = container.user_service()
+    for _ in range(3):
+        await user_service.create(schema=get_mock_user())
+    users = await user_service.repository.read_all(loads=user_service.loads)
+    schemas = [user_service.mapper(user).model_dump() for user in users]
+    for trusted in (False, True):
+        assert [
+            schema.model_dump()
+            for schema in user_service.mapper.many(users, trusted=trusted)
+        ] == schemas
+
+
+async def test_load_user(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    user_service = container.user_service()
+    session = database.scoped_session()
+    oauth_id = fake.uuid4()
+    async with session.begin():
+        user = User(
+            **get_mock_user().model_dump(),
+            oauth=[OAuth(provider=OAuthProvider.GITHUB, oauth_id=oauth_id)],
+        )
+        session.add(user)
+    await database.remove()
+    entity = await user_service.repository.read_by_id(id=user.id)
+    with pytest.raises(InvalidRequestError):
+        _ = entity.oauth
+    for loader in ("selectin", "joined"):
+        await database.remove()
+        entity = await user_service.repository.read_by_id(
+            id=user.id, loads={"oauth": loader}
+        )
+        assert [oauth.oauth_id for oauth in entity.oauth] == [oauth_id]
+    await database.remove()
+    entity = await user_service.repository.read_by_id(
+        id=user.id, loads={"oauth": "noload"}
+    )
+    assert not entity.oauth
 
 
 async def test_put_user(container: Container, context: Token) -> None:
@@ -73,3 +129,67 @@ async def test_delete_user(container: Container, context: Token) -> None:
         user = await user_service.delete_by_id(id=user.id)
     with pytest.raises(EntityNotFound):
         user = await user_service.delete_by_id(id=99999)
+    # NOTE: Cascade 자식 (OAuth)은 부모의 DELETE 전에 삭제되고, loads에 포함되면 응답에 채워진다.
+    session = database.scoped_session()
+    async with session.begin():
+        entity = User(
+            **get_mock_user().model_dump(),
+            oauth=[OAuth(provider=OAuthProvider.GITHUB, oauth_id=fake.uuid4())],
+        )
+        session.add(entity)
+    user = await user_service.delete_by_id(id=entity.id)
+    assert [oauth.oauth_id for oauth in user.oauth] == [entity.oauth[0].oauth_id]
+    stmt = select(func.count()).select_from(OAuth).where(OAuth.user_id == entity.id)
+    assert await session.scalar(stmt) == 0
+
+
+async def test_patch_user_attr(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    user_service = container.user_service()
+    user = await user_service.create(schema=get_mock_user())
+    other = await user_service.create(schema=get_mock_user())
+    name = fake.name()
+    patched = await user_service.patch_attr_by_id(id=user.id, attr="name", value=name)
+    assert patched.name == name
+    assert patched.email == user.email
+    with pytest.raises(EntityAlreadyExists):
+        await user_service.patch_attr_by_id(id=user.id, attr="email", value=other.email)
+    with pytest.raises(EntityNotFound):
+        await user_service.patch_attr_by_id(id=99999, attr="name", value=name)
+
+
+async def test_create_users(container: Container, context: Token) -> None:
+    logger.warning(f"{context=}")
+    user_service = container.user_service()
+    # NOTE: Faker의 name / email 중복으로 의도하지 않은 conflict가 생기지 않도록 unique 사용
+    schemas = [
+        UserIn(name=fake.unique.name(), email=fake.unique.email(), role=Role.USER)
+        for _ in range(10)
+    ]
+    schemas[7].email = schemas[2].email
+    users, conflicts = await user_service.create_many(schemas)
+    assert conflicts == [7]
+    assert [user.email for user in users] == [
+        schema.email for index, schema in enumerate(schemas) if index != 7
+    ]
+    users, conflicts = await user_service.create_many(schemas[:3])
+    assert not users
+    assert conflicts == [0, 1, 2]
+
+
+async def test_principal_cache_after_commit(
+    container: Container, context: Token
+) -> None:
+    logger.warning(f"{context=}")
+    user_service = container.user_service()
+    user = await user_service.create(get_mock_user())
+    principal_cache.set(user.id, user)
+
+    @database.transactional
+    async def patch() -> None:
+        await user_service.patch_attr_by_id(id=user.id, attr="name", value="patched")
+        # NOTE: commit 전 무효화하면 동시 요청이 이전 row를 다시 cache할 수 있다.
+        assert principal_cache.get(user.id) is not None
+
+    await patch()
+    assert principal_cache.get(user.id) is None
@@ -0,0 +1,167 @@
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Iterable
+
+TOKEN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN.findall(normalize(text))
+
+
+def trigrams(text: str) -> set[str]:
+    """``pg_trgm``과 동일하게 token 앞에 공백 2개, 뒤에 1개를 붙여 trigram을 생성한다."""
+    grams: set[str] = set()
+    for token in tokenize(text):
+        padded = f"  {token} "
+        grams.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """
+    In-process trigram + prefix index.
+
+    Document의 field별 trigram / token posting list를 유지하며,
+    field score는 ``weight * (query trigram 중 field에 포함된 비율 + prefix로 일치한 query token 비율) / 2``로 계산하고 document는 field score의 최댓값으로 정렬한다.
+    (``pg_trgm``의 ``word_similarity``와 같이 field 길이로 나누지 않아 여러 단어로 된 field에서도 오타가 허용된다.)
+    """
+
+    def __init__(self, *, weights: dict[str, float], threshold: float = 0.2) -> None:
+        self.weights = weights
+        self.threshold = threshold
+        self.documents: dict[int, dict[str, str]] = {}
+        self.grams: defaultdict[str, set[tuple[int, str]]] = defaultdict(set)
+        self.fields: dict[tuple[int, str], set[str]] = {}
+        self.tokens: defaultdict[str, set[tuple[int, str]]] = defaultdict(set)
+        self.sorted_tokens: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def clear(self) -> None:
+        self.documents.clear()
+        self.grams.clear()
+        self.fields.clear()
+        self.tokens.clear()
+        self.sorted_tokens.clear()
+
+    def add(self, id: int, fields: dict[str, str | None]) -> None:
+        for token in self._add(id, fields):
+            bisect.insort(self.sorted_tokens, token)
+
+    def extend(self, documents: Iterable[tuple[int, dict[str, str | None]]]) -> None:
+        """``add``와 같지만 prefix 검색용 token 정렬은 마지막에 한 번만 수행한다."""
+        tokens: list[str] = []
+        for id, fields in documents:
+            tokens.extend(self._add(id, fields))
+        # NOTE: 같은 batch에서 다시 추가되며 제거된 token은 제외
+        self.sorted_tokens = sorted(
+            set(self.sorted_tokens).union(
+                token for token in tokens if token in self.tokens
+            )
+        )
+
+    def _add(self, id: int, fields: dict[str, str | None]) -> list[str]:
+        """
+        Returns:
+            새로 index된 tokens
+        """
+        if id in self.documents:
+            self.remove(id)
+        document = {
+            field: text
+            for field, text in fields.items()
+            if field in self.weights and text
+        }
+        self.documents[id] = document
+        tokens: list[str] = []
+        for field, text in document.items():
+            key = (id, field)
+            self.fields[key] = trigrams(text)
+            for gram in self.fields[key]:
+                self.grams[gram].add(key)
+            for token in set(tokenize(text)):
+                if token not in self.tokens:
+                    tokens.append(token)
+                self.tokens[token].add(key)
+        return tokens
+
+    def remove(self, id: int) -> None:
+        document = self.documents.pop(id, None)
+        if document is None:
+            return
+        for field, text in document.items():
+            key = (id, field)
+            for gram in self.fields.pop(key):
+                self.grams[gram].discard(key)
+                if not self.grams[gram]:
+                    del self.grams[gram]
+            for token in set(tokenize(text)):
+                self.tokens[token].discard(key)
+                if not self.tokens[token]:
+                    del self.tokens[token]
+                    index = bisect.bisect_left(self.sorted_tokens, token)
+                    if self.sorted_tokens[index : index + 1] == [token]:
+                        del self.sorted_tokens[index]
+
+    def _prefixed(self, prefix: str) -> Iterable[str]:
+        index = bisect.bisect_left(self.sorted_tokens, prefix)
+        while index < len(self.sorted_tokens) and self.sorted_tokens[index].startswith(
+            prefix
+        ):
+            yield self.sorted_tokens[index]
+            index += 1
+
+    def _prefix_matches(self, tokens: set[str]) -> Counter[tuple[int, str]]:
+        """``(id, field)``별 prefix로 일치한 query token 수"""
+        matches: Counter[tuple[int, str]] = Counter()
+        for token in tokens:
+            keys: set[tuple[int, str]] = set()
+            for indexed in self._prefixed(token):
+                keys |= self.tokens.get(indexed, set())
+            matches.update(keys)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[int, float]]:
+        """
+        Returns:
+            Score 내림차순 ``(id, score)`` (최대 ``limit``개, ``threshold`` 미만 제외)
+        """
+        grams = trigrams(query)
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        prefixed = self._prefix_matches(tokens)
+        # NOTE: Prefix로 일치하지 않는 field는 query trigram을 minimum개 이상 포함해야 threshold를 넘으므로,
+        # 가장 드문 ``len(grams) - minimum + 1``개 trigram 중 하나는 반드시 포함한다. (similarity join의 prefix filtering)
+        minimum = math.ceil(
+            2 * self.threshold / max(self.weights.values()) * len(grams)
+        )
+        candidates = set(prefixed)
+        for gram in sorted(grams, key=lambda gram: len(self.grams.get(gram, ())))[
+            : len(grams) - max(minimum, 1) + 1
+        ]:
+            candidates |= self.grams.get(gram, set())
+        scores: dict[int, float] = {}
+        for key in candidates:
+            id, field = key
+            score = (
+                self.weights[field]
+                * (
+                    len(grams & self.fields[key]) / len(grams)
+                    + prefixed[key] / len(tokens)
+                )
+                / 2
+            )
+            if self.threshold <= score and scores.get(id, 0.0) < score:
+                scores[id] = score
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
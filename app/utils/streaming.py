@@ -0,0 +1,147 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+import orjson
+from pydantic import BaseModel
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped, import-not-found]
+except ImportError:  # NOTE: Optional dependency (``arrow`` extra)
+    pa = None
+
+
+async def ndjson(
+    items: AsyncIterator[BaseModel], chunk_size: int = 100
+) -> AsyncIterator[bytes]:
+    """Newline-delimited JSON; ``chunk_size``개씩 묶어서 전송한다."""
+    chunk: list[bytes] = []
+    async for item in items:
+        chunk.append(item.model_dump_json().encode())
+        if chunk_size <= len(chunk):
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+async def json_array(
+    items: AsyncIterator[BaseModel], chunk_size: int = 100
+) -> AsyncIterator[bytes]:
+    """Chunked JSON array (``[{...},{...}]``); ``chunk_size``개씩 묶어서 전송한다."""
+    prefix = b"["
+    chunk: list[bytes] = []
+    async for item in items:
+        chunk.append(item.model_dump_json().encode())
+        if chunk_size <= len(chunk):
+            yield prefix + b",".join(chunk)
+            prefix = b","
+            chunk = []
+    if chunk:
+        yield prefix + b",".join(chunk) + b"]"
+    elif prefix == b"[":
+        yield b"[]"
+    else:
+        yield b"]"
+
+
+async def lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Byte stream을 buffering 없이 line 단위로 분할한다. (빈 line 제외)"""
+    buffer = b""
+    async for chunk in stream:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            if line.strip():
+                yield line.decode()
+    if buffer.strip():
+        yield buffer.decode()
+
+
+async def ndjson_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[dict[str, Any]]:
+    async for line in lines(stream):
+        yield orjson.loads(line)  # pylint: disable=no-member
+
+
+async def csv_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[dict[str, Any]]:
+    """
+    첫 line을 header로 사용하는 CSV parser.
+
+    Line 단위로 parsing하므로 quote 내부의 개행은 지원하지 않는다.
+    """
+    header: list[str] | None = None
+    async for line in lines(stream):
+        for row in csv.reader([line]):
+            if header is None:
+                header = [column.strip().lstrip("\ufeff") for column in row]
+                continue
+            yield dict(zip(header, row))
+
+
+async def csv_chunks(
+    header: Sequence[str], batches: AsyncIterator[Sequence[Sequence[Any]]]
+) -> AsyncIterator[bytes]:
+    """Batch마다 CSV chunk 하나를 전송한다. (첫 chunk에 header 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header)
+    async for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def arrow_ipc(
+    columns: Sequence[tuple[str, type]],
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+) -> AsyncIterator[bytes]:
+    """
+    Batch마다 Arrow IPC record batch 하나를 전송한다. (Streaming format)
+
+    Raises:
+        ModuleNotFoundError: ``pyarrow``가 설치되지 않은 경우 (response 시작 전에 확인할 수 있도록 즉시 발생)
+    """
+    if pa is None:
+        raise ModuleNotFoundError("pyarrow is required for Arrow IPC streams.")
+    schema = pa.schema([(name, _arrow_type(type_)) for name, type_ in columns])
+    return _arrow_ipc(schema, batches)
+
+
+async def _arrow_ipc(
+    schema: Any, batches: AsyncIterator[Sequence[Sequence[Any]]]
+) -> AsyncIterator[bytes]:
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        async for rows in batches:
+            if len(rows) == 0:
+                continue
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(zip(*rows), schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    # NOTE: Schema (batch가 없는 경우) 및 end-of-stream marker
+    yield sink.getvalue()
+
+
+def _arrow_type(type_: type) -> Any:
+    if issubclass(type_, bool):
+        return pa.bool_()
+    if issubclass(type_, int):
+        return pa.int64()
+    if issubclass(type_, float):
+        return pa.float64()
+    if issubclass(type_, datetime):
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
@@ -0,0 +1,52 @@
+"""
+``GET /v1/auth/me`` throughput (requests/sec).
+
+    make bench target=auth_me
+"""
+
+import asyncio
+import time
+
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+
+from app.core.configs import configs
+from app.main import app
+
+REQUESTS = 2_000
+CONCURRENCY = 32
+
+
+async def main() -> None:
+    async with app.router.lifespan_context(app):
+        logger.remove()
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            response = await client.post(
+                f"{configs.PREFIX}/v1/auth/password/token",
+                data={
+                    "grant_type": "password",
+                    "username": configs.ADMIN_EMAIL,
+                    "password": configs.ADMIN_PASSWORD,
+                },
+            )
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+
+            async def get_me() -> None:
+                async with semaphore:
+                    response = await client.get(
+                        f"{configs.PREFIX}/v1/auth/me", headers=headers
+                    )
+                    assert response.status_code == 200
+
+            await get_me()
+            start = time.perf_counter()
+            await asyncio.gather(*(get_me() for _ in range(REQUESTS)))
+            elapsed = time.perf_counter() - start
+    print(f"GET /v1/auth/me: {REQUESTS / elapsed:,.0f} req/s ({REQUESTS} requests)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""
+ORM entity + ``model_validate`` vs. Core column ``SELECT`` + ``model_construct`` (``BaseRepository.read_rows``).
+
+``UserOut`` (one ``OAuth`` each) and ``JmyCompanyOut`` (``POINTS`` time-series points each):
+``get_by_id`` per call in a fresh scoped session like a request, and all ``ITERATIONS`` rows in one read.
+
+    make bench target=core_read
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from math import inf
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.configs import configs
+from app.core.container import Container
+from app.core.database import database
+from app.models.auth import OAuth
+from app.models.enums import OAuthProvider, Role
+from app.models.jmy import JmyCompany, JmyTimeSeries
+from app.models.users import User
+from app.services.base import BaseService
+from app.services.security import crypt_executor
+
+ITERATIONS = 1_000
+POINTS = 24
+REPEATS = 5
+
+
+async def measure(func: Callable[[int], Awaitable[Any]], ids: list[int]) -> float:
+    start = time.perf_counter_ns()
+    for id in ids:
+        await func(id)
+        await database.remove()
+    return (time.perf_counter_ns() - start) / len(ids) / 1_000
+
+
+async def seed() -> tuple[list[int], list[int]]:
+    session = database.scoped_session()
+    start = datetime(2020, 1, 1, tzinfo=configs.TZINFO)
+    async with session.begin():
+        users = [
+            User(
+                name=f"bench-{i}",
+                email=f"bench-{i}@zerohertz.xyz",
+                role=Role.USER,
+                oauth=[OAuth(provider=OAuthProvider.PASSWORD, password="hashed")],
+            )
+            for i in range(ITERATIONS)
+        ]
+        companies = [
+            JmyCompany(
+                name=f"bench-{i}",
+                year=2020,
+                location="서울지방병무청",
+                address=f"서울특별시 {i}",
+                type_="정보처리",
+                size="중소기업",
+                research="",
+                time_series=[
+                    JmyTimeSeries(
+                        date=start + timedelta(days=30 * month),
+                        b_assigned=month,
+                        b_new=month,
+                        b_old=month,
+                        a_assigned=month,
+                        a_new=month,
+                        a_old=month,
+                    )
+                    for month in range(POINTS)
+                ],
+            )
+            for i in range(ITERATIONS)
+        ]
+        session.add_all(users)
+        session.add_all(companies)
+    ids = [user.id for user in users], [company.id for company in companies]
+    await database.remove()
+    return ids
+
+
+async def read_all(service: BaseService, ids: list[int]) -> tuple[float, float]:
+    """Best of ``REPEATS``, per row"""
+    model = service.repository.model
+
+    async def orm() -> None:
+        result = await database.scoped_session().scalars(
+            service.repository._load(select(model), service.loads).where(
+                model.id.in_(ids)
+            )
+        )
+        for entity in result.all():
+            service.mapper(entity)
+
+    async def core() -> None:
+        rows = await service.repository.read_rows(
+            service.mapper.columns, model.id.in_(ids)
+        )
+        service.mapper.many(rows, trusted=True)
+
+    elapsed: dict[Callable[[], Awaitable[None]], float] = {orm: inf, core: inf}
+    for _ in range(REPEATS):
+        for func in elapsed:
+            start = time.perf_counter_ns()
+            await func()
+            elapsed[func] = min(elapsed[func], time.perf_counter_ns() - start)
+            await database.remove()
+    return elapsed[orm] / len(ids) / 1_000, elapsed[core] / len(ids) / 1_000
+
+
+async def compare(name: str, service: BaseService, ids: list[int]) -> None:
+    orm = await measure(service.get_by_id, ids)
+    core = await measure(lambda id: service.get_by_id(id, core=True), ids)
+    print(f"{name:>13}: get_by_id orm={orm:8.1f}us  core={core:8.1f}us")
+    orm, core = await read_all(service, ids)
+    print(f"{name:>13}: all rows  orm={orm:8.1f}us  core={core:8.1f}us  (per row)")
+
+
+async def main() -> None:
+    logger.remove()
+    await database.create_all()
+    context = database.context.set()
+    container = Container()
+    user_service = container.user_service()
+    jmy_service = container.jmy_service()
+    try:
+        user_ids, company_ids = await seed()
+        print(f"[{configs.DB_TYPE}] per call, {ITERATIONS} iterations")
+        await compare("UserOut", user_service, user_ids)
+        await compare("JmyCompanyOut", jmy_service, company_ids)
+    finally:
+        database.context.reset(context)
+        await database.dispose()
+        crypt_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+``JmyService.create`` latency as company history grows: append-only vs. loading the history.
+
+    make bench target=jmy_create
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.configs import configs
+from app.core.container import Container
+from app.core.database import database
+from app.models.jmy import JmyCompany, JmyTimeSeries
+from app.repositories.jmy import JmyRepository, JmyTimeSeriesRepository
+from app.schemas.jmy import JmyCompanyRequest
+from app.services.jmy import TIME_SERIES_FIELDS
+from app.services.security import crypt_executor
+
+HISTORY = (0, 100, 1_000, 10_000)
+ITERATIONS = 50
+START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def get_request(name: str, index: int) -> JmyCompanyRequest:
+    return JmyCompanyRequest(
+        name=name,
+        year=2020,
+        location="서울청",
+        address="서울특별시",
+        type_="정보처리",
+        size="중소기업",
+        research="AI",
+        date=START + timedelta(days=index),
+        b_assigned=1,
+        b_new=1,
+        b_old=1,
+        a_assigned=1,
+        a_new=1,
+        a_old=1,
+    )
+
+
+@database.transactional
+async def create_with_history(schema: JmyCompanyRequest) -> int:
+    """기존 ``JmyService.create``: history 전체를 load한 뒤 append"""
+    session = database.scoped_session()
+    company = await session.scalar(
+        select(JmyCompany)
+        .options(selectinload(JmyCompany.time_series))
+        .where(JmyCompany.name == schema.name)
+    )
+    assert company is not None
+    company.time_series.append(
+        JmyTimeSeries(**schema.model_dump(include=set(TIME_SERIES_FIELDS)))
+    )
+    await session.flush()
+    await session.refresh(company)
+    return len(company.time_series)
+
+
+async def measure(
+    func: Callable[[JmyCompanyRequest], Awaitable], name: str, offset: int
+) -> float:
+    start = time.perf_counter_ns()
+    for index in range(ITERATIONS):
+        await func(get_request(name, offset + index))
+        await database.remove()
+    return (time.perf_counter_ns() - start) / ITERATIONS / 1_000
+
+
+async def main() -> None:
+    logger.remove()
+    await database.create_all()
+    context = database.context.set()
+    service = Container().jmy_service()
+    print(f"[{configs.DB_TYPE}] per call, {ITERATIONS} iterations")
+    try:
+        for history in HISTORY:
+            names = [f"bench-{history}-{kind}" for kind in ("append", "history")]
+            for name in names:
+                await service.create(get_request(name, 0))
+                async with database.scoped_session().begin():
+                    ids = await JmyRepository().read_ids_by_names([name])
+                    await JmyTimeSeriesRepository().insert_many(
+                        [
+                            {
+                                "company_id": ids[name],
+                                **get_request(name, index).model_dump(
+                                    include=set(TIME_SERIES_FIELDS)
+                                ),
+                            }
+                            for index in range(1, history)
+                        ]
+                    )
+                await database.remove()
+            append = await measure(service.create, names[0], history)
+            legacy = await measure(create_with_history, names[1], history)
+            print(
+                f"history={history:>6}: append={append:10.1f}us  load={legacy:10.1f}us"
+            )
+    finally:
+        database.context.reset(context)
+        await database.dispose()
+        crypt_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Full Jmy dataset export: nested ``JmyCompanyOut`` list vs. streamed flat CSV / Arrow IPC.
+
+Reports wall time and the ``tracemalloc`` peak of each path.
+
+    make bench target=jmy_export
+"""
+
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable
+
+from loguru import logger
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
+from app.core.configs import configs
+from app.core.container import Container
+from app.core.database import database
+from app.models.jmy import COUNTERS, JmyCompany
+from app.repositories.jmy import JmyRepository, JmyTimeSeriesRepository
+from app.schemas.jmy import JmyCompanyOut
+from app.services.security import crypt_executor
+from app.utils.streaming import pa
+
+COMPANIES = 2_000
+POINTS = 50
+PREFIX = "bench-export"
+START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+async def seed() -> None:
+    async with database.scoped_session().begin():
+        count = await database.scoped_session().scalar(
+            select(func.count()).where(JmyCompany.name.startswith(PREFIX))
+        )
+        if count:
+            return
+        ids = await JmyRepository().create_ids(
+            [
+                {
+                    "name": f"{PREFIX}-{index}",
+                    "year": 2020,
+                    "location": "서울청",
+                    "address": "서울특별시",
+                    "type_": "정보처리",
+                    "size": "중소기업",
+                    "research": "AI",
+                }
+                for index in range(COMPANIES)
+            ]
+        )
+        await JmyTimeSeriesRepository().insert_many(
+            [
+                {
+                    "company_id": id,
+                    "date": START + timedelta(days=30 * point),
+                    **{counter: point for counter in COUNTERS},
+                }
+                for id in ids.values()
+                for point in range(POINTS)
+            ]
+        )
+    await database.remove()
+
+
+async def nested() -> int:
+    """기존 방식: ORM entity + ``JmyCompanyOut`` list를 한 번에 직렬화"""
+    companies = await database.scoped_session().scalars(
+        select(JmyCompany).options(selectinload(JmyCompany.time_series))
+    )
+    schemas = [JmyCompanyOut.model_validate(company) for company in companies]
+    return len(TypeAdapter(list[JmyCompanyOut]).dump_json(schemas))
+
+
+async def consume(chunks: AsyncIterator[bytes]) -> int:
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+    return size
+
+
+async def measure(
+    export: Callable[[], Awaitable[int]],
+) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    size = await export()
+    elapsed = time.perf_counter() - start
+    await database.remove()
+    tracemalloc.start()
+    await export()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await database.remove()
+    return elapsed, peak / 2**20, size
+
+
+async def main() -> None:
+    logger.remove()
+    await database.create_all()
+    context = database.context.set()
+    service = Container().jmy_service()
+    try:
+        await seed()
+        print(f"[{configs.DB_TYPE}] {COMPANIES} companies x {POINTS} points")
+        cases: dict[str, Callable[[], Awaitable[int]]] = {
+            "nested": nested,
+            "csv": lambda: consume(service.export("csv")),
+        }
+        if pa is not None:
+            cases["arrow"] = lambda: consume(service.export("arrow"))
+        for name, export in cases.items():
+            elapsed, peak, size = await measure(export)
+            print(
+                f"{name:>6}: {elapsed:6.2f}s  peak={peak:7.1f}MiB  size={size / 2**20:6.1f}MiB"
+            )
+    finally:
+        database.context.reset(context)
+        await database.dispose()
+        crypt_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Mapping ``User`` entities (with one ``OAuth`` each) to ``UserOut``:
+per-entity ``model_validate`` loop vs. ``BaseMapper.many`` (cached ``TypeAdapter``) vs. ``BaseMapper.many(trusted=True)``.
+
+    make bench target=mapper
+"""
+
+import time
+from datetime import datetime
+from typing import Callable
+
+from app.core.configs import configs
+from app.models.auth import OAuth
+from app.models.enums import OAuthProvider, Role
+from app.models.users import User
+from app.schemas.users import UserIn, UserOut
+from app.services.base import BaseMapper
+
+SIZES = (10, 100, 1_000, 10_000)
+ITERATIONS = 50_000
+
+
+def get_users(size: int) -> list[User]:
+    now = datetime.now(configs.TZINFO)
+    return [
+        User(
+            id=id,
+            created_at=now,
+            updated_at=now,
+            name=f"user-{id}",
+            email=f"user-{id}@zerohertz.xyz",
+            role=Role.USER,
+            oauth=[
+                OAuth(
+                    id=id,
+                    created_at=now,
+                    updated_at=now,
+                    user_id=id,
+                    provider=OAuthProvider.PASSWORD,
+                    password="hashed",
+                )
+            ],
+        )
+        for id in range(size)
+    ]
+
+
+def measure(func: Callable[[list[User]], list[UserOut]], users: list[User]) -> float:
+    iterations = max(ITERATIONS // len(users), 5)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        func(users)
+    return (time.perf_counter_ns() - start) / iterations / len(users) / 1_000
+
+
+def main() -> None:
+    mapper = BaseMapper[User, UserIn, UserOut](model=User, schema=UserOut)
+    cases: dict[str, Callable[[list[User]], list[UserOut]]] = {
+        "loop": lambda users: [mapper(user) for user in users],
+        "many": mapper.many,
+        "trusted": lambda users: mapper.many(users, trusted=True),
+    }
+    print("per entity")
+    for size in SIZES:
+        users = get_users(size)
+        expected = [schema.model_dump() for schema in cases["loop"](users)]
+        for func in cases.values():
+            assert [schema.model_dump() for schema in func(users)] == expected
+        print(
+            f"size={size:>6}: "
+            + "  ".join(
+                f"{name}={measure(func, users):6.2f}us" for name, func in cases.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Per-request overhead of ``LoggingMiddleware`` for growing request bodies.
+
+    make bench target=middleware
+"""
+
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+
+from app.core.middlewares import LoggingMiddleware
+
+REQUESTS = 500
+SIZES = [0, 64 * 1024, 4 * 1024 * 1024]
+
+
+def create_app(middleware: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request) -> int:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+        return size
+
+    if middleware:
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+async def measure(app: FastAPI, body: bytes) -> float:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        await client.post("/upload", content=body)
+        start = time.perf_counter_ns()
+        for _ in range(REQUESTS):
+            await client.post("/upload", content=body)
+        return (time.perf_counter_ns() - start) / REQUESTS / 1_000
+
+
+async def main() -> None:
+    logger.remove()
+    # NOTE: PROD와 동일하게 INFO 이상만 출력하는 sink
+    logger.add(lambda _: None, level="INFO")
+    for size in SIZES:
+        body = b"x" * size
+        bare = await measure(create_app(middleware=False), body)
+        logged = await measure(create_app(middleware=True), body)
+        print(
+            f"body={size:>9,}B  bare={bare:>9.1f}us  "
+            f"logging={logged:>9.1f}us  overhead={logged - bare:>9.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
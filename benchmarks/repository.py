@@ -0,0 +1,102 @@
+"""
+``BaseRepository.update_by_id`` / ``delete_by_id``: single-statement RETURNING vs. SELECT + flush + refresh.
+
+``delete_by_id (cascade)``: ``User`` with its ``OAuth`` (``loads={"oauth": "selectin"}``);
+children are deleted by a Core ``DELETE ... RETURNING`` before the parent vs. SELECT + ``session.delete`` cascade.
+
+Runs against the configured ``DATABASE_URI`` (``DB_TYPE=sqlite|mysql|postgresql``);
+on backends without RETURNING (e.g. MySQL) both columns take the fallback path.
+
+    make bench target=repository
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+from app.core.configs import configs
+from app.core.database import database
+from app.models.auth import OAuth
+from app.models.enums import OAuthProvider, Role
+from app.models.users import User
+from app.repositories.auth import AuthRepository
+from app.repositories.base import Loads
+from app.repositories.users import UserRepository
+from app.services.security import crypt_executor
+
+ITERATIONS = 1_000
+LOADS: Loads = {"oauth": "selectin"}
+
+
+async def measure(func: Callable[[int], Awaitable], ids: list[int]) -> float:
+    start = time.perf_counter_ns()
+    for id in ids:
+        async with database.scoped_session().begin():
+            await func(id)
+        await database.remove()
+    return (time.perf_counter_ns() - start) / len(ids) / 1_000
+
+
+async def main() -> None:
+    logger.remove()
+    await database.create_all()
+    context = database.context.set()
+    session = database.scoped_session()
+    async with session.begin():
+        users = [
+            User(
+                name=f"bench-{i}",
+                email=f"bench-{i}@zerohertz.xyz",
+                role=Role.USER,
+                oauth=[OAuth(provider=OAuthProvider.GITHUB, oauth_id=str(i))],
+            )
+            for i in range(4 * ITERATIONS)
+        ]
+        session.add_all(users)
+    user_ids = [user.id for user in users]
+    oauth_ids = [user.oauth[0].id for user in users]
+    await database.remove()
+    user_repository = UserRepository()
+    auth_repository = AuthRepository()
+    print(f"[{configs.DB_TYPE}] per call, {ITERATIONS} iterations")
+    try:
+        returning = await measure(
+            lambda id: user_repository.update_by_id(id=id, data={"name": f"a-{id}"}),
+            user_ids[:ITERATIONS],
+        )
+        fallback = await measure(
+            lambda id: user_repository._update_by_id(id=id, data={"name": f"b-{id}"}),
+            user_ids[ITERATIONS : 2 * ITERATIONS],
+        )
+        print(f"update_by_id: returning={returning:8.1f}us  select={fallback:8.1f}us")
+        returning = await measure(
+            lambda id: auth_repository.delete_by_id(id=id), oauth_ids[:ITERATIONS]
+        )
+        fallback = await measure(
+            lambda id: auth_repository._delete_by_id(id=id),
+            oauth_ids[ITERATIONS : 2 * ITERATIONS],
+        )
+        print(f"delete_by_id: returning={returning:8.1f}us  select={fallback:8.1f}us")
+        returning = await measure(
+            lambda id: user_repository.delete_by_id(id=id, loads=LOADS),
+            user_ids[2 * ITERATIONS : 3 * ITERATIONS],
+        )
+        fallback = await measure(
+            lambda id: user_repository._delete_by_id(id=id, loads=LOADS),
+            user_ids[3 * ITERATIONS :],
+        )
+        print(
+            f"delete_by_id (cascade): returning={returning:8.1f}us  select={fallback:8.1f}us"
+        )
+    finally:
+        database.context.reset(context)
+        await database.dispose()
+        crypt_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+``CoreAPIRouter`` envelope overhead per response size: per-call ``APIResponse[...]`` + ``model_dump(mode="json")`` + ``ORJSONResponse``
+vs. the envelope resolved at registration and serialized straight to bytes into the route's ``response_class``.
+
+    make bench target=router
+"""
+
+# pylint: disable=protected-access
+
+import json
+import time
+from datetime import datetime
+from typing import Callable
+
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse
+
+from app.core.configs import configs
+from app.core.router import _prerendered, _render
+from app.models.enums import Role
+from app.schemas.responses import APIResponse
+from app.schemas.users import UserOut
+
+SIZES = (1, 10, 100, 1_000)
+ITERATIONS = 20_000
+
+
+def legacy(data: list[UserOut]) -> Response:
+    return ORJSONResponse(
+        content=APIResponse[list[UserOut]]  # type: ignore[type-var]
+        .success(status=status.HTTP_200_OK, data=data)
+        .model_dump(mode="json"),
+        status_code=status.HTTP_200_OK,
+    )
+
+
+envelope: type[APIResponse] = APIResponse[list[UserOut]]  # type: ignore[type-var]
+rendered = _prerendered(ORJSONResponse)
+
+
+def precompiled(data: list[UserOut]) -> Response:
+    return _render(
+        envelope.success(status=status.HTTP_200_OK, data=data),
+        response_class=rendered,
+        status_code=status.HTTP_200_OK,
+    )
+
+
+def measure(func: Callable[[list[UserOut]], Response], data: list[UserOut]) -> float:
+    iterations = max(ITERATIONS // len(data), 20)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        func(data)
+    return (time.perf_counter_ns() - start) / iterations / 1_000
+
+
+def main() -> None:
+    now = datetime.now(configs.TZINFO)
+    print("per response")
+    for size in SIZES:
+        data = [
+            UserOut(
+                id=id,
+                created_at=now,
+                updated_at=now,
+                name=f"user-{id}",
+                email=f"user-{id}@zerohertz.xyz",
+                role=Role.USER,
+            )
+            for id in range(size)
+        ]
+        old, new = json.loads(legacy(data).body), json.loads(precompiled(data).body)
+        del old["timestamp"], new["timestamp"]
+        assert old == new
+        print(
+            f"size={size:>5}: legacy={measure(legacy, data):10.1f}us  "
+            f"precompiled={measure(precompiled, data):10.1f}us  "
+            f"bytes={len(precompiled(data).body)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Jmy company search: in-process ``SearchIndex`` vs. a ``LIKE '%...%'`` scan over 100k synthetic companies (stdlib ``sqlite3``, in-memory).
+
+    make bench target=search
+"""
+
+import random
+import sqlite3
+import time
+
+from app.utils.search import SearchIndex
+
+COMPANIES = 100_000
+ITERATIONS = 200
+SYLLABLES = tuple(
+    f"{onset}{vowel}{coda}"
+    for onset in ("b", "d", "g", "k", "l", "m", "n", "p", "r", "s", "t", "v", "z")
+    for vowel in ("a", "e", "i", "o", "u")
+    for coda in ("", "n", "l", "x")
+)
+WORDS = ("Systems", "Labs", "Robotics", "Bio", "Networks", "Solutions", "AI")
+CITIES = ("서울특별시", "부산광역시", "대전광역시", "경기도 성남시", "인천광역시")
+FIELDS = ("AI", "반도체", "바이오", "정보처리", "기계", "소프트웨어")
+
+
+def get_companies(rng: random.Random) -> list[tuple[int, str, str, str]]:
+    return [
+        (
+            id,
+            "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+            + f" {rng.choice(WORDS)}",
+            f"{rng.choice(CITIES)} {rng.randint(1, 999)}번길",
+            rng.choice(FIELDS),
+        )
+        for id in range(1, COMPANIES + 1)
+    ]
+
+
+def measure(func, queries: list[str]) -> float:
+    start = time.perf_counter_ns()
+    for query in queries:
+        func(query)
+    return (time.perf_counter_ns() - start) / len(queries) / 1_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    companies = get_companies(rng)
+    queries = [
+        rng.choice(companies)[1].split()[0][: rng.randint(4, 8)]
+        for _ in range(ITERATIONS)
+    ]
+
+    start = time.perf_counter()
+    index = SearchIndex(weights={"name": 1.0, "research": 0.8, "address": 0.6})
+    index.extend(
+        (id, {"name": name, "address": address, "research": research})
+        for id, name, address, research in companies
+    )
+    build = time.perf_counter() - start
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE jmy_company (id INTEGER PRIMARY KEY, name TEXT, address TEXT, research TEXT)"
+    )
+    connection.executemany("INSERT INTO jmy_company VALUES (?, ?, ?, ?)", companies)
+
+    def like(query: str) -> list:
+        # NOTE: 순위를 매기려면 일치하는 row를 모두 읽어야 하므로 LIMIT 없이 scan
+        pattern = f"%{query}%"
+        return connection.execute(
+            "SELECT id FROM jmy_company WHERE name LIKE ? OR address LIKE ? OR research LIKE ?",
+            (pattern, pattern, pattern),
+        ).fetchall()
+
+    print(f"\n[{COMPANIES} companies] index build={build:.2f}s")
+    print(f"search: index={measure(index.search, queries):10.1f}us/query")
+    print(f"search: like ={measure(like, queries):10.1f}us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Repository statements: ``select()`` built per call (previous behaviour) vs. cached ``bindparam`` templates.
+
+``build``: statement construction + cache key generation (what SQLAlchemy does before the compiled cache lookup).
+``execute``: the repository call on the configured ``DATABASE_URI`` within one session.
+
+    make bench target=statements
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+from sqlalchemy import Select, select
+
+from app.core.configs import configs
+from app.core.database import database
+from app.models.auth import OAuth
+from app.models.enums import OAuthProvider, Role
+from app.models.jmy import JmyCompany
+from app.models.users import User
+from app.repositories.auth import AuthRepository
+from app.repositories.base import Loads
+from app.repositories.jmy import JmyRepository
+from app.repositories.users import UserRepository
+
+BUILDS = 20_000
+EXECUTIONS = 2_000
+
+
+def measure_build(func: Callable[[], Select]) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(BUILDS):
+        func()._generate_cache_key()
+    return (time.perf_counter_ns() - start) / BUILDS / 1_000
+
+
+async def measure_execute(func: Callable[[], Awaitable[Any]]) -> float:
+    await func()
+    start = time.perf_counter_ns()
+    for _ in range(EXECUTIONS):
+        await func()
+    return (time.perf_counter_ns() - start) / EXECUTIONS / 1_000
+
+
+async def execute(stmt: Select) -> Any:
+    result = await database.scoped_session().execute(stmt)
+    return result.unique().scalar_one_or_none()
+
+
+async def compare(
+    name: str,
+    fresh: Callable[[], Select],
+    template: Callable[[], Select],
+    call: Callable[[], Awaitable[Any]],
+) -> None:
+    # NOTE: 이전 방식의 실행은 같은 statement를 매번 새로 만들어 실행
+    previous = await measure_execute(lambda: execute(fresh()))
+    current = await measure_execute(call)
+    print(
+        f"{name:>17}: build fresh={measure_build(fresh):6.1f}us template={measure_build(template):6.1f}us"
+        f"  execute fresh={previous:7.1f}us template={current:7.1f}us"
+    )
+
+
+async def seed() -> tuple[User, JmyCompany]:
+    session = database.scoped_session()
+    async with session.begin():
+        user = User(
+            name="bench-statements",
+            email="bench-statements@zerohertz.xyz",
+            role=Role.USER,
+            oauth=[OAuth(provider=OAuthProvider.GITHUB, oauth_id="bench-statements")],
+        )
+        company = JmyCompany(
+            name="bench-statements",
+            year=2020,
+            location="서울지방병무청",
+            address="서울특별시",
+            type_="정보처리",
+            size="중소기업",
+            research="",
+        )
+        session.add_all([user, company])
+    return user, company
+
+
+async def main() -> None:
+    logger.remove()
+    await database.create_all()
+    context = database.context.set()
+    user_repository = UserRepository()
+    auth_repository = AuthRepository()
+    jmy_repository = JmyRepository()
+    try:
+        user, company = await seed()
+        loads: Loads = {"oauth": "selectin"}
+        # NOTE: (previous build, template lookup, repository call); template은 execute 측정 중 생성된 것을 조회
+        cases: dict[str, tuple[Callable[[], Select], Callable[[], Select], Any]] = {
+            "read_by_id": (
+                lambda: select(User).where(User.id == user.id),
+                user_repository._by_id,
+                lambda: user_repository.read_by_id(id=user.id),
+            ),
+            "read_by_id+loads": (
+                lambda: user_repository._load(select(User), loads).where(
+                    User.id == user.id
+                ),
+                lambda: user_repository._by_id(loads),
+                lambda: user_repository.read_by_id(id=user.id, loads=loads),
+            ),
+            "read_by_email": (
+                lambda: select(User).where(User.email == user.email),
+                lambda: user_repository._template("by_email", select),
+                lambda: user_repository.read_by_email(email=user.email),
+            ),
+            "read_by_oauth_id": (
+                lambda: select(OAuth).where(
+                    OAuth.oauth_id == "bench-statements",
+                    OAuth.provider == OAuthProvider.GITHUB,
+                ),
+                lambda: auth_repository._template("by_oauth_id_and_provider", select),
+                lambda: auth_repository.read_by_oauth_id_and_provider(
+                    oauth_id="bench-statements", provider=OAuthProvider.GITHUB
+                ),
+            ),
+            "read_by_name": (
+                lambda: select(JmyCompany).where(JmyCompany.name == company.name),
+                lambda: jmy_repository._template("by_name", select),
+                lambda: jmy_repository.read_by_name(name=company.name),
+            ),
+        }
+        print(f"[{configs.DB_TYPE}] per call")
+        for name, (fresh, template, call) in cases.items():
+            await compare(name, fresh, template, call)
+    finally:
+        database.context.reset(context)
+        await database.dispose()
+    print(
+        f"compiled cache: hits={database.compiled_cache.hits} misses={database.compiled_cache.misses}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())